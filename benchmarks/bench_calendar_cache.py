@@ -0,0 +1,35 @@
+"""
+Micro-benchmark of the per-call overhead removed by caching MarketCalendar and core.Calendar instances
+
+    python benchmarks/bench_calendar_cache.py
+"""
+import timeit
+from market_calendars import MarketCalendar, get_calendar
+from market_calendars.core import Calendar, Date
+
+
+def report(label, stmt, number=200000):
+    per_call = min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+    print('{0:<45s}{1:8.3f} us'.format(label, per_call))
+    return per_call
+
+
+def main():
+    cal = get_calendar('China.SSE')
+    ref_date = Date(2018, 2, 14)
+
+    fresh = report('MarketCalendar factory (uncached)', lambda: MarketCalendar._regmeta_instance_factory('China.SSE'))
+    cached = report('get_calendar (cached)', lambda: get_calendar('China.SSE'))
+    print('{0:<45s}{1:8.3f} us'.format('  saved per call', fresh - cached))
+
+    fresh = report('core Calendar construction (uncached)', lambda: Calendar('China.SSE'))
+    cached = report('core_calendar property (cached)', lambda: cal.core_calendar)
+    print('{0:<45s}{1:8.3f} us'.format('  saved per call', fresh - cached))
+
+    fresh = report('is_biz_day through a fresh Calendar', lambda: Calendar('China.SSE').is_biz_day(ref_date))
+    cached = report('is_biz_day through core_calendar', lambda: cal.core_calendar.is_biz_day(ref_date))
+    print('{0:<45s}{1:8.3f} us'.format('  saved per call', fresh - cached))
+
+
+if __name__ == '__main__':
+    main()
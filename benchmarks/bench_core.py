@@ -0,0 +1,146 @@
+"""
+Benchmarks of the hot paths of the Cython core: Date, Period, Calendar and Schedule
+
+Run standalone and write the timings as JSON:
+
+    python benchmarks/bench_core.py --output core.json
+    python benchmarks/bench_core.py --filter adjust_date --output adjust.json
+
+or under pytest-benchmark, which has its own JSON output and comparison tools:
+
+    python -m pytest benchmarks/bench_core.py --benchmark-json core.json
+"""
+import argparse
+import datetime
+import json
+import pickle
+import platform
+import sys
+import timeit
+import numpy as np
+import market_calendars
+from market_calendars.core import (Date, Period, Calendar, Schedule, schedule_batch, check_date, TimeUnits,
+                                   BizDayConventions)
+
+HOLIDAY_CENTRES = ['China.SSE', 'China.IB', 'China.CFFEX', 'Target', 'NYSE', 'Null']
+
+PERIODS = {TimeUnits.BDays: Period(length=5, units=TimeUnits.BDays),
+           TimeUnits.Days: Period(length=5, units=TimeUnits.Days),
+           TimeUnits.Weeks: Period(length=2, units=TimeUnits.Weeks),
+           TimeUnits.Months: Period(length=3, units=TimeUnits.Months),
+           TimeUnits.Years: Period(length=1, units=TimeUnits.Years)}
+
+
+def date_cases():
+    ref_date = Date(2018, 2, 14)
+    serial = ref_date.serial_number
+    inputs = {'Date': ref_date,
+              'str': '2018-02-14',
+              'str_compact': '20180214',
+              'datetime': datetime.datetime(2018, 2, 14),
+              'date': datetime.date(2018, 2, 14),
+              'datetime64': np.datetime64('2018-02-14')}
+
+    yield 'Date.from_ymd', lambda: Date(2018, 2, 14)
+    yield 'Date.from_serial', lambda: Date(serial_number=serial)
+    yield 'Date.__add__[int]', lambda: ref_date + 1
+    yield 'Date.__add__[Period]', lambda: ref_date + PERIODS[TimeUnits.Months]
+    yield 'Period.from_str', lambda: Period('3m')
+    for label, value in inputs.items():
+        yield 'check_date[{0}]'.format(label), lambda value=value: check_date(value)
+
+
+def calendar_cases(hol_center):
+    cal = Calendar(hol_center)
+    ref_date = Date(2018, 2, 14)
+    start = Date(2010, 1, 1)
+    end = Date(2019, 12, 31)
+
+    yield 'Calendar.is_biz_day', lambda: cal.is_biz_day(ref_date)
+    for convention in BizDayConventions:
+        yield 'Calendar.adjust_date[{0}]'.format(convention.name), \
+            lambda convention=convention: cal.adjust_date(ref_date, convention)
+    yield 'Calendar.is_end_of_month', lambda: cal.is_end_of_month(ref_date)
+    yield 'Calendar.end_of_month', lambda: cal.end_of_month(ref_date)
+    for units, period in PERIODS.items():
+        yield 'Calendar.advance_date[{0}]'.format(units.name), \
+            lambda period=period: cal.advance_date(ref_date, period, BizDayConventions.ModifiedFollowing)
+    yield 'Calendar.biz_days_between[10y]', lambda: cal.biz_days_between(start, end)
+    yield 'Calendar.holiday_dates_list[10y]', lambda: cal.holiday_dates_list(start, end)
+    yield 'Calendar.biz_dates_list[10y]', lambda: cal.biz_dates_list(start, end)
+    yield 'Schedule[10y,1m]', lambda: Schedule(start, end, PERIODS[TimeUnits.Months], cal,
+                                               BizDayConventions.ModifiedFollowing)
+    pickled = pickle.dumps(Schedule(start, end, PERIODS[TimeUnits.Months], cal, BizDayConventions.ModifiedFollowing))
+    yield 'pickle.loads[Schedule[10y,1m]]', lambda: pickle.loads(pickled)
+    effective = np.arange(start.serial_number, start.serial_number + 1000)
+    yield 'schedule_batch[1000x5y,6m]', lambda: schedule_batch(effective, effective + 1826, '6m', cal,
+                                                               BizDayConventions.ModifiedFollowing)
+
+
+def cases():
+    for name, func in date_cases():
+        yield name, func
+    for hol_center in HOLIDAY_CENTRES:
+        for name, func in calendar_cases(hol_center):
+            yield '{0}[{1}]'.format(name, hol_center), func
+
+
+def time_case(func, repeat):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    per_call = np.array(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+    return {'number': number,
+            'repeat': repeat,
+            'min_us': float(per_call.min()),
+            'mean_us': float(per_call.mean()),
+            'stddev_us': float(per_call.std())}
+
+
+def run(pattern=None, repeat=5):
+    results = []
+    for name, func in cases():
+        if pattern and pattern not in name:
+            continue
+        stats = time_case(func, repeat)
+        stats['name'] = name
+        results.append(stats)
+        print('{0:<60s}{1:12.3f} us'.format(name, stats['min_us']), file=sys.stderr)
+
+    return {'machine': {'python': platform.python_version(),
+                        'implementation': platform.python_implementation(),
+                        'platform': platform.platform(),
+                        'processor': platform.processor()},
+            'version': market_calendars.__version__,
+            'datetime': datetime.datetime.now().isoformat(),
+            'benchmarks': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', help='file to write the JSON results to (default: stdout)')
+    parser.add_argument('--filter', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--repeat', type=int, default=5, help='timing repeats per benchmark')
+    args = parser.parse_args(argv)
+
+    report = json.dumps(run(args.filter, args.repeat), indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+    else:
+        print(report)
+
+
+# pytest-benchmark entry point
+
+def pytest_generate_tests(metafunc):
+    if 'case' in metafunc.fixturenames:
+        all_cases = list(cases())
+        metafunc.parametrize('case', [func for _, func in all_cases], ids=[name for name, _ in all_cases])
+
+
+def test_core(benchmark, case):
+    benchmark(case)
+
+
+if __name__ == '__main__':
+    main()
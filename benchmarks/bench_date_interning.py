@@ -0,0 +1,43 @@
+"""
+Allocations and peak RSS of a 100-year biz_days call returning core.Date objects, with and without Date interning
+
+    python benchmarks/bench_date_interning.py
+"""
+import resource
+import subprocess
+import sys
+import tracemalloc
+from market_calendars import get_calendar
+from market_calendars.core import set_date_interning
+
+
+def measure(interning):
+    cal = get_calendar('China.SSE')
+    set_date_interning(interning)
+    # the first call populates the interned table, the second is the steady state
+    for call in ('first', 'second'):
+        tracemalloc.start()
+        dates = cal.biz_days('1950-01-01', '2049-12-31', output_format='date')
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        blocks = sum(stat.count for stat in snapshot.statistics('filename'))
+        print('interning={0:<5} {1:<6s} call: {2:6d} dates, {3:7d} live blocks, {4:8.1f} KiB traced peak'
+              .format(str(interning), call, len(dates), blocks, peak / 1024.))
+        del dates
+    # ru_maxrss is in KiB on Linux
+    print('interning={0:<5} peak RSS: {1:.1f} MiB'.format(str(interning),
+                                                         resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.))
+
+
+def main():
+    if len(sys.argv) > 1:
+        measure(sys.argv[1] == 'on')
+        return
+    # one process per mode so that peak RSS is not shared
+    for mode in ('off', 'on'):
+        subprocess.check_call([sys.executable, __file__, mode])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Cold-start cost per holiday centre: `python -X importtime` of market_calendars plus the first use of the centre,
+each measured in a fresh interpreter
+
+    python benchmarks/bench_import_time.py --output import.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+HOLIDAY_CENTRES = ['Null', 'China.SSE', 'China.IB', 'China.CFFEX', 'Target', 'NYSE']
+
+SCRIPT = '''
+import time
+import sys
+import market_calendars
+from market_calendars.core import Calendar, Date
+start = time.perf_counter()
+Calendar({0!r}).is_biz_day(Date(2018, 1, 2))
+print((time.perf_counter() - start) * 1e6)
+print(','.join(sorted(m for m in ('numpy', 'pytz', 'dateutil', 'six', 'pandas') if m in sys.modules)))
+'''
+
+
+def cold_start(hol_center):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                        env.get('PYTHONPATH', '')])
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', SCRIPT.format(hol_center)],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, env=env,
+                          check=True)
+    imports = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative_us, name = [f.strip() for f in line[len('import time:'):].split('|')]
+            if cumulative_us.isdigit():
+                imports[name] = int(cumulative_us)
+    first_use_us, loaded = proc.stdout.split('\n')[:2]
+    return {'import_us': imports['market_calendars'],
+            'numpy_import_us': imports.get('numpy', 0),
+            'first_use_us': float(first_use_us),
+            'loaded_modules': loaded.split(',') if loaded else []}
+
+
+def run(repeat=5):
+    results = []
+    for hol_center in HOLIDAY_CENTRES:
+        runs = [cold_start(hol_center) for _ in range(repeat)]
+        best = {'name': hol_center,
+                'repeat': repeat,
+                'import_us': min(r['import_us'] for r in runs),
+                'numpy_import_us': min(r['numpy_import_us'] for r in runs),
+                'first_use_us': min(r['first_use_us'] for r in runs),
+                'loaded_modules': runs[0]['loaded_modules']}
+        results.append(best)
+        print('{0:<12s} import {1:9.1f} ms (numpy {2:6.1f} ms)  first use {3:8.1f} ms  loaded: {4}'
+              .format(hol_center, best['import_us'] / 1e3, best['numpy_import_us'] / 1e3, best['first_use_us'] / 1e3,
+                      ', '.join(best['loaded_modules']) or '-'), file=sys.stderr)
+    return {'python': sys.version.split()[0], 'benchmarks': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', help='file to write the JSON results to (default: stdout)')
+    parser.add_argument('--repeat', type=int, default=5, help='fresh interpreters per centre')
+    args = parser.parse_args(argv)
+
+    report = json.dumps(run(args.repeat), indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Thread scaling of the batch calendar functions, which release the GIL and split large inputs over
+core.set_num_threads threads
+
+    python benchmarks/bench_parallel.py --output parallel.json
+    python benchmarks/bench_parallel.py --size 100000000 --threads 1 2 4 8 16
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+import numpy as np
+from market_calendars.core import Calendar, Date, BizDayConventions, set_num_threads, get_num_threads
+
+HOLIDAY_CENTRES = ['China.SSE', 'NYSE']
+
+
+def cases(hol_center, serials):
+    cal = Calendar(hol_center)
+    yield 'is_biz_day_batch', lambda: cal.is_biz_day_batch(serials)
+    yield 'adjust_date_batch[ModifiedFollowing]', \
+        lambda: cal.adjust_date_batch(serials, BizDayConventions.ModifiedFollowing)
+    yield 'advance_date_batch[3m]', lambda: cal.advance_date_batch(serials, '3m', BizDayConventions.ModifiedFollowing)
+    yield 'advance_date_batch[10b]', lambda: cal.advance_date_batch(serials, '10b')
+
+
+def run(size, threads, repeat=3):
+    serials = np.random.RandomState(0).randint(Date(2000, 1, 1).serial_number, Date(2100, 1, 1).serial_number,
+                                               size=size).astype(np.intc)
+    results = []
+    previous = get_num_threads()
+    try:
+        for hol_center in HOLIDAY_CENTRES:
+            for name, func in cases(hol_center, serials):
+                name = '{0}[{1}]'.format(name, hol_center)
+                timings = {}
+                for n in threads:
+                    set_num_threads(n)
+                    timings[n] = min(timeit.Timer(func).repeat(repeat=repeat, number=1))
+                results.append({'name': name,
+                                'size': size,
+                                'seconds': {str(n): t for n, t in timings.items()},
+                                'speedup': {str(n): timings[threads[0]] / t for n, t in timings.items()}})
+                print('{0:<60s}'.format(name) + ''.join('{0:>4d}: {1:8.1f} ms ({2:4.1f}x)'.format(
+                    n, t * 1e3, timings[threads[0]] / t) for n, t in timings.items()), file=sys.stderr)
+    finally:
+        set_num_threads(previous)
+    return {'cpu_count': os.cpu_count(), 'benchmarks': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', help='file to write the JSON results to (default: stdout)')
+    parser.add_argument('--size', type=int, default=10 ** 7, help='number of dates per call')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8], help='thread counts to time')
+    parser.add_argument('--repeat', type=int, default=3, help='timing repeats per thread count')
+    args = parser.parse_args(argv)
+
+    report = json.dumps(run(args.size, args.threads, args.repeat), indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,21 @@
-from .market_calendar import MarketCalendar
+from .market_calendar import (MarketCalendar,
+                              enable_query_cache,
+                              disable_query_cache,
+                              query_cache_info)
 from .calendar_registry import (get_calendar,
-                                get_calendar_names)
+                                get_calendar_names,
+                                register_calendar,
+                                unregister_calendar,
+                                clear_calendar_cache)
 
 __version__ = '0.1.4'
 
 __all__ = ['MarketCalendar',
            'get_calendar',
-           'get_calendar_names']
+           'get_calendar_names',
+           'register_calendar',
+           'unregister_calendar',
+           'clear_calendar_cache',
+           'enable_query_cache',
+           'disable_query_cache',
+           'query_cache_info']
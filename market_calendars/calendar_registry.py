@@ -1,14 +1,22 @@
+import threading
+import six
 from .exchange_china_sse import ChinaSSECalendar
 from .exchange_nyse import NYSEExchangeCalendar
 from .exchange_null import NullCalendar
-from .market_calendar import MarketCalendar
+from .market_calendar import (MarketCalendar, clear_calendar_cache, cached_core_calendar, cached_timezone,
+                              discard_cached_calendar)
+from .core import register_holiday_center, unregister_holiday_center, holiday_centers
+
+# classes created by register_calendar, by name
+_registered = {}
+_registry_lock = threading.Lock()
 
 
 def get_calendar(name):
     """
     Retrieves an instance of an MarketCalendar whose name is given.
     :param name: The name of the MarketCalendar to be retrieved.
-    :return: MarketCalendar of the desired calendar.
+    :return: MarketCalendar of the desired calendar, cached per process.
     """
     return MarketCalendar.factory(name)
 
@@ -18,3 +26,62 @@ def get_calendar_names():
         :return: list(str)
         """
     return MarketCalendar.calendar_names()
+
+
+def register_calendar(name, hol_centers, join='intersection', holidays=(), biz_days=(), tz='UTC', sessions=()):
+    """
+    Register a MarketCalendar built from existing ones, e.g. open when both SSE and NYSE are open, with optional
+    extra closures. Its business days are compiled into one table, so it is as fast as a built-in calendar.
+    :param name: name of the new calendar, usable with get_calendar; registering it again replaces it, but the name
+        of a built-in calendar or alias, or of a holiday center, can not be taken, nor one that differs from another
+        calendar name only in case as holiday center names are case-insensitive
+    :param hol_centers: names of the base calendars or holiday centers, e.g. ['China.SSE', 'NYSE']
+    :param join: 'intersection' (open when all bases are open) or 'union' (open when any base is open)
+    :param holidays: extra dates on which the calendar is closed
+    :param biz_days: extra dates on which the calendar is open, e.g. working weekends
+    :param tz: time zone name of the calendar
+    :param sessions: local (open, close) times of the trading sessions, e.g. (('09:30', '16:00'),)
+    :return: MarketCalendar
+    """
+    if isinstance(hol_centers, six.string_types):
+        hol_centers = [hol_centers]
+    with _registry_lock:
+        names = set(get_calendar_names())
+        if name in MarketCalendar._regmeta_classes() and name not in _registered:
+            raise ValueError('{0} is a built-in calendar and can not be redefined'.format(name))
+        clashes = sorted(n for n in names if n.lower() == name.lower() and n != name)
+        if clashes:
+            raise ValueError('{0} differs from calendar {1} only in case'.format(name, clashes[0]))
+        if name not in _registered and name.lower() in holiday_centers():
+            raise ValueError('{0} is already a holiday center'.format(name))
+        bases = [get_calendar(c).core_calendar.name if c in names else c for c in hol_centers]
+        register_holiday_center(name, bases, join, holidays, biz_days)
+
+        if name in _registered:
+            _forget(name)
+        _registered[name] = type(str(name), (MarketCalendar,),
+                                 {'aliases': [name],
+                                  'sessions': tuple(sessions),
+                                  'name': property(lambda self: name),
+                                  'tz': property(lambda self: cached_timezone(tz)),
+                                  'core_calendar': property(lambda self: cached_core_calendar(name))})
+    return get_calendar(name)
+
+
+def unregister_calendar(name):
+    """
+    Remove a calendar added by register_calendar, together with its holiday center
+    :param name: name given to register_calendar
+    """
+    with _registry_lock:
+        if name not in _registered:
+            raise ValueError('{0} is not a calendar added by register_calendar'.format(name))
+        _forget(name)
+        del _registered[name]
+        unregister_holiday_center(name)
+
+
+def _forget(name):
+    calendar_class = _registered[name]
+    MarketCalendar._regmeta_unregister_class(name)
+    discard_cached_calendar(calendar_class, name)
@@ -38,6 +38,15 @@ def _regmeta_register_class(cls, regcls, name):
         cls._regmeta_class_registry[name] = regcls
 
 
+def _regmeta_unregister_class(cls, name):
+    """
+    :param cls(RegisteryMeta): registration base class
+    :param name(str): name or alias to be removed
+    :return: class that was registered under name
+    """
+    return cls._regmeta_class_registry.pop(name)
+
+
 def _regmeta_classes(cls):
     return list(cls._regmeta_class_registry.keys())
 
@@ -55,6 +64,7 @@ class RegisteryMeta(type):
             cls._regmeta_class_factory = classmethod(_regmeta_class_factory)
             cls._regmeta_instance_factory = classmethod(_regmeta_instance_factory)
             cls._regmeta_register_class = classmethod(_regmeta_register_class)
+            cls._regmeta_unregister_class = classmethod(_regmeta_unregister_class)
             cls._regmeta_classes = classmethod(_regmeta_classes)
 
         return cls
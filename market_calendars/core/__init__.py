@@ -1,20 +1,38 @@
 from .period import Period, check_period
-from .date import Date, check_date
-from .calendar import Calendar
-from .schedule import Schedule
+from .date import Date, check_date, to_serial_array, serials_to_datetime64, set_date_interning, is_date_interning
+from .date_array import DateArray
+from .calendar import (Calendar, compile_holiday_tables, load_holiday_tables, register_holiday_center,
+                       unregister_holiday_center, holiday_centers, set_num_threads, get_num_threads)
+from .schedule import Schedule, schedule_batch
+from .day_counter import DayCounter
 from .assert_utils import py_assert, py_ensure_raise
-from .enums import Months, Weekdays, TimeUnits, BizDayConventions, DateGeneration
+from .enums import Months, Weekdays, TimeUnits, BizDayConventions, DateGeneration, DayCounters
 
 __all__ = ['Period',
            'check_period',
            'Date',
            'check_date',
+           'to_serial_array',
+           'serials_to_datetime64',
+           'set_date_interning',
+           'is_date_interning',
+           'DateArray',
            'Calendar',
+           'compile_holiday_tables',
+           'load_holiday_tables',
+           'register_holiday_center',
+           'unregister_holiday_center',
+           'holiday_centers',
+           'set_num_threads',
+           'get_num_threads',
            'Schedule',
+           'schedule_batch',
+           'DayCounter',
            'py_assert',
            'py_ensure_raise',
            'Months',
            'Weekdays',
            'TimeUnits',
            'BizDayConventions',
-           'DateGeneration']
+           'DateGeneration',
+           'DayCounters']
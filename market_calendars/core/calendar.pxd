@@ -2,8 +2,29 @@ from .date cimport Date
 from .period cimport Period
 
 cdef class CalendarImpl(object):
+    cdef const unsigned char[::1] _bizBits
+    cdef const int[::1] _bizCounts
+    cdef const int[::1] _bizSerials
+    cdef const int[::1] _holSerials
+    cdef const int[::1] _nextBiz
+    cdef const int[::1] _prevBiz
+    cdef const int[::1] _monthEnd
+
     cdef bint isBizDay(self, Date date)
+    cdef bint isBizSerial(self, int serial) nogil
+    cdef bint isBizSerialByRule(self, int serial)
     cdef bint isWeekEnd(self, int weekDay)
+    cdef int nextBizSerial(self, int serial) nogil
+    cdef int prevBizSerial(self, int serial) nogil
+    cdef int adjustSerial(self, int serial, int c) nogil
+    cdef bint isEndOfMonthSerial(self, int serial) nogil
+    cdef int endOfMonthSerial(self, int serial) nogil
+    cdef int advanceSerial(self, int serial, int n, int units, int c, bint endOfMonth) nogil
+    cdef int compileBizBits(self) except -1
+    cdef int compileTables(self) except -1
+    cdef const int[::1] bizCounts(self)
+    cdef const int[::1] bizSerials(self)
+    cdef const int[::1] holSerials(self)
 
 cdef class Calendar(object):
     cdef public CalendarImpl _impl
@@ -15,7 +36,35 @@ cdef class Calendar(object):
     cpdef is_end_of_month(self, Date d)
     cpdef end_of_month(self, Date d)
     cpdef biz_days_between(self, Date from_date, Date to_date, bint include_first= *, bint include_last= *)
+    cpdef biz_day_of_year(self, Date d)
+    cpdef nth_biz_day_after(self, Date d, int n)
+    cpdef biz_day_schedule(self, Date start_date, Date end_date, int step, int c= *, int date_generation_rule= *)
     cpdef adjust_date(self, Date d, int c= *)
     cpdef advance_date(self, Date d, Period period, int c= *, bint end_of_month= *)
+    cpdef is_biz_day_batch(self, dates)
+    cpdef adjust_date_batch(self, dates, int c= *)
+    cpdef advance_date_batch(self, dates, period, int c= *, bint end_of_month= *)
     cpdef holiday_dates_list(self, Date from_date, Date to_date, bint include_weekends= *)
     cpdef biz_dates_list(self, Date from_date, Date to_date)
+    cpdef holiday_dates_array(self, Date from_date, Date to_date, bint include_weekends= *)
+    cpdef biz_dates_array(self, Date from_date, Date to_date)
+    cpdef holiday_serials(self, Date from_date, Date to_date, bint include_weekends= *)
+    cpdef biz_serials(self, Date from_date, Date to_date)
+
+
+# C API for Cython extensions, serial in / serial out and callable without the GIL:
+#
+#     from market_calendars.core.calendar cimport Calendar, CalendarImpl, calendar_adjust
+#     cdef CalendarImpl impl = Calendar('China.SSE')._impl
+#     with nogil:
+#         for i in prange(n):
+#             out[i] = calendar_adjust(impl, serials[i], BizDayConventions.ModifiedFollowing)
+#
+# serials or results outside the supported range give 0 (False for calendar_is_biz_day) and an unknown
+# convention gives -1
+cdef bint calendar_is_biz_day(CalendarImpl impl, int serial) nogil
+cdef int calendar_adjust(CalendarImpl impl, int serial, int c) nogil
+cdef int calendar_advance_bdays(CalendarImpl impl, int serial, int n) nogil
+cdef int calendar_advance(CalendarImpl impl, int serial, int n, int units, int c, bint endOfMonth) nogil
+cdef int calendar_biz_days_between(CalendarImpl impl, int fromSerial, int toSerial, bint includeFirst,
+                                   bint includeLast) nogil
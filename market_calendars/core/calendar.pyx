@@ -1,153 +1,221 @@
+import array
+import mmap
+import os
+import struct
+import threading
+import warnings
+import zlib
+from numbers import Integral
+import cython
+from cpython cimport array
 from .enums._time_units cimport TimeUnits
 from .enums._bizday_conventions cimport BizDayConventions
 from .enums._months cimport Months
 from .enums._weekdays cimport Weekdays
-from .date cimport Date
+from .enums._date_generation cimport DateGeneration
+from .date cimport Date, MIN_SERIAL, MAX_SERIAL, serial_from_ymd, serial_to_ymd, advance_serial
+from .date cimport to_serial_array, from_serial_array, date_from_serial, check_date
+from .date_array cimport date_array_from_serials
 from .period cimport Period
+from .period import check_period
+from .assert_utils cimport py_assert
+
+# operations of the batch kernels, see _BatchTask
+cdef enum:
+    _BATCH_IS_BIZ_DAY = 0
+    _BATCH_ADJUST = 1
+    _BATCH_ADVANCE = 2
+
+# smallest chunk worth handing to another thread
+cdef enum:
+    _MIN_CHUNK = 32768
+
+# months in [1901, 2199], the length of the month end tables
+cdef enum:
+    _MONTHS = 299 * 12
+
+# empty arrays cloned into the compiled tables
+cdef array.array _BYTE_TABLE = array.array('B')
+cdef array.array _INT_TABLE = array.array('i')
 
 cdef class Calendar(object):
     def __init__(self, str holCenter):
         holCenter = holCenter.lower()
         try:
-            self._impl = _holDict[holCenter]()
+            self._impl = _get_impl(holCenter)
         except KeyError:
             raise ValueError("{0} is not a valid description of a holiday center".format(holCenter))
         self.name = holCenter
 
     cpdef is_biz_day(self, Date d):
-        return self._impl.isBizDay(d)
+        return calendar_is_biz_day(self._impl, d.__serial_number__)
 
     cpdef is_holiday(self, Date d):
-        return not self._impl.isBizDay(d)
+        return not calendar_is_biz_day(self._impl, d.__serial_number__)
 
     cpdef is_weekend(self, int weekday):
         return self._impl.isWeekEnd(weekday)
 
     cpdef is_end_of_month(self, Date d):
-        return d.month() != self.adjust_date(d + 1).month()
+        return self._impl.isEndOfMonthSerial(d.__serial_number__)
 
     cpdef end_of_month(self, Date d):
-        return self.adjust_date(Date.end_of_month(d), BizDayConventions.Preceding)
+        return _checked_date(self._impl.endOfMonthSerial(d.__serial_number__), d)
 
     cpdef biz_days_between(self, Date from_date, Date to_date, bint include_first=True, bint include_last=False):
-        cdef int wd = 0
-        cdef Date d
-
-        if from_date != to_date:
-            if from_date < to_date:
-                d = from_date
-                while d < to_date:
-                    if self.is_biz_day(d):
-                        wd += 1
-                    d += 1
-                if self.is_biz_day(to_date):
-                    wd += 1
-            elif from_date > to_date:
-                d = to_date
-                while d < from_date:
-                    if self.is_biz_day(d):
-                        wd += 1
-                    d += 1
-                if self.is_biz_day(from_date):
-                    wd += 1
-            if self.is_biz_day(from_date) and not include_first:
-                wd -= 1
-            if self.is_biz_day(to_date) and not include_last:
-                wd -= 1
-        return wd
+        return calendar_biz_days_between(self._impl, from_date.__serial_number__, to_date.__serial_number__,
+                                         include_first, include_last)
 
-    cpdef adjust_date(self, Date d, int c=BizDayConventions.Following):
+    cpdef biz_day_of_year(self, Date d):
+        # ordinal of d among the business days of its year; for a holiday this is
+        # the number of business days of the year before d
+        cdef const int[::1] counts = self._impl.bizCounts()
+        cdef int s = d.__serial_number__
+        return _count_upto(counts, s) - _count_upto(counts, s - d.day_of_year())
 
-        cdef Date d1
-        cdef Date d2
+    cpdef nth_biz_day_after(self, Date d, int n):
+        # n-th business day strictly after d (strictly before d when n is negative)
+        cdef int s
 
-        if c == BizDayConventions.Unadjusted:
+        if n == 0:
             return d
-        d1 = d
+        s = calendar_advance_bdays(self._impl, d.__serial_number__, n)
+        if s == 0:
+            raise ValueError("{0:d} business days from {1} is out of bound. It must be in [1901, 2199]".format(n, d))
+        return date_from_serial(s)
 
-        if c == BizDayConventions.Following or c == BizDayConventions.ModifiedFollowing or \
-                c == BizDayConventions.HalfMonthModifiedFollowing:
-            while self.is_holiday(d1):
-                d1 += 1
-            if c == BizDayConventions.ModifiedFollowing or c == BizDayConventions.HalfMonthModifiedFollowing:
-                if d1.month() != d.month():
-                    return self.adjust_date(d, BizDayConventions.Preceding)
-                if c == BizDayConventions.HalfMonthModifiedFollowing:
-                    if d.day_of_month() <= 15 < d1.day_of_month():
-                        return self.adjust_date(d, BizDayConventions.Preceding)
-        elif c == BizDayConventions.Preceding or c == BizDayConventions.ModifiedPreceding:
-            while self.is_holiday(d1):
-                d1 -= 1
-            if c == BizDayConventions.ModifiedPreceding and d1.month() != d.month():
-                return self.adjust_date(d, BizDayConventions.Following)
-        elif c == BizDayConventions.Nearest:
-            d2 = d
-            while self.is_holiday(d1) and self.is_holiday(d2):
-                d1 += 1
-                d2 -= 1
+    cpdef biz_day_schedule(self,
+                           Date start_date,
+                           Date end_date,
+                           int step,
+                           int c=BizDayConventions.Following,
+                           int date_generation_rule=DateGeneration.Forward):
+        # every step-th business day between start_date and end_date, seeded from the adjusted
+        # start date (Forward) or end date (Backward)
+        cdef const int[::1] counts = self._impl.bizCounts()
+        cdef const int[::1] serials = self._impl.bizSerials()
+        cdef Date d
+        cdef int first
+        cdef int last
+        cdef int k
 
-            if self.is_holiday(d1):
-                return d2
-            else:
-                return d1
+        py_assert(step > 0, ValueError, "non positive business day step ({0:d}) not allowed".format(step))
+
+        if date_generation_rule == DateGeneration.Forward:
+            d = self.adjust_date(start_date, c)
+            if d > end_date:
+                return []
+            first = _count_upto(counts, d.__serial_number__) + step
+            last = _count_upto(counts, end_date.__serial_number__)
+            return [d] + [date_from_serial(serials[k]) for k in range(first, last + 1, step)]
+        elif date_generation_rule == DateGeneration.Backward:
+            d = self.adjust_date(end_date, c)
+            if d < start_date:
+                return []
+            first = _count_upto(counts, d.__serial_number__ - 1) - step + 1
+            last = _count_upto(counts, start_date.__serial_number__ - 1) + 1
+            return [date_from_serial(serials[k]) for k in range(first, last - 1, -step)][::-1] + [d]
         else:
-            raise ValueError("unknown business-day convention")
-        return d1
+            raise ValueError("unknown rule ({0:d})".format(date_generation_rule))
+
+    cpdef adjust_date(self, Date d, int c=BizDayConventions.Following):
+        if c == BizDayConventions.Unadjusted:
+            return d
+        return _checked_date(calendar_adjust(self._impl, d.__serial_number__, c), d)
 
     cpdef advance_date(self, Date d, Period period, int c=BizDayConventions.Following, bint end_of_month=False):
+        if period.length() == 0:
+            return self.adjust_date(d, c)
+        return _checked_date(calendar_advance(self._impl,
+                                              d.__serial_number__,
+                                              period.length(),
+                                              period.units(),
+                                              c,
+                                              end_of_month), d)
 
-        cdef int n
-        cdef int units
-        cdef Date d1
+    cpdef is_biz_day_batch(self, dates):
+        cdef int[::1] serials = to_serial_array(dates)
+        import numpy as np
+        result = np.empty(serials.shape[0], dtype=np.uint8)
 
-        n = period.length()
-        units = period.units()
+        _run_batch(_batch_task(self._impl, _BATCH_IS_BIZ_DAY, serials, result))
+        return result.view(np.bool_).reshape(np.shape(dates))
 
-        if n == 0:
-            return self.adjust_date(d, c)
-        elif units == TimeUnits.BDays:
-            d1 = d
-            if n > 0:
-                while n > 0:
-                    d1 += 1
-                    while self.is_holiday(d1):
-                        d1 += 1
-                    n -= 1
-            else:
-                while n < 0:
-                    d1 -= 1
-                    while self.is_holiday(d1):
-                        d1 -= 1
-                    n += 1
-            return d1
-        elif units == TimeUnits.Days or units == TimeUnits.Weeks:
-            d1 = d + period
-            return self.adjust_date(d1, c)
-        else:
-            d1 = d + period
-            if end_of_month and self.is_end_of_month(d):
-                return self.end_of_month(d1)
-            return self.adjust_date(d1, c)
+    cpdef adjust_date_batch(self, dates, int c=BizDayConventions.Following):
+        cdef int[::1] serials = to_serial_array(dates)
+        cdef _BatchTask task
+        import numpy as np
+        result = np.empty(serials.shape[0], dtype=np.intc)
 
-    cpdef holiday_dates_list(self, Date from_date, Date to_date, bint include_weekends=True):
-        cdef list result = []
-        cdef Date d = from_date
+        task = _batch_task(self._impl, _BATCH_ADJUST, serials, result)
+        task.c = c
+        _run_batch(task)
+        _check_batch(result, serials)
+        return from_serial_array(result, dates)
+
+    cpdef advance_date_batch(self, dates, period, int c=BizDayConventions.Following, bint end_of_month=False):
+        cdef int[::1] serials = to_serial_array(dates)
+        cdef Period p = check_period(period)
+        cdef _BatchTask task
+        import numpy as np
+        result = np.empty(serials.shape[0], dtype=np.intc)
+
+        if p.length() == 0:
+            return self.adjust_date_batch(dates, c)
+        task = _batch_task(self._impl, _BATCH_ADVANCE, serials, result)
+        task.n = p.length()
+        task.units = p.units()
+        task.c = c
+        task.endOfMonth = end_of_month
+        _run_batch(task)
+        _check_batch(result, serials)
+        return from_serial_array(result, dates)
 
-        while d <= to_date:
-            if self.is_holiday(d) and (include_weekends or not self.is_weekend(d.weekday())):
-                result.append(d)
-            d += 1
-        return result
+    cpdef holiday_dates_list(self, Date from_date, Date to_date, bint include_weekends=True):
+        return [date_from_serial(s) for s in self.holiday_serials(from_date, to_date, include_weekends).tolist()]
 
     cpdef biz_dates_list(self, Date from_date, Date to_date):
-        cdef list result = []
-        cdef Date d = from_date
+        return [date_from_serial(s) for s in self.biz_serials(from_date, to_date).tolist()]
+
+    cpdef holiday_dates_array(self, Date from_date, Date to_date, bint include_weekends=True):
+        return date_array_from_serials(self.holiday_serials(from_date, to_date, include_weekends), True)
+
+    cpdef biz_dates_array(self, Date from_date, Date to_date):
+        return date_array_from_serials(self.biz_serials(from_date, to_date), True)
+
+    cpdef holiday_serials(self, Date from_date, Date to_date, bint include_weekends=True):
+        cdef int lo = max(from_date.__serial_number__, MIN_SERIAL)
+        cdef int hi = min(to_date.__serial_number__, MAX_SERIAL)
+        cdef const int[::1] holidays
+        import numpy as np
+
+        if lo > hi:
+            return np.empty(0, dtype=np.intc)
+        if include_weekends:
+            return (np.flatnonzero(~_biz_mask(self._impl, lo, hi)) + lo).astype(np.intc)
+        holidays = self._impl.holSerials()
+        return np.array(holidays[_bisect_left(holidays, lo):_bisect_left(holidays, hi + 1)])
+
+    cpdef biz_serials(self, Date from_date, Date to_date):
+        # the bitmap already is the complement of the weekend and holiday masks
+        # (net of working weekends), so business days unpack from it directly
+        cdef int lo = max(from_date.__serial_number__, MIN_SERIAL)
+        cdef int hi = min(to_date.__serial_number__, MAX_SERIAL)
+        import numpy as np
 
-        while d <= to_date:
-            if self.is_biz_day(d):
-                result.append(d)
-            d += 1
-        return result
+        if lo > hi:
+            return np.empty(0, dtype=np.intc)
+        return (np.flatnonzero(_biz_mask(self._impl, lo, hi)) + lo).astype(np.intc)
+
+    def iter_biz_days(self, Date from_date, Date to_date, bint backward=False, chunk_size=None):
+        # lazy counterpart of biz_dates_list: Date objects, or int serial arrays of chunk_size days, walked
+        # window by window so that memory does not grow with the range
+        return _iter_serials(self, from_date, to_date, True, True, backward, _check_chunk_size(chunk_size))
+
+    def iter_holidays(self, Date from_date, Date to_date, bint include_weekends=True, bint backward=False,
+                      chunk_size=None):
+        return _iter_serials(self, from_date, to_date, False, include_weekends, backward,
+                             _check_chunk_size(chunk_size))
 
     def __richcmp__(self, right, int op):
         if op == 2:
@@ -165,745 +233,992 @@ cdef class Calendar(object):
         pass
 
 cdef class CalendarImpl(object):
+    def __cinit__(self):
+        self._bizBits = None
+        self._bizCounts = None
+        self._bizSerials = None
+        self._holSerials = None
+        self._nextBiz = None
+        self._prevBiz = None
+        self._monthEnd = None
+
     cdef bint isBizDay(self, Date date):
+        return self.isBizSerial(date.__serial_number__)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef bint isBizSerial(self, int serial) nogil:
+        if serial < MIN_SERIAL or serial > MAX_SERIAL:
+            return False
+        return (self._bizBits[serial >> 3] >> (serial & 7)) & 1
+
+    cdef bint isBizSerialByRule(self, int serial):
         pass
 
     cdef bint isWeekEnd(self, int weekDay):
         pass
 
-cdef set sse_holDays = {Date(2005, 1, 3),
-                        Date(2005, 2, 7),
-                        Date(2005, 2, 8),
-                        Date(2005, 2, 9),
-                        Date(2005, 2, 10),
-                        Date(2005, 2, 11),
-                        Date(2005, 2, 14),
-                        Date(2005, 2, 15),
-                        Date(2005, 4, 4),
-                        Date(2005, 5, 2),
-                        Date(2005, 5, 3),
-                        Date(2005, 5, 4),
-                        Date(2005, 5, 5),
-                        Date(2005, 5, 6),
-                        Date(2005, 6, 9),
-                        Date(2005, 9, 15),
-                        Date(2005, 10, 3),
-                        Date(2005, 10, 4),
-                        Date(2005, 10, 5),
-                        Date(2005, 10, 6),
-                        Date(2005, 10, 7),
-                        Date(2006, 1, 2),
-                        Date(2006, 1, 3),
-                        Date(2006, 1, 26),
-                        Date(2006, 1, 27),
-                        Date(2006, 1, 30),
-                        Date(2006, 1, 31),
-                        Date(2006, 2, 1),
-                        Date(2006, 2, 2),
-                        Date(2006, 2, 3),
-                        Date(2006, 4, 4),
-                        Date(2006, 5, 1),
-                        Date(2006, 5, 2),
-                        Date(2006, 5, 3),
-                        Date(2006, 5, 4),
-                        Date(2006, 5, 5),
-                        Date(2006, 6, 9),
-                        Date(2006, 9, 15),
-                        Date(2006, 10, 2),
-                        Date(2006, 10, 3),
-                        Date(2006, 10, 4),
-                        Date(2006, 10, 5),
-                        Date(2006, 10, 6),
-                        Date(2007, 1, 1),
-                        Date(2007, 1, 2),
-                        Date(2007, 1, 3),
-                        Date(2007, 2, 19),
-                        Date(2007, 2, 20),
-                        Date(2007, 2, 21),
-                        Date(2007, 2, 22),
-                        Date(2007, 2, 23),
-                        Date(2007, 4, 4),
-                        Date(2007, 5, 1),
-                        Date(2007, 5, 2),
-                        Date(2007, 5, 3),
-                        Date(2007, 5, 4),
-                        Date(2007, 5, 7),
-                        Date(2007, 10, 1),
-                        Date(2007, 10, 2),
-                        Date(2007, 10, 3),
-                        Date(2007, 10, 4),
-                        Date(2007, 10, 5),
-                        Date(2007, 12, 31),
-                        Date(2008, 1, 1),
-                        Date(2008, 2, 6),
-                        Date(2008, 2, 7),
-                        Date(2008, 2, 8),
-                        Date(2008, 2, 11),
-                        Date(2008, 2, 12),
-                        Date(2008, 4, 4),
-                        Date(2008, 5, 1),
-                        Date(2008, 5, 2),
-                        Date(2008, 6, 9),
-                        Date(2008, 9, 15),
-                        Date(2008, 9, 29),
-                        Date(2008, 9, 30),
-                        Date(2008, 10, 1),
-                        Date(2008, 10, 2),
-                        Date(2008, 10, 3),
-                        Date(2009, 1, 1),
-                        Date(2009, 1, 2),
-                        Date(2009, 1, 26),
-                        Date(2009, 1, 27),
-                        Date(2009, 1, 28),
-                        Date(2009, 1, 29),
-                        Date(2009, 1, 30),
-                        Date(2009, 4, 6),
-                        Date(2009, 5, 1),
-                        Date(2009, 5, 28),
-                        Date(2009, 5, 29),
-                        Date(2009, 10, 1),
-                        Date(2009, 10, 2),
-                        Date(2009, 10, 5),
-                        Date(2009, 10, 6),
-                        Date(2009, 10, 7),
-                        Date(2009, 10, 8),
-                        Date(2010, 1, 1),
-                        Date(2010, 2, 15),
-                        Date(2010, 2, 16),
-                        Date(2010, 2, 17),
-                        Date(2010, 2, 18),
-                        Date(2010, 2, 19),
-                        Date(2010, 4, 5),
-                        Date(2010, 5, 3),
-                        Date(2010, 6, 14),
-                        Date(2010, 6, 15),
-                        Date(2010, 6, 16),
-                        Date(2010, 9, 22),
-                        Date(2010, 9, 23),
-                        Date(2010, 9, 24),
-                        Date(2010, 10, 1),
-                        Date(2010, 10, 4),
-                        Date(2010, 10, 5),
-                        Date(2010, 10, 6),
-                        Date(2010, 10, 7),
-                        Date(2011, 1, 3),
-                        Date(2011, 2, 2),
-                        Date(2011, 2, 3),
-                        Date(2011, 2, 4),
-                        Date(2011, 2, 7),
-                        Date(2011, 2, 8),
-                        Date(2011, 4, 4),
-                        Date(2011, 4, 5),
-                        Date(2011, 5, 2),
-                        Date(2011, 6, 6),
-                        Date(2011, 9, 12),
-                        Date(2011, 10, 3),
-                        Date(2011, 10, 4),
-                        Date(2011, 10, 5),
-                        Date(2011, 10, 6),
-                        Date(2011, 10, 7),
-                        Date(2012, 1, 2),
-                        Date(2012, 1, 3),
-                        Date(2012, 1, 23),
-                        Date(2012, 1, 24),
-                        Date(2012, 1, 25),
-                        Date(2012, 1, 26),
-                        Date(2012, 1, 27),
-                        Date(2012, 4, 2),
-                        Date(2012, 4, 3),
-                        Date(2012, 4, 4),
-                        Date(2012, 4, 30),
-                        Date(2012, 5, 1),
-                        Date(2012, 6, 22),
-                        Date(2012, 10, 1),
-                        Date(2012, 10, 2),
-                        Date(2012, 10, 3),
-                        Date(2012, 10, 4),
-                        Date(2012, 10, 5),
-                        Date(2013, 1, 1),
-                        Date(2013, 1, 2),
-                        Date(2013, 1, 3),
-                        Date(2013, 2, 11),
-                        Date(2013, 2, 12),
-                        Date(2013, 2, 13),
-                        Date(2013, 2, 14),
-                        Date(2013, 2, 15),
-                        Date(2013, 4, 4),
-                        Date(2013, 4, 5),
-                        Date(2013, 4, 29),
-                        Date(2013, 4, 30),
-                        Date(2013, 5, 1),
-                        Date(2013, 6, 10),
-                        Date(2013, 6, 11),
-                        Date(2013, 6, 12),
-                        Date(2013, 9, 19),
-                        Date(2013, 9, 20),
-                        Date(2013, 10, 1),
-                        Date(2013, 10, 2),
-                        Date(2013, 10, 3),
-                        Date(2013, 10, 4),
-                        Date(2013, 10, 7),
-                        Date(2014, 1, 1),
-                        Date(2014, 1, 31),
-                        Date(2014, 2, 3),
-                        Date(2014, 2, 4),
-                        Date(2014, 2, 5),
-                        Date(2014, 2, 6),
-                        Date(2014, 4, 7),
-                        Date(2014, 5, 1),
-                        Date(2014, 5, 2),
-                        Date(2014, 6, 2),
-                        Date(2014, 9, 8),
-                        Date(2014, 10, 1),
-                        Date(2014, 10, 2),
-                        Date(2014, 10, 3),
-                        Date(2014, 10, 6),
-                        Date(2014, 10, 7),
-                        Date(2015, 1, 1),
-                        Date(2015, 1, 2),
-                        Date(2015, 2, 18),
-                        Date(2015, 2, 19),
-                        Date(2015, 2, 20),
-                        Date(2015, 2, 23),
-                        Date(2015, 2, 24),
-                        Date(2015, 4, 6),
-                        Date(2015, 5, 1),
-                        Date(2015, 6, 22),
-                        Date(2015, 9, 3),
-                        Date(2015, 9, 4),
-                        Date(2015, 10, 1),
-                        Date(2015, 10, 2),
-                        Date(2015, 10, 5),
-                        Date(2015, 10, 6),
-                        Date(2015, 10, 7),
-                        Date(2016, 1, 1),
-                        Date(2016, 2, 8),
-                        Date(2016, 2, 9),
-                        Date(2016, 2, 10),
-                        Date(2016, 2, 11),
-                        Date(2016, 2, 12),
-                        Date(2016, 4, 4),
-                        Date(2016, 5, 1),
-                        Date(2016, 5, 2),
-                        Date(2016, 6, 9),
-                        Date(2016, 6, 10),
-                        Date(2016, 9, 15),
-                        Date(2016, 9, 16),
-                        Date(2016, 10, 3),
-                        Date(2016, 10, 4),
-                        Date(2016, 10, 5),
-                        Date(2016, 10, 6),
-                        Date(2016, 10, 7),
-                        Date(2017, 1, 2),
-                        Date(2017, 1, 27),
-                        Date(2017, 1, 30),
-                        Date(2017, 1, 31),
-                        Date(2017, 2, 1),
-                        Date(2017, 2, 2),
-                        Date(2017, 4, 3),
-                        Date(2017, 4, 4),
-                        Date(2017, 5, 1),
-                        Date(2017, 5, 29),
-                        Date(2017, 5, 30),
-                        Date(2017, 10, 2),
-                        Date(2017, 10, 3),
-                        Date(2017, 10, 4),
-                        Date(2017, 10, 5),
-                        Date(2017, 10, 6),
-                        Date(2018, 1, 1),
-                        Date(2018, 2, 15),
-                        Date(2018, 2, 16),
-                        Date(2018, 2, 19),
-                        Date(2018, 2, 20),
-                        Date(2018, 2, 21),
-                        Date(2018, 4, 5),
-                        Date(2018, 4, 6),
-                        Date(2018, 4, 30),
-                        Date(2018, 5, 1),
-                        Date(2018, 6, 18),
-                        Date(2018, 9, 24),
-                        Date(2018, 10, 1),
-                        Date(2018, 10, 2),
-                        Date(2018, 10, 3),
-                        Date(2018, 10, 4),
-                        Date(2018, 10, 5),
-                        Date(2019, 1, 1),
-                        Date(2019, 2, 4),
-                        Date(2019, 2, 5),
-                        Date(2019, 2, 6),
-                        Date(2019, 2, 7),
-                        Date(2019, 2, 8),
-                        Date(2019, 4, 5),
-                        Date(2019, 5, 1),
-                        Date(2019, 6, 7),
-                        Date(2019, 9, 13),
-                        Date(2019, 10, 1),
-                        Date(2019, 10, 2),
-                        Date(2019, 10, 3),
-                        Date(2019, 10, 4)}
-
-cdef set nyse_holidays = {
-    Date(1900, 1, 1), Date(1900, 2, 12), Date(1900, 2, 22),
-    Date(1900, 4, 13), Date(1900, 5, 30), Date(1900, 7, 4),
-    Date(1900, 9, 3), Date(1900, 10, 12), Date(1900, 11, 6),
-    Date(1900, 11, 29), Date(1900, 12, 25), Date(1901, 1, 1),
-    Date(1901, 2, 12), Date(1901, 2, 22), Date(1901, 4, 5),
-    Date(1901, 5, 30), Date(1901, 7, 4), Date(1901, 9, 2),
-    Date(1901, 10, 12), Date(1901, 11, 5), Date(1901, 11, 28),
-    Date(1901, 12, 25), Date(1902, 1, 1), Date(1902, 2, 12),
-    Date(1902, 2, 22), Date(1902, 3, 28), Date(1902, 5, 30),
-    Date(1902, 7, 4), Date(1902, 9, 1), Date(1902, 10, 13),
-    Date(1902, 11, 4), Date(1902, 11, 27), Date(1902, 12, 25),
-    Date(1903, 1, 1), Date(1903, 2, 12), Date(1903, 2, 23),
-    Date(1903, 4, 10), Date(1903, 5, 30), Date(1903, 7, 4),
-    Date(1903, 9, 7), Date(1903, 10, 12), Date(1903, 11, 3),
-    Date(1903, 11, 26), Date(1903, 12, 25), Date(1904, 1, 1),
-    Date(1904, 2, 12), Date(1904, 2, 22), Date(1904, 4, 1),
-    Date(1904, 5, 30), Date(1904, 7, 4), Date(1904, 9, 5),
-    Date(1904, 10, 12), Date(1904, 11, 8), Date(1904, 11, 24),
-    Date(1904, 12, 26), Date(1905, 1, 2), Date(1905, 2, 13),
-    Date(1905, 2, 22), Date(1905, 4, 21), Date(1905, 5, 30),
-    Date(1905, 7, 4), Date(1905, 9, 4), Date(1905, 10, 12),
-    Date(1905, 11, 7), Date(1905, 11, 30), Date(1905, 12, 25),
-    Date(1906, 1, 1), Date(1906, 2, 12), Date(1906, 2, 22),
-    Date(1906, 4, 13), Date(1906, 5, 30), Date(1906, 7, 4),
-    Date(1906, 9, 3), Date(1906, 10, 12), Date(1906, 11, 6),
-    Date(1906, 11, 29), Date(1906, 12, 25), Date(1907, 1, 1),
-    Date(1907, 2, 12), Date(1907, 2, 22), Date(1907, 3, 29),
-    Date(1907, 5, 30), Date(1907, 7, 4), Date(1907, 9, 2),
-    Date(1907, 10, 12), Date(1907, 11, 5), Date(1907, 11, 28),
-    Date(1907, 12, 25), Date(1908, 1, 1), Date(1908, 2, 12),
-    Date(1908, 2, 22), Date(1908, 4, 17), Date(1908, 5, 30),
-    Date(1908, 7, 4), Date(1908, 9, 7), Date(1908, 10, 12),
-    Date(1908, 11, 3), Date(1908, 11, 26), Date(1908, 12, 25),
-    Date(1909, 1, 1), Date(1909, 2, 12), Date(1909, 2, 22),
-    Date(1909, 4, 9), Date(1909, 5, 31), Date(1909, 7, 5),
-    Date(1909, 9, 6), Date(1909, 10, 12), Date(1909, 11, 2),
-    Date(1909, 11, 25), Date(1909, 12, 25), Date(1910, 1, 1),
-    Date(1910, 2, 12), Date(1910, 2, 22), Date(1910, 3, 25),
-    Date(1910, 5, 30), Date(1910, 7, 4), Date(1910, 9, 5),
-    Date(1910, 10, 12), Date(1910, 11, 8), Date(1910, 11, 24),
-    Date(1910, 12, 26), Date(1911, 1, 2), Date(1911, 2, 13),
-    Date(1911, 2, 22), Date(1911, 4, 14), Date(1911, 5, 30),
-    Date(1911, 7, 4), Date(1911, 9, 4), Date(1911, 10, 12),
-    Date(1911, 11, 7), Date(1911, 11, 30), Date(1911, 12, 25),
-    Date(1912, 1, 1), Date(1912, 2, 12), Date(1912, 2, 22),
-    Date(1912, 4, 5), Date(1912, 5, 30), Date(1912, 7, 4),
-    Date(1912, 9, 2), Date(1912, 10, 12), Date(1912, 11, 5),
-    Date(1912, 11, 28), Date(1912, 12, 25), Date(1913, 1, 1),
-    Date(1913, 2, 12), Date(1913, 2, 22), Date(1913, 3, 21),
-    Date(1913, 5, 30), Date(1913, 7, 4), Date(1913, 9, 1),
-    Date(1913, 10, 13), Date(1913, 11, 4), Date(1913, 11, 27),
-    Date(1913, 12, 25), Date(1914, 1, 1), Date(1914, 2, 12),
-    Date(1914, 2, 23), Date(1914, 4, 10), Date(1914, 5, 30),
-    Date(1914, 7, 4), Date(1914, 9, 7), Date(1914, 10, 12),
-    Date(1914, 11, 3), Date(1914, 11, 26), Date(1914, 12, 25),
-    Date(1915, 1, 1), Date(1915, 2, 12), Date(1915, 2, 22),
-    Date(1915, 4, 2), Date(1915, 5, 31), Date(1915, 7, 5),
-    Date(1915, 9, 6), Date(1915, 10, 12), Date(1915, 11, 2),
-    Date(1915, 11, 25), Date(1915, 12, 25), Date(1916, 1, 1),
-    Date(1916, 2, 12), Date(1916, 2, 22), Date(1916, 4, 21),
-    Date(1916, 5, 30), Date(1916, 7, 4), Date(1916, 9, 4),
-    Date(1916, 10, 12), Date(1916, 11, 7), Date(1916, 11, 30),
-    Date(1916, 12, 25), Date(1917, 1, 1), Date(1917, 2, 12),
-    Date(1917, 2, 22), Date(1917, 4, 6), Date(1917, 5, 30),
-    Date(1917, 7, 4), Date(1917, 9, 3), Date(1917, 10, 12),
-    Date(1917, 11, 6), Date(1917, 11, 29), Date(1917, 12, 25),
-    Date(1918, 1, 1), Date(1918, 2, 12), Date(1918, 2, 22),
-    Date(1918, 3, 29), Date(1918, 5, 30), Date(1918, 7, 4),
-    Date(1918, 9, 2), Date(1918, 10, 12), Date(1918, 11, 5),
-    Date(1918, 11, 28), Date(1918, 12, 25), Date(1919, 1, 1),
-    Date(1919, 2, 12), Date(1919, 2, 22), Date(1919, 4, 18),
-    Date(1919, 5, 30), Date(1919, 7, 4), Date(1919, 9, 1),
-    Date(1919, 10, 13), Date(1919, 11, 4), Date(1919, 11, 27),
-    Date(1919, 12, 25), Date(1920, 1, 1), Date(1920, 2, 12),
-    Date(1920, 2, 23), Date(1920, 4, 2), Date(1920, 5, 31),
-    Date(1920, 7, 5), Date(1920, 9, 6), Date(1920, 10, 12),
-    Date(1920, 11, 2), Date(1920, 11, 25), Date(1920, 12, 25),
-    Date(1921, 1, 1), Date(1921, 2, 12), Date(1921, 2, 22),
-    Date(1921, 3, 25), Date(1921, 5, 30), Date(1921, 7, 4),
-    Date(1921, 9, 5), Date(1921, 10, 12), Date(1921, 11, 8),
-    Date(1921, 11, 24), Date(1921, 12, 26), Date(1922, 1, 2),
-    Date(1922, 2, 13), Date(1922, 2, 22), Date(1922, 4, 14),
-    Date(1922, 5, 30), Date(1922, 7, 4), Date(1922, 9, 4),
-    Date(1922, 10, 12), Date(1922, 11, 7), Date(1922, 11, 30),
-    Date(1922, 12, 25), Date(1923, 1, 1), Date(1923, 2, 12),
-    Date(1923, 2, 22), Date(1923, 3, 30), Date(1923, 5, 30),
-    Date(1923, 7, 4), Date(1923, 9, 3), Date(1923, 10, 12),
-    Date(1923, 11, 6), Date(1923, 11, 29), Date(1923, 12, 25),
-    Date(1924, 1, 1), Date(1924, 2, 12), Date(1924, 2, 22),
-    Date(1924, 4, 18), Date(1924, 5, 30), Date(1924, 7, 4),
-    Date(1924, 9, 1), Date(1924, 10, 13), Date(1924, 11, 4),
-    Date(1924, 11, 27), Date(1924, 12, 25), Date(1925, 1, 1),
-    Date(1925, 2, 12), Date(1925, 2, 23), Date(1925, 4, 10),
-    Date(1925, 5, 30), Date(1925, 7, 4), Date(1925, 9, 7),
-    Date(1925, 10, 12), Date(1925, 11, 3), Date(1925, 11, 26),
-    Date(1925, 12, 25), Date(1926, 1, 1), Date(1926, 2, 12),
-    Date(1926, 2, 22), Date(1926, 4, 2), Date(1926, 5, 31),
-    Date(1926, 7, 5), Date(1926, 9, 6), Date(1926, 10, 12),
-    Date(1926, 11, 2), Date(1926, 11, 25), Date(1926, 12, 25),
-    Date(1927, 1, 1), Date(1927, 2, 12), Date(1927, 2, 22),
-    Date(1927, 4, 15), Date(1927, 5, 30), Date(1927, 7, 4),
-    Date(1927, 9, 5), Date(1927, 10, 12), Date(1927, 11, 8),
-    Date(1927, 11, 24), Date(1927, 12, 26), Date(1928, 1, 2),
-    Date(1928, 2, 13), Date(1928, 2, 22), Date(1928, 4, 6),
-    Date(1928, 5, 30), Date(1928, 7, 4), Date(1928, 9, 3),
-    Date(1928, 10, 12), Date(1928, 11, 6), Date(1928, 11, 29),
-    Date(1928, 12, 25), Date(1929, 1, 1), Date(1929, 2, 12),
-    Date(1929, 2, 22), Date(1929, 3, 29), Date(1929, 5, 30),
-    Date(1929, 7, 4), Date(1929, 9, 2), Date(1929, 10, 12),
-    Date(1929, 11, 1), Date(1929, 11, 5), Date(1929, 11, 28),
-    Date(1929, 11, 29), Date(1929, 12, 25), Date(1930, 1, 1),
-    Date(1930, 2, 12), Date(1930, 2, 22), Date(1930, 4, 18),
-    Date(1930, 5, 30), Date(1930, 7, 4), Date(1930, 9, 1),
-    Date(1930, 10, 13), Date(1930, 11, 4), Date(1930, 11, 27),
-    Date(1930, 12, 25), Date(1931, 1, 1), Date(1931, 2, 12),
-    Date(1931, 2, 23), Date(1931, 4, 3), Date(1931, 5, 30),
-    Date(1931, 7, 4), Date(1931, 9, 7), Date(1931, 10, 12),
-    Date(1931, 11, 3), Date(1931, 11, 26), Date(1931, 12, 25),
-    Date(1932, 1, 1), Date(1932, 2, 12), Date(1932, 2, 22),
-    Date(1932, 3, 25), Date(1932, 5, 30), Date(1932, 7, 4),
-    Date(1932, 9, 5), Date(1932, 10, 12), Date(1932, 11, 8),
-    Date(1932, 11, 24), Date(1932, 12, 26), Date(1933, 1, 2),
-    Date(1933, 2, 13), Date(1933, 2, 22), Date(1933, 3, 6),
-    Date(1933, 3, 7), Date(1933, 3, 8), Date(1933, 3, 9),
-    Date(1933, 3, 10), Date(1933, 3, 11), Date(1933, 3, 12),
-    Date(1933, 3, 13), Date(1933, 3, 14), Date(1933, 4, 14),
-    Date(1933, 5, 30), Date(1933, 7, 4), Date(1933, 9, 4),
-    Date(1933, 10, 12), Date(1933, 11, 7), Date(1933, 11, 30),
-    Date(1933, 12, 25), Date(1934, 1, 1), Date(1934, 2, 12),
-    Date(1934, 2, 22), Date(1934, 3, 30), Date(1934, 5, 30),
-    Date(1934, 7, 4), Date(1934, 9, 3), Date(1934, 10, 12),
-    Date(1934, 11, 6), Date(1934, 11, 12), Date(1934, 11, 29),
-    Date(1934, 12, 25), Date(1935, 1, 1), Date(1935, 2, 12),
-    Date(1935, 2, 22), Date(1935, 4, 19), Date(1935, 5, 30),
-    Date(1935, 7, 4), Date(1935, 9, 2), Date(1935, 10, 12),
-    Date(1935, 11, 5), Date(1935, 11, 11), Date(1935, 11, 28),
-    Date(1935, 12, 25), Date(1936, 1, 1), Date(1936, 2, 12),
-    Date(1936, 2, 22), Date(1936, 4, 10), Date(1936, 5, 30),
-    Date(1936, 7, 4), Date(1936, 9, 7), Date(1936, 10, 12),
-    Date(1936, 11, 3), Date(1936, 11, 11), Date(1936, 11, 26),
-    Date(1936, 12, 25), Date(1937, 1, 1), Date(1937, 2, 12),
-    Date(1937, 2, 22), Date(1937, 3, 26), Date(1937, 5, 31),
-    Date(1937, 7, 5), Date(1937, 9, 6), Date(1937, 10, 12),
-    Date(1937, 11, 2), Date(1937, 11, 11), Date(1937, 11, 25),
-    Date(1937, 12, 25), Date(1938, 1, 1), Date(1938, 2, 12),
-    Date(1938, 2, 22), Date(1938, 4, 15), Date(1938, 5, 30),
-    Date(1938, 7, 4), Date(1938, 9, 5), Date(1938, 10, 12),
-    Date(1938, 11, 8), Date(1938, 11, 11), Date(1938, 11, 24),
-    Date(1938, 12, 26), Date(1939, 1, 2), Date(1939, 2, 13),
-    Date(1939, 2, 22), Date(1939, 4, 7), Date(1939, 5, 30),
-    Date(1939, 7, 4), Date(1939, 9, 4), Date(1939, 10, 12),
-    Date(1939, 11, 7), Date(1939, 11, 11), Date(1939, 11, 23),
-    Date(1939, 12, 25), Date(1940, 1, 1), Date(1940, 2, 12),
-    Date(1940, 2, 22), Date(1940, 3, 22), Date(1940, 5, 30),
-    Date(1940, 7, 4), Date(1940, 9, 2), Date(1940, 10, 12),
-    Date(1940, 11, 5), Date(1940, 11, 11), Date(1940, 11, 21),
-    Date(1940, 12, 25), Date(1941, 1, 1), Date(1941, 2, 12),
-    Date(1941, 2, 22), Date(1941, 4, 11), Date(1941, 5, 30),
-    Date(1941, 7, 4), Date(1941, 9, 1), Date(1941, 10, 13),
-    Date(1941, 11, 4), Date(1941, 11, 11), Date(1941, 11, 20),
-    Date(1941, 12, 25), Date(1942, 1, 1), Date(1942, 2, 12),
-    Date(1942, 2, 23), Date(1942, 4, 3), Date(1942, 5, 30),
-    Date(1942, 7, 4), Date(1942, 9, 7), Date(1942, 10, 12),
-    Date(1942, 11, 3), Date(1942, 11, 11), Date(1942, 11, 26),
-    Date(1942, 12, 25), Date(1943, 1, 1), Date(1943, 2, 12),
-    Date(1943, 2, 22), Date(1943, 4, 23), Date(1943, 5, 31),
-    Date(1943, 7, 5), Date(1943, 9, 6), Date(1943, 10, 12),
-    Date(1943, 11, 2), Date(1943, 11, 11), Date(1943, 11, 25),
-    Date(1943, 12, 25), Date(1944, 1, 1), Date(1944, 2, 12),
-    Date(1944, 2, 22), Date(1944, 4, 7), Date(1944, 5, 30),
-    Date(1944, 7, 4), Date(1944, 9, 4), Date(1944, 10, 12),
-    Date(1944, 11, 7), Date(1944, 11, 11), Date(1944, 11, 23),
-    Date(1944, 12, 25), Date(1945, 1, 1), Date(1945, 2, 12),
-    Date(1945, 2, 22), Date(1945, 3, 30), Date(1945, 5, 30),
-    Date(1945, 7, 4), Date(1945, 8, 15), Date(1945, 8, 16),
-    Date(1945, 9, 3), Date(1945, 10, 12), Date(1945, 11, 6),
-    Date(1945, 11, 12), Date(1945, 11, 22), Date(1945, 12, 24),
-    Date(1945, 12, 25), Date(1946, 1, 1), Date(1946, 2, 12),
-    Date(1946, 2, 22), Date(1946, 4, 19), Date(1946, 5, 30),
-    Date(1946, 7, 4), Date(1946, 9, 2), Date(1946, 10, 12),
-    Date(1946, 11, 5), Date(1946, 11, 11), Date(1946, 11, 28),
-    Date(1946, 12, 25), Date(1947, 1, 1), Date(1947, 2, 12),
-    Date(1947, 2, 22), Date(1947, 4, 4), Date(1947, 5, 30),
-    Date(1947, 7, 4), Date(1947, 9, 1), Date(1947, 10, 13),
-    Date(1947, 11, 4), Date(1947, 11, 11), Date(1947, 11, 27),
-    Date(1947, 12, 25), Date(1948, 1, 1), Date(1948, 2, 12),
-    Date(1948, 2, 23), Date(1948, 3, 26), Date(1948, 5, 31),
-    Date(1948, 7, 5), Date(1948, 9, 6), Date(1948, 10, 12),
-    Date(1948, 11, 2), Date(1948, 11, 11), Date(1948, 11, 25),
-    Date(1948, 12, 25), Date(1949, 1, 1), Date(1949, 2, 12),
-    Date(1949, 2, 22), Date(1949, 4, 15), Date(1949, 5, 30),
-    Date(1949, 7, 4), Date(1949, 9, 5), Date(1949, 10, 12),
-    Date(1949, 11, 8), Date(1949, 11, 11), Date(1949, 11, 24),
-    Date(1949, 12, 26), Date(1950, 1, 2), Date(1950, 2, 13),
-    Date(1950, 2, 22), Date(1950, 4, 7), Date(1950, 5, 30),
-    Date(1950, 7, 4), Date(1950, 9, 4), Date(1950, 10, 12),
-    Date(1950, 11, 7), Date(1950, 11, 11), Date(1950, 11, 23),
-    Date(1950, 12, 25), Date(1951, 1, 1), Date(1951, 2, 12),
-    Date(1951, 2, 22), Date(1951, 3, 23), Date(1951, 5, 30),
-    Date(1951, 7, 4), Date(1951, 9, 3), Date(1951, 10, 12),
-    Date(1951, 11, 6), Date(1951, 11, 12), Date(1951, 11, 22),
-    Date(1951, 12, 25), Date(1952, 1, 1), Date(1952, 2, 12),
-    Date(1952, 2, 22), Date(1952, 4, 11), Date(1952, 5, 30),
-    Date(1952, 7, 4), Date(1952, 9, 1), Date(1952, 10, 13),
-    Date(1952, 11, 4), Date(1952, 11, 11), Date(1952, 11, 27),
-    Date(1952, 12, 25), Date(1953, 1, 1), Date(1953, 2, 12),
-    Date(1953, 2, 23), Date(1953, 4, 3), Date(1953, 5, 30),
-    Date(1953, 7, 4), Date(1953, 9, 7), Date(1953, 10, 12),
-    Date(1953, 11, 3), Date(1953, 11, 11), Date(1953, 11, 26),
-    Date(1953, 12, 25), Date(1954, 1, 1), Date(1954, 2, 22),
-    Date(1954, 4, 16), Date(1954, 5, 31), Date(1954, 7, 5),
-    Date(1954, 9, 6), Date(1954, 11, 2), Date(1954, 11, 25),
-    Date(1954, 12, 24), Date(1955, 1, 1), Date(1955, 2, 22),
-    Date(1955, 4, 8), Date(1955, 5, 30), Date(1955, 7, 4),
-    Date(1955, 9, 5), Date(1955, 11, 8), Date(1955, 11, 24),
-    Date(1955, 12, 26), Date(1956, 1, 2), Date(1956, 2, 22),
-    Date(1956, 3, 30), Date(1956, 5, 30), Date(1956, 7, 4),
-    Date(1956, 9, 3), Date(1956, 11, 6), Date(1956, 11, 22),
-    Date(1956, 12, 24), Date(1956, 12, 25), Date(1957, 1, 1),
-    Date(1957, 2, 22), Date(1957, 4, 19), Date(1957, 5, 30),
-    Date(1957, 7, 4), Date(1957, 9, 2), Date(1957, 11, 5),
-    Date(1957, 11, 28), Date(1957, 12, 25), Date(1958, 1, 1),
-    Date(1958, 2, 22), Date(1958, 4, 4), Date(1958, 5, 30),
-    Date(1958, 7, 4), Date(1958, 9, 1), Date(1958, 11, 4),
-    Date(1958, 11, 27), Date(1958, 12, 25), Date(1958, 12, 26),
-    Date(1959, 1, 1), Date(1959, 2, 23), Date(1959, 3, 27),
-    Date(1959, 5, 30), Date(1959, 7, 3), Date(1959, 9, 7),
-    Date(1959, 11, 3), Date(1959, 11, 26), Date(1959, 12, 25),
-    Date(1960, 1, 1), Date(1960, 2, 22), Date(1960, 4, 15),
-    Date(1960, 5, 30), Date(1960, 7, 4), Date(1960, 9, 5),
-    Date(1960, 11, 8), Date(1960, 11, 24), Date(1960, 12, 26),
-    Date(1961, 1, 2), Date(1961, 2, 22), Date(1961, 3, 31),
-    Date(1961, 5, 29), Date(1961, 5, 30), Date(1961, 7, 4),
-    Date(1961, 9, 4), Date(1961, 11, 7), Date(1961, 11, 23),
-    Date(1961, 12, 25), Date(1962, 1, 1), Date(1962, 2, 22),
-    Date(1962, 4, 20), Date(1962, 5, 30), Date(1962, 7, 4),
-    Date(1962, 9, 3), Date(1962, 11, 6), Date(1962, 11, 22),
-    Date(1962, 12, 25), Date(1963, 1, 1), Date(1963, 2, 22),
-    Date(1963, 4, 12), Date(1963, 5, 30), Date(1963, 7, 4),
-    Date(1963, 9, 2), Date(1963, 11, 5), Date(1963, 11, 25),
-    Date(1963, 11, 28), Date(1963, 12, 25), Date(1964, 1, 1),
-    Date(1964, 2, 21), Date(1964, 3, 27), Date(1964, 5, 29),
-    Date(1964, 7, 3), Date(1964, 9, 7), Date(1964, 11, 3),
-    Date(1964, 11, 26), Date(1964, 12, 25), Date(1965, 1, 1),
-    Date(1965, 2, 22), Date(1965, 4, 16), Date(1965, 5, 31),
-    Date(1965, 7, 5), Date(1965, 9, 6), Date(1965, 11, 2),
-    Date(1965, 11, 25), Date(1965, 12, 24), Date(1966, 1, 1),
-    Date(1966, 2, 22), Date(1966, 4, 8), Date(1966, 5, 30),
-    Date(1966, 7, 4), Date(1966, 9, 5), Date(1966, 11, 8),
-    Date(1966, 11, 24), Date(1966, 12, 26), Date(1967, 1, 2),
-    Date(1967, 2, 22), Date(1967, 3, 24), Date(1967, 5, 30),
-    Date(1967, 7, 4), Date(1967, 9, 4), Date(1967, 11, 7),
-    Date(1967, 11, 23), Date(1967, 12, 25), Date(1968, 1, 1),
-    Date(1968, 2, 12), Date(1968, 2, 22), Date(1968, 4, 9),
-    Date(1968, 4, 12), Date(1968, 5, 30), Date(1968, 6, 12),
-    Date(1968, 6, 19), Date(1968, 6, 26), Date(1968, 7, 4),
-    Date(1968, 7, 5), Date(1968, 7, 10), Date(1968, 7, 17),
-    Date(1968, 7, 24), Date(1968, 7, 31), Date(1968, 8, 7),
-    Date(1968, 8, 14), Date(1968, 8, 21), Date(1968, 8, 28),
-    Date(1968, 9, 2), Date(1968, 9, 11), Date(1968, 9, 18),
-    Date(1968, 9, 25), Date(1968, 10, 2), Date(1968, 10, 9),
-    Date(1968, 10, 16), Date(1968, 10, 23), Date(1968, 10, 30),
-    Date(1968, 11, 5), Date(1968, 11, 5), Date(1968, 11, 11),
-    Date(1968, 11, 20), Date(1968, 11, 28), Date(1968, 12, 4),
-    Date(1968, 12, 11), Date(1968, 12, 18), Date(1968, 12, 25),
-    Date(1968, 12, 25), Date(1969, 1, 1), Date(1969, 2, 10),
-    Date(1969, 2, 21), Date(1969, 3, 31), Date(1969, 4, 4),
-    Date(1969, 5, 30), Date(1969, 7, 4), Date(1969, 7, 21),
-    Date(1969, 9, 1), Date(1969, 11, 27), Date(1969, 12, 25),
-    Date(1970, 1, 1), Date(1970, 2, 23), Date(1970, 3, 27),
-    Date(1970, 7, 3), Date(1970, 9, 7), Date(1970, 11, 26),
-    Date(1970, 12, 25), Date(1971, 1, 1), Date(1971, 2, 15),
-    Date(1971, 4, 9), Date(1971, 5, 31), Date(1971, 7, 5),
-    Date(1971, 9, 6), Date(1971, 11, 25), Date(1971, 12, 24),
-    Date(1972, 1, 1), Date(1972, 2, 21), Date(1972, 3, 31),
-    Date(1972, 5, 29), Date(1972, 7, 4), Date(1972, 9, 4),
-    Date(1972, 11, 7), Date(1972, 11, 7), Date(1972, 11, 7),
-    Date(1972, 11, 7), Date(1972, 11, 23), Date(1972, 12, 25),
-    Date(1972, 12, 28), Date(1973, 1, 1), Date(1973, 1, 25),
-    Date(1973, 2, 19), Date(1973, 4, 20), Date(1973, 5, 28),
-    Date(1973, 7, 4), Date(1973, 9, 3), Date(1973, 11, 22),
-    Date(1973, 12, 25), Date(1974, 1, 1), Date(1974, 2, 18),
-    Date(1974, 4, 12), Date(1974, 5, 27), Date(1974, 7, 4),
-    Date(1974, 9, 2), Date(1974, 11, 28), Date(1974, 12, 25),
-    Date(1975, 1, 1), Date(1975, 2, 17), Date(1975, 3, 28),
-    Date(1975, 5, 26), Date(1975, 7, 4), Date(1975, 9, 1),
-    Date(1975, 11, 27), Date(1975, 12, 25), Date(1976, 1, 1),
-    Date(1976, 2, 16), Date(1976, 4, 16), Date(1976, 5, 31),
-    Date(1976, 7, 5), Date(1976, 9, 6), Date(1976, 11, 2),
-    Date(1976, 11, 2), Date(1976, 11, 2), Date(1976, 11, 2),
-    Date(1976, 11, 25), Date(1976, 12, 24), Date(1977, 1, 1),
-    Date(1977, 2, 21), Date(1977, 4, 8), Date(1977, 5, 30),
-    Date(1977, 7, 4), Date(1977, 7, 14), Date(1977, 9, 5),
-    Date(1977, 11, 24), Date(1977, 12, 26), Date(1978, 1, 2),
-    Date(1978, 2, 20), Date(1978, 3, 24), Date(1978, 5, 29),
-    Date(1978, 7, 4), Date(1978, 9, 4), Date(1978, 11, 23),
-    Date(1978, 12, 25), Date(1979, 1, 1), Date(1979, 2, 19),
-    Date(1979, 4, 13), Date(1979, 5, 28), Date(1979, 7, 4),
-    Date(1979, 9, 3), Date(1979, 11, 22), Date(1979, 12, 25),
-    Date(1980, 1, 1), Date(1980, 2, 18), Date(1980, 4, 4),
-    Date(1980, 5, 26), Date(1980, 7, 4), Date(1980, 9, 1),
-    Date(1980, 11, 4), Date(1980, 11, 4), Date(1980, 11, 4),
-    Date(1980, 11, 4), Date(1980, 11, 27), Date(1980, 12, 25),
-    Date(1981, 1, 1), Date(1981, 2, 16), Date(1981, 4, 17),
-    Date(1981, 5, 25), Date(1981, 7, 3), Date(1981, 9, 7),
-    Date(1981, 11, 26), Date(1981, 12, 25), Date(1982, 1, 1),
-    Date(1982, 2, 15), Date(1982, 4, 9), Date(1982, 5, 31),
-    Date(1982, 7, 5), Date(1982, 9, 6), Date(1982, 11, 25),
-    Date(1982, 12, 24), Date(1983, 1, 1), Date(1983, 2, 21),
-    Date(1983, 4, 1), Date(1983, 5, 30), Date(1983, 7, 4),
-    Date(1983, 9, 5), Date(1983, 11, 24), Date(1983, 12, 26),
-    Date(1984, 1, 2), Date(1984, 2, 20), Date(1984, 4, 20),
-    Date(1984, 5, 28), Date(1984, 7, 4), Date(1984, 9, 3),
-    Date(1984, 11, 22), Date(1984, 12, 25), Date(1985, 1, 1),
-    Date(1985, 2, 18), Date(1985, 4, 5), Date(1985, 5, 27),
-    Date(1985, 7, 4), Date(1985, 9, 2), Date(1985, 9, 27),
-    Date(1985, 11, 28), Date(1985, 12, 25), Date(1986, 1, 1),
-    Date(1986, 2, 17), Date(1986, 3, 28), Date(1986, 5, 26),
-    Date(1986, 7, 4), Date(1986, 9, 1), Date(1986, 11, 27),
-    Date(1986, 12, 25), Date(1987, 1, 1), Date(1987, 2, 16),
-    Date(1987, 4, 17), Date(1987, 5, 25), Date(1987, 7, 3),
-    Date(1987, 9, 7), Date(1987, 11, 26), Date(1987, 12, 25),
-    Date(1988, 1, 1), Date(1988, 2, 15), Date(1988, 4, 1),
-    Date(1988, 5, 30), Date(1988, 7, 4), Date(1988, 9, 5),
-    Date(1988, 11, 24), Date(1988, 12, 26), Date(1989, 1, 2),
-    Date(1989, 2, 20), Date(1989, 3, 24), Date(1989, 5, 29),
-    Date(1989, 7, 4), Date(1989, 9, 4), Date(1989, 11, 23),
-    Date(1989, 12, 25), Date(1990, 1, 1), Date(1990, 2, 19),
-    Date(1990, 4, 13), Date(1990, 5, 28), Date(1990, 7, 4),
-    Date(1990, 9, 3), Date(1990, 11, 22), Date(1990, 12, 25),
-    Date(1991, 1, 1), Date(1991, 2, 18), Date(1991, 3, 29),
-    Date(1991, 5, 27), Date(1991, 7, 4), Date(1991, 9, 2),
-    Date(1991, 11, 28), Date(1991, 12, 25), Date(1992, 1, 1),
-    Date(1992, 2, 17), Date(1992, 4, 17), Date(1992, 5, 25),
-    Date(1992, 7, 3), Date(1992, 9, 7), Date(1992, 11, 26),
-    Date(1992, 12, 25), Date(1993, 1, 1), Date(1993, 2, 15),
-    Date(1993, 4, 9), Date(1993, 5, 31), Date(1993, 7, 5),
-    Date(1993, 9, 6), Date(1993, 11, 25), Date(1993, 12, 24),
-    Date(1994, 1, 1), Date(1994, 2, 21), Date(1994, 4, 1),
-    Date(1994, 4, 27), Date(1994, 5, 30), Date(1994, 7, 4),
-    Date(1994, 9, 5), Date(1994, 11, 24), Date(1994, 12, 26),
-    Date(1995, 1, 2), Date(1995, 2, 20), Date(1995, 4, 14),
-    Date(1995, 5, 29), Date(1995, 7, 4), Date(1995, 9, 4),
-    Date(1995, 11, 23), Date(1995, 12, 25), Date(1996, 1, 1),
-    Date(1996, 2, 19), Date(1996, 4, 5), Date(1996, 5, 27),
-    Date(1996, 7, 4), Date(1996, 9, 2), Date(1996, 11, 28),
-    Date(1996, 12, 25), Date(1997, 1, 1), Date(1997, 2, 17),
-    Date(1997, 3, 28), Date(1997, 5, 26), Date(1997, 7, 4),
-    Date(1997, 9, 1), Date(1997, 11, 27), Date(1997, 12, 25),
-    Date(1998, 1, 1), Date(1998, 1, 19), Date(1998, 2, 16),
-    Date(1998, 4, 10), Date(1998, 5, 25), Date(1998, 7, 3),
-    Date(1998, 9, 7), Date(1998, 11, 26), Date(1998, 12, 25),
-    Date(1999, 1, 1), Date(1999, 1, 18), Date(1999, 2, 15),
-    Date(1999, 4, 2), Date(1999, 5, 31), Date(1999, 7, 5),
-    Date(1999, 9, 6), Date(1999, 11, 25), Date(1999, 12, 24),
-    Date(2000, 1, 1), Date(2000, 1, 17), Date(2000, 2, 21),
-    Date(2000, 4, 21), Date(2000, 5, 29), Date(2000, 7, 4),
-    Date(2000, 9, 4), Date(2000, 11, 23), Date(2000, 12, 25),
-    Date(2001, 1, 1), Date(2001, 1, 15), Date(2001, 2, 19),
-    Date(2001, 4, 13), Date(2001, 5, 28), Date(2001, 7, 4),
-    Date(2001, 9, 3), Date(2001, 9, 11), Date(2001, 9, 12),
-    Date(2001, 9, 13), Date(2001, 9, 14), Date(2001, 9, 15),
-    Date(2001, 9, 16), Date(2001, 11, 22), Date(2001, 12, 25),
-    Date(2002, 1, 1), Date(2002, 1, 21), Date(2002, 2, 18),
-    Date(2002, 3, 29), Date(2002, 5, 27), Date(2002, 7, 4),
-    Date(2002, 9, 2), Date(2002, 11, 28), Date(2002, 12, 25),
-    Date(2003, 1, 1), Date(2003, 1, 20), Date(2003, 2, 17),
-    Date(2003, 4, 18), Date(2003, 5, 26), Date(2003, 7, 4),
-    Date(2003, 9, 1), Date(2003, 11, 27), Date(2003, 12, 25),
-    Date(2004, 1, 1), Date(2004, 1, 19), Date(2004, 2, 16),
-    Date(2004, 4, 9), Date(2004, 5, 31), Date(2004, 6, 11),
-    Date(2004, 7, 5), Date(2004, 9, 6), Date(2004, 11, 25),
-    Date(2004, 12, 24), Date(2005, 1, 1), Date(2005, 1, 17),
-    Date(2005, 2, 21), Date(2005, 3, 25), Date(2005, 5, 30),
-    Date(2005, 7, 4), Date(2005, 9, 5), Date(2005, 11, 24),
-    Date(2005, 12, 26), Date(2006, 1, 2), Date(2006, 1, 16),
-    Date(2006, 2, 20), Date(2006, 4, 14), Date(2006, 5, 29),
-    Date(2006, 7, 4), Date(2006, 9, 4), Date(2006, 11, 23),
-    Date(2006, 12, 25), Date(2007, 1, 1), Date(2007, 1, 2),
-    Date(2007, 1, 15), Date(2007, 2, 19), Date(2007, 4, 6),
-    Date(2007, 5, 28), Date(2007, 7, 4), Date(2007, 9, 3),
-    Date(2007, 11, 22), Date(2007, 12, 25), Date(2008, 1, 1),
-    Date(2008, 1, 21), Date(2008, 2, 18), Date(2008, 3, 21),
-    Date(2008, 5, 26), Date(2008, 7, 4), Date(2008, 9, 1),
-    Date(2008, 11, 27), Date(2008, 12, 25), Date(2009, 1, 1),
-    Date(2009, 1, 19), Date(2009, 2, 16), Date(2009, 4, 10),
-    Date(2009, 5, 25), Date(2009, 7, 3), Date(2009, 9, 7),
-    Date(2009, 11, 26), Date(2009, 12, 25), Date(2010, 1, 1),
-    Date(2010, 1, 18), Date(2010, 2, 15), Date(2010, 4, 2),
-    Date(2010, 5, 31), Date(2010, 7, 5), Date(2010, 9, 6),
-    Date(2010, 11, 25), Date(2010, 12, 24), Date(2011, 1, 1),
-    Date(2011, 1, 17), Date(2011, 2, 21), Date(2011, 4, 22),
-    Date(2011, 5, 30), Date(2011, 7, 4), Date(2011, 9, 5),
-    Date(2011, 11, 24), Date(2011, 12, 26), Date(2012, 1, 2),
-    Date(2012, 1, 16), Date(2012, 2, 20), Date(2012, 4, 6),
-    Date(2012, 5, 28), Date(2012, 7, 4), Date(2012, 9, 3),
-    Date(2012, 10, 29), Date(2012, 10, 30), Date(2012, 11, 22),
-    Date(2012, 12, 25), Date(2013, 1, 1), Date(2013, 1, 21),
-    Date(2013, 2, 18), Date(2013, 3, 29), Date(2013, 5, 27),
-    Date(2013, 7, 4), Date(2013, 9, 2), Date(2013, 11, 28),
-    Date(2013, 12, 25), Date(2014, 1, 1), Date(2014, 1, 20),
-    Date(2014, 2, 17), Date(2014, 4, 18), Date(2014, 5, 26),
-    Date(2014, 7, 4), Date(2014, 9, 1), Date(2014, 11, 27),
-    Date(2014, 12, 25), Date(2015, 1, 1), Date(2015, 1, 19),
-    Date(2015, 2, 16), Date(2015, 4, 3), Date(2015, 5, 25),
-    Date(2015, 7, 3), Date(2015, 9, 7), Date(2015, 11, 26),
-    Date(2015, 12, 25), Date(2016, 1, 1), Date(2016, 1, 18),
-    Date(2016, 2, 15), Date(2016, 3, 25), Date(2016, 5, 30),
-    Date(2016, 7, 4), Date(2016, 9, 5), Date(2016, 11, 24),
-    Date(2016, 12, 26), Date(2017, 1, 2), Date(2017, 1, 16),
-    Date(2017, 2, 20), Date(2017, 4, 14), Date(2017, 5, 29),
-    Date(2017, 7, 4), Date(2017, 9, 4), Date(2017, 11, 23),
-    Date(2017, 12, 25), Date(2018, 1, 1), Date(2018, 1, 15),
-    Date(2018, 2, 19), Date(2018, 3, 30), Date(2018, 5, 28),
-    Date(2018, 7, 4), Date(2018, 9, 3), Date(2018, 11, 22),
-    Date(2018, 12, 25), Date(2019, 1, 1), Date(2019, 1, 21),
-    Date(2019, 2, 18), Date(2019, 4, 19), Date(2019, 5, 27),
-    Date(2019, 7, 4), Date(2019, 9, 2), Date(2019, 11, 28),
-    Date(2019, 12, 25), Date(2020, 1, 1), Date(2020, 1, 20),
-    Date(2020, 2, 17), Date(2020, 4, 10), Date(2020, 5, 25),
-    Date(2020, 7, 3), Date(2020, 9, 7), Date(2020, 11, 26),
-    Date(2020, 12, 25), Date(2021, 1, 1), Date(2021, 1, 18),
-    Date(2021, 2, 15), Date(2021, 4, 2), Date(2021, 5, 31),
-    Date(2021, 7, 5), Date(2021, 9, 6), Date(2021, 11, 25),
-    Date(2021, 12, 24), Date(2022, 1, 1), Date(2022, 1, 17),
-    Date(2022, 2, 21), Date(2022, 4, 15), Date(2022, 5, 30),
-    Date(2022, 7, 4), Date(2022, 9, 5), Date(2022, 11, 24),
-    Date(2022, 12, 26), Date(2023, 1, 2), Date(2023, 1, 16),
-    Date(2023, 2, 20), Date(2023, 4, 7), Date(2023, 5, 29),
-    Date(2023, 7, 4), Date(2023, 9, 4), Date(2023, 11, 23),
-    Date(2023, 12, 25), Date(2024, 1, 1), Date(2024, 1, 15),
-    Date(2024, 2, 19), Date(2024, 3, 29), Date(2024, 5, 27),
-    Date(2024, 7, 4), Date(2024, 9, 2), Date(2024, 11, 28),
-    Date(2024, 12, 25), Date(2025, 1, 1), Date(2025, 1, 20),
-    Date(2025, 2, 17), Date(2025, 4, 18), Date(2025, 5, 26),
-    Date(2025, 7, 4), Date(2025, 9, 1), Date(2025, 11, 27),
-    Date(2025, 12, 25), Date(2026, 1, 1), Date(2026, 1, 19),
-    Date(2026, 2, 16), Date(2026, 4, 3), Date(2026, 5, 25),
-    Date(2026, 7, 3), Date(2026, 9, 7), Date(2026, 11, 26),
-    Date(2026, 12, 25), Date(2027, 1, 1), Date(2027, 1, 18),
-    Date(2027, 2, 15), Date(2027, 3, 26), Date(2027, 5, 31),
-    Date(2027, 7, 5), Date(2027, 9, 6), Date(2027, 11, 25),
-    Date(2027, 12, 24), Date(2028, 1, 1), Date(2028, 1, 17),
-    Date(2028, 2, 21), Date(2028, 4, 14), Date(2028, 5, 29),
-    Date(2028, 7, 4), Date(2028, 9, 4), Date(2028, 11, 23),
-    Date(2028, 12, 25), Date(2029, 1, 1), Date(2029, 1, 15),
-    Date(2029, 2, 19), Date(2029, 3, 30), Date(2029, 5, 28),
-    Date(2029, 7, 4), Date(2029, 9, 3), Date(2029, 11, 22),
-    Date(2029, 12, 25), Date(2030, 1, 1), Date(2030, 1, 21),
-    Date(2030, 2, 18), Date(2030, 4, 19), Date(2030, 5, 27),
-    Date(2030, 7, 4), Date(2030, 9, 2), Date(2030, 11, 28),
-    Date(2030, 12, 25)}
+    # serial level date rolling; 0 flags a result outside the supported range
+    # and -1 an unknown business day convention
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int nextBizSerial(self, int serial) nogil:
+        if serial > MAX_SERIAL:
+            return 0
+        return self._nextBiz[serial if serial > MIN_SERIAL else MIN_SERIAL]
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int prevBizSerial(self, int serial) nogil:
+        if serial < MIN_SERIAL:
+            return 0
+        return self._prevBiz[serial if serial < MAX_SERIAL else MAX_SERIAL]
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int adjustSerial(self, int serial, int c) nogil:
+        # every convention is resolved with the next/previous business day tables, the modified ones
+        # falling back to the other direction when the first one leaves the month (or half month)
+        cdef int s1
+        cdef int s2
+        cdef int k
+        cdef int y
+        cdef int m
+        cdef int d
+        cdef int y1
+        cdef int m1
+        cdef int d1
+
+        if serial < MIN_SERIAL or serial > MAX_SERIAL:
+            return 0
+        if c == BizDayConventions.Unadjusted:
+            return serial
+
+        if c == BizDayConventions.Following or c == BizDayConventions.ModifiedFollowing or \
+                c == BizDayConventions.HalfMonthModifiedFollowing:
+            s1 = self._nextBiz[serial]
+            if s1 and (c == BizDayConventions.ModifiedFollowing or c == BizDayConventions.HalfMonthModifiedFollowing):
+                serial_to_ymd(serial, &y, &m, &d)
+                serial_to_ymd(s1, &y1, &m1, &d1)
+                if m1 != m or c == BizDayConventions.HalfMonthModifiedFollowing and d <= 15 < d1:
+                    return self._prevBiz[serial]
+            return s1
+        elif c == BizDayConventions.Preceding or c == BizDayConventions.ModifiedPreceding:
+            s1 = self._prevBiz[serial]
+            if s1 and c == BizDayConventions.ModifiedPreceding:
+                serial_to_ymd(serial, &y, &m, &d)
+                serial_to_ymd(s1, &y1, &m1, &d1)
+                if m1 != m:
+                    return self._nextBiz[serial]
+            return s1
+        elif c == BizDayConventions.Nearest:
+            # the closer of the two, the following one on a tie; 0 when the search would have to
+            # look beyond either end of the supported range
+            s1 = self._nextBiz[serial]
+            s2 = self._prevBiz[serial]
+            k = MAX_SERIAL - MIN_SERIAL + 1
+            if s1:
+                k = s1 - serial
+            if s2 and serial - s2 < k:
+                k = serial - s2
+                s1 = s2
+            if serial + k > MAX_SERIAL or serial - k < MIN_SERIAL:
+                return 0
+            return s1
+        return -1
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef bint isEndOfMonthSerial(self, int serial) nogil:
+        # no business day left in the month after serial
+        cdef int y
+        cdef int m
+        cdef int d
+
+        if serial < MIN_SERIAL or serial >= MAX_SERIAL:
+            return True
+        serial_to_ymd(serial, &y, &m, &d)
+        return self._monthEnd[(y - 1901) * 12 + m - 1] <= serial
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int endOfMonthSerial(self, int serial) nogil:
+        cdef int y
+        cdef int m
+        cdef int d
+
+        if serial < MIN_SERIAL or serial > MAX_SERIAL:
+            return 0
+        serial_to_ymd(serial, &y, &m, &d)
+        return self._monthEnd[(y - 1901) * 12 + m - 1]
+
+    cdef int advanceSerial(self, int serial, int n, int units, int c, bint endOfMonth) nogil:
+        cdef int s1
+
+        if serial < MIN_SERIAL or serial > MAX_SERIAL:
+            return 0
+        if n == 0:
+            return self.adjustSerial(serial, c)
+        elif units == TimeUnits.BDays:
+            return _nth_biz_serial(self._bizCounts, self._bizSerials, serial, n)
+        s1 = advance_serial(serial, n, units)
+        if s1 == 0:
+            return 0
+        if units != TimeUnits.Days and units != TimeUnits.Weeks and endOfMonth and self.isEndOfMonthSerial(serial):
+            return self.endOfMonthSerial(s1)
+        return self.adjustSerial(s1, c)
+
+    cdef int compileBizBits(self) except -1:
+        # evaluate the holiday rules once over the supported range into a packed bitmap indexed by serial; the
+        # rules take serials, so no Date is built per day
+        cdef unsigned char[::1] bits = array.clone(_BYTE_TABLE, (MAX_SERIAL >> 3) + 1, True)
+        cdef int s
+
+        for s in range(MIN_SERIAL, MAX_SERIAL + 1):
+            if self.isBizSerialByRule(s):
+                bits[s >> 3] |= 1 << (s & 7)
+        self._bizBits = bits
+        return 0
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int compileTables(self) except -1:
+        # lookup tables derived from the bitmap, all indexed by serial except the select and month end tables;
+        # filled in plain loops so that compiling a centre does not need numpy
+        cdef int[::1] counts = array.clone(_INT_TABLE, MAX_SERIAL + 1, True)
+        cdef int[::1] serials
+        cdef int[::1] holidays
+        cdef int[::1] nextBiz = array.clone(_INT_TABLE, MAX_SERIAL + 1, True)
+        cdef int[::1] prevBiz = array.clone(_INT_TABLE, MAX_SERIAL + 1, True)
+        cdef int[::1] monthEnd = array.clone(_INT_TABLE, _MONTHS, False)
+        cdef bint weekends[7]
+        cdef int n = 0
+        cdef int h = 0
+        cdef int s
+        cdef int k
+
+        # serial % 7 is the weekday, with Saturday as 0
+        for k in range(7):
+            weekends[k] = self.isWeekEnd(k if k else Weekdays.Saturday)
+        # cumulative number of business days in [MIN_SERIAL, serial]
+        for s in range(MIN_SERIAL, MAX_SERIAL + 1):
+            if self.isBizSerial(s):
+                n += 1
+            elif not weekends[s % 7]:
+                h += 1
+            counts[s] = n
+
+        # serial of the k-th business day, the inverse of counts; slot 0 is unused, and sorted serials of
+        # the holidays falling on weekdays
+        serials = array.clone(_INT_TABLE, n + 1, True)
+        holidays = array.clone(_INT_TABLE, h, False)
+        h = 0
+        for s in range(MIN_SERIAL, MAX_SERIAL + 1):
+            if self.isBizSerial(s):
+                serials[counts[s]] = s
+            elif not weekends[s % 7]:
+                holidays[h] = s
+                h += 1
+
+        # first business day on or after / last one on or before serial, 0 when there is none
+        for s in range(MAX_SERIAL + 1):
+            k = counts[s - 1] if s else 0
+            nextBiz[s] = serials[k + 1] if k < n else 0
+            prevBiz[s] = serials[counts[s]]
+        # last business day of each month from January 1901, indexed by (year - 1901) * 12 + month - 1
+        for k in range(_MONTHS - 1):
+            monthEnd[k] = prevBiz[serial_from_ymd(1901 + (k + 1) // 12, (k + 1) % 12 + 1, 1) - 1]
+        monthEnd[_MONTHS - 1] = prevBiz[MAX_SERIAL]
+
+        self._bizCounts = counts
+        self._bizSerials = serials
+        self._holSerials = holidays
+        self._nextBiz = nextBiz
+        self._prevBiz = prevBiz
+        self._monthEnd = monthEnd
+        return 0
+
+    cdef const int[::1] bizCounts(self):
+        return self._bizCounts
+
+    cdef const int[::1] bizSerials(self):
+        return self._bizSerials
+
+    cdef const int[::1] holSerials(self):
+        return self._holSerials
+
+cdef array.array _serial_bits(set dates):
+    # packed bitmap of the dates, indexed by serial as the compiled tables, so that a rule tests one bit per
+    # day instead of boxing the serial for a set lookup
+    cdef array.array bits = array.clone(_BYTE_TABLE, (MAX_SERIAL >> 3) + 1, True)
+    cdef int s
+
+    for d in dates:
+        s = (<Date>d).__serial_number__
+        if MIN_SERIAL <= s <= MAX_SERIAL:
+            bits.data.as_uchars[s >> 3] |= 1 << (s & 7)
+    return bits
+
+cdef inline bint _has_serial(array.array bits, int serial):
+    return bits.data.as_uchars[serial >> 3] >> (serial & 7) & 1
+
+cdef array.array sse_holDays = None
+
+
+cdef array.array _sse_holidays():
+    # the holiday sets are materialized on first use, i.e. when their centre gets compiled, as bitmaps of
+    # serial numbers for the rules
+    global sse_holDays
+    if sse_holDays is None:
+        dates = {Date(2005, 1, 3),
+                       Date(2005, 2, 7),
+                       Date(2005, 2, 8),
+                       Date(2005, 2, 9),
+                       Date(2005, 2, 10),
+                       Date(2005, 2, 11),
+                       Date(2005, 2, 14),
+                       Date(2005, 2, 15),
+                       Date(2005, 4, 4),
+                       Date(2005, 5, 2),
+                       Date(2005, 5, 3),
+                       Date(2005, 5, 4),
+                       Date(2005, 5, 5),
+                       Date(2005, 5, 6),
+                       Date(2005, 6, 9),
+                       Date(2005, 9, 15),
+                       Date(2005, 10, 3),
+                       Date(2005, 10, 4),
+                       Date(2005, 10, 5),
+                       Date(2005, 10, 6),
+                       Date(2005, 10, 7),
+                       Date(2006, 1, 2),
+                       Date(2006, 1, 3),
+                       Date(2006, 1, 26),
+                       Date(2006, 1, 27),
+                       Date(2006, 1, 30),
+                       Date(2006, 1, 31),
+                       Date(2006, 2, 1),
+                       Date(2006, 2, 2),
+                       Date(2006, 2, 3),
+                       Date(2006, 4, 4),
+                       Date(2006, 5, 1),
+                       Date(2006, 5, 2),
+                       Date(2006, 5, 3),
+                       Date(2006, 5, 4),
+                       Date(2006, 5, 5),
+                       Date(2006, 6, 9),
+                       Date(2006, 9, 15),
+                       Date(2006, 10, 2),
+                       Date(2006, 10, 3),
+                       Date(2006, 10, 4),
+                       Date(2006, 10, 5),
+                       Date(2006, 10, 6),
+                       Date(2007, 1, 1),
+                       Date(2007, 1, 2),
+                       Date(2007, 1, 3),
+                       Date(2007, 2, 19),
+                       Date(2007, 2, 20),
+                       Date(2007, 2, 21),
+                       Date(2007, 2, 22),
+                       Date(2007, 2, 23),
+                       Date(2007, 4, 4),
+                       Date(2007, 5, 1),
+                       Date(2007, 5, 2),
+                       Date(2007, 5, 3),
+                       Date(2007, 5, 4),
+                       Date(2007, 5, 7),
+                       Date(2007, 10, 1),
+                       Date(2007, 10, 2),
+                       Date(2007, 10, 3),
+                       Date(2007, 10, 4),
+                       Date(2007, 10, 5),
+                       Date(2007, 12, 31),
+                       Date(2008, 1, 1),
+                       Date(2008, 2, 6),
+                       Date(2008, 2, 7),
+                       Date(2008, 2, 8),
+                       Date(2008, 2, 11),
+                       Date(2008, 2, 12),
+                       Date(2008, 4, 4),
+                       Date(2008, 5, 1),
+                       Date(2008, 5, 2),
+                       Date(2008, 6, 9),
+                       Date(2008, 9, 15),
+                       Date(2008, 9, 29),
+                       Date(2008, 9, 30),
+                       Date(2008, 10, 1),
+                       Date(2008, 10, 2),
+                       Date(2008, 10, 3),
+                       Date(2009, 1, 1),
+                       Date(2009, 1, 2),
+                       Date(2009, 1, 26),
+                       Date(2009, 1, 27),
+                       Date(2009, 1, 28),
+                       Date(2009, 1, 29),
+                       Date(2009, 1, 30),
+                       Date(2009, 4, 6),
+                       Date(2009, 5, 1),
+                       Date(2009, 5, 28),
+                       Date(2009, 5, 29),
+                       Date(2009, 10, 1),
+                       Date(2009, 10, 2),
+                       Date(2009, 10, 5),
+                       Date(2009, 10, 6),
+                       Date(2009, 10, 7),
+                       Date(2009, 10, 8),
+                       Date(2010, 1, 1),
+                       Date(2010, 2, 15),
+                       Date(2010, 2, 16),
+                       Date(2010, 2, 17),
+                       Date(2010, 2, 18),
+                       Date(2010, 2, 19),
+                       Date(2010, 4, 5),
+                       Date(2010, 5, 3),
+                       Date(2010, 6, 14),
+                       Date(2010, 6, 15),
+                       Date(2010, 6, 16),
+                       Date(2010, 9, 22),
+                       Date(2010, 9, 23),
+                       Date(2010, 9, 24),
+                       Date(2010, 10, 1),
+                       Date(2010, 10, 4),
+                       Date(2010, 10, 5),
+                       Date(2010, 10, 6),
+                       Date(2010, 10, 7),
+                       Date(2011, 1, 3),
+                       Date(2011, 2, 2),
+                       Date(2011, 2, 3),
+                       Date(2011, 2, 4),
+                       Date(2011, 2, 7),
+                       Date(2011, 2, 8),
+                       Date(2011, 4, 4),
+                       Date(2011, 4, 5),
+                       Date(2011, 5, 2),
+                       Date(2011, 6, 6),
+                       Date(2011, 9, 12),
+                       Date(2011, 10, 3),
+                       Date(2011, 10, 4),
+                       Date(2011, 10, 5),
+                       Date(2011, 10, 6),
+                       Date(2011, 10, 7),
+                       Date(2012, 1, 2),
+                       Date(2012, 1, 3),
+                       Date(2012, 1, 23),
+                       Date(2012, 1, 24),
+                       Date(2012, 1, 25),
+                       Date(2012, 1, 26),
+                       Date(2012, 1, 27),
+                       Date(2012, 4, 2),
+                       Date(2012, 4, 3),
+                       Date(2012, 4, 4),
+                       Date(2012, 4, 30),
+                       Date(2012, 5, 1),
+                       Date(2012, 6, 22),
+                       Date(2012, 10, 1),
+                       Date(2012, 10, 2),
+                       Date(2012, 10, 3),
+                       Date(2012, 10, 4),
+                       Date(2012, 10, 5),
+                       Date(2013, 1, 1),
+                       Date(2013, 1, 2),
+                       Date(2013, 1, 3),
+                       Date(2013, 2, 11),
+                       Date(2013, 2, 12),
+                       Date(2013, 2, 13),
+                       Date(2013, 2, 14),
+                       Date(2013, 2, 15),
+                       Date(2013, 4, 4),
+                       Date(2013, 4, 5),
+                       Date(2013, 4, 29),
+                       Date(2013, 4, 30),
+                       Date(2013, 5, 1),
+                       Date(2013, 6, 10),
+                       Date(2013, 6, 11),
+                       Date(2013, 6, 12),
+                       Date(2013, 9, 19),
+                       Date(2013, 9, 20),
+                       Date(2013, 10, 1),
+                       Date(2013, 10, 2),
+                       Date(2013, 10, 3),
+                       Date(2013, 10, 4),
+                       Date(2013, 10, 7),
+                       Date(2014, 1, 1),
+                       Date(2014, 1, 31),
+                       Date(2014, 2, 3),
+                       Date(2014, 2, 4),
+                       Date(2014, 2, 5),
+                       Date(2014, 2, 6),
+                       Date(2014, 4, 7),
+                       Date(2014, 5, 1),
+                       Date(2014, 5, 2),
+                       Date(2014, 6, 2),
+                       Date(2014, 9, 8),
+                       Date(2014, 10, 1),
+                       Date(2014, 10, 2),
+                       Date(2014, 10, 3),
+                       Date(2014, 10, 6),
+                       Date(2014, 10, 7),
+                       Date(2015, 1, 1),
+                       Date(2015, 1, 2),
+                       Date(2015, 2, 18),
+                       Date(2015, 2, 19),
+                       Date(2015, 2, 20),
+                       Date(2015, 2, 23),
+                       Date(2015, 2, 24),
+                       Date(2015, 4, 6),
+                       Date(2015, 5, 1),
+                       Date(2015, 6, 22),
+                       Date(2015, 9, 3),
+                       Date(2015, 9, 4),
+                       Date(2015, 10, 1),
+                       Date(2015, 10, 2),
+                       Date(2015, 10, 5),
+                       Date(2015, 10, 6),
+                       Date(2015, 10, 7),
+                       Date(2016, 1, 1),
+                       Date(2016, 2, 8),
+                       Date(2016, 2, 9),
+                       Date(2016, 2, 10),
+                       Date(2016, 2, 11),
+                       Date(2016, 2, 12),
+                       Date(2016, 4, 4),
+                       Date(2016, 5, 1),
+                       Date(2016, 5, 2),
+                       Date(2016, 6, 9),
+                       Date(2016, 6, 10),
+                       Date(2016, 9, 15),
+                       Date(2016, 9, 16),
+                       Date(2016, 10, 3),
+                       Date(2016, 10, 4),
+                       Date(2016, 10, 5),
+                       Date(2016, 10, 6),
+                       Date(2016, 10, 7),
+                       Date(2017, 1, 2),
+                       Date(2017, 1, 27),
+                       Date(2017, 1, 30),
+                       Date(2017, 1, 31),
+                       Date(2017, 2, 1),
+                       Date(2017, 2, 2),
+                       Date(2017, 4, 3),
+                       Date(2017, 4, 4),
+                       Date(2017, 5, 1),
+                       Date(2017, 5, 29),
+                       Date(2017, 5, 30),
+                       Date(2017, 10, 2),
+                       Date(2017, 10, 3),
+                       Date(2017, 10, 4),
+                       Date(2017, 10, 5),
+                       Date(2017, 10, 6),
+                       Date(2018, 1, 1),
+                       Date(2018, 2, 15),
+                       Date(2018, 2, 16),
+                       Date(2018, 2, 19),
+                       Date(2018, 2, 20),
+                       Date(2018, 2, 21),
+                       Date(2018, 4, 5),
+                       Date(2018, 4, 6),
+                       Date(2018, 4, 30),
+                       Date(2018, 5, 1),
+                       Date(2018, 6, 18),
+                       Date(2018, 9, 24),
+                       Date(2018, 10, 1),
+                       Date(2018, 10, 2),
+                       Date(2018, 10, 3),
+                       Date(2018, 10, 4),
+                       Date(2018, 10, 5),
+                       Date(2019, 1, 1),
+                       Date(2019, 2, 4),
+                       Date(2019, 2, 5),
+                       Date(2019, 2, 6),
+                       Date(2019, 2, 7),
+                       Date(2019, 2, 8),
+                       Date(2019, 4, 5),
+                       Date(2019, 5, 1),
+                       Date(2019, 6, 7),
+                       Date(2019, 9, 13),
+                       Date(2019, 10, 1),
+                       Date(2019, 10, 2),
+                       Date(2019, 10, 3),
+                       Date(2019, 10, 4)}
+        sse_holDays = _serial_bits(dates)
+    return sse_holDays
+
+cdef array.array nyse_holidays = None
+
+
+cdef array.array _nyse_holidays():
+    global nyse_holidays
+    if nyse_holidays is None:
+        dates = {
+            Date(1900, 1, 1), Date(1900, 2, 12), Date(1900, 2, 22),
+            Date(1900, 4, 13), Date(1900, 5, 30), Date(1900, 7, 4),
+            Date(1900, 9, 3), Date(1900, 10, 12), Date(1900, 11, 6),
+            Date(1900, 11, 29), Date(1900, 12, 25), Date(1901, 1, 1),
+            Date(1901, 2, 12), Date(1901, 2, 22), Date(1901, 4, 5),
+            Date(1901, 5, 30), Date(1901, 7, 4), Date(1901, 9, 2),
+            Date(1901, 10, 12), Date(1901, 11, 5), Date(1901, 11, 28),
+            Date(1901, 12, 25), Date(1902, 1, 1), Date(1902, 2, 12),
+            Date(1902, 2, 22), Date(1902, 3, 28), Date(1902, 5, 30),
+            Date(1902, 7, 4), Date(1902, 9, 1), Date(1902, 10, 13),
+            Date(1902, 11, 4), Date(1902, 11, 27), Date(1902, 12, 25),
+            Date(1903, 1, 1), Date(1903, 2, 12), Date(1903, 2, 23),
+            Date(1903, 4, 10), Date(1903, 5, 30), Date(1903, 7, 4),
+            Date(1903, 9, 7), Date(1903, 10, 12), Date(1903, 11, 3),
+            Date(1903, 11, 26), Date(1903, 12, 25), Date(1904, 1, 1),
+            Date(1904, 2, 12), Date(1904, 2, 22), Date(1904, 4, 1),
+            Date(1904, 5, 30), Date(1904, 7, 4), Date(1904, 9, 5),
+            Date(1904, 10, 12), Date(1904, 11, 8), Date(1904, 11, 24),
+            Date(1904, 12, 26), Date(1905, 1, 2), Date(1905, 2, 13),
+            Date(1905, 2, 22), Date(1905, 4, 21), Date(1905, 5, 30),
+            Date(1905, 7, 4), Date(1905, 9, 4), Date(1905, 10, 12),
+            Date(1905, 11, 7), Date(1905, 11, 30), Date(1905, 12, 25),
+            Date(1906, 1, 1), Date(1906, 2, 12), Date(1906, 2, 22),
+            Date(1906, 4, 13), Date(1906, 5, 30), Date(1906, 7, 4),
+            Date(1906, 9, 3), Date(1906, 10, 12), Date(1906, 11, 6),
+            Date(1906, 11, 29), Date(1906, 12, 25), Date(1907, 1, 1),
+            Date(1907, 2, 12), Date(1907, 2, 22), Date(1907, 3, 29),
+            Date(1907, 5, 30), Date(1907, 7, 4), Date(1907, 9, 2),
+            Date(1907, 10, 12), Date(1907, 11, 5), Date(1907, 11, 28),
+            Date(1907, 12, 25), Date(1908, 1, 1), Date(1908, 2, 12),
+            Date(1908, 2, 22), Date(1908, 4, 17), Date(1908, 5, 30),
+            Date(1908, 7, 4), Date(1908, 9, 7), Date(1908, 10, 12),
+            Date(1908, 11, 3), Date(1908, 11, 26), Date(1908, 12, 25),
+            Date(1909, 1, 1), Date(1909, 2, 12), Date(1909, 2, 22),
+            Date(1909, 4, 9), Date(1909, 5, 31), Date(1909, 7, 5),
+            Date(1909, 9, 6), Date(1909, 10, 12), Date(1909, 11, 2),
+            Date(1909, 11, 25), Date(1909, 12, 25), Date(1910, 1, 1),
+            Date(1910, 2, 12), Date(1910, 2, 22), Date(1910, 3, 25),
+            Date(1910, 5, 30), Date(1910, 7, 4), Date(1910, 9, 5),
+            Date(1910, 10, 12), Date(1910, 11, 8), Date(1910, 11, 24),
+            Date(1910, 12, 26), Date(1911, 1, 2), Date(1911, 2, 13),
+            Date(1911, 2, 22), Date(1911, 4, 14), Date(1911, 5, 30),
+            Date(1911, 7, 4), Date(1911, 9, 4), Date(1911, 10, 12),
+            Date(1911, 11, 7), Date(1911, 11, 30), Date(1911, 12, 25),
+            Date(1912, 1, 1), Date(1912, 2, 12), Date(1912, 2, 22),
+            Date(1912, 4, 5), Date(1912, 5, 30), Date(1912, 7, 4),
+            Date(1912, 9, 2), Date(1912, 10, 12), Date(1912, 11, 5),
+            Date(1912, 11, 28), Date(1912, 12, 25), Date(1913, 1, 1),
+            Date(1913, 2, 12), Date(1913, 2, 22), Date(1913, 3, 21),
+            Date(1913, 5, 30), Date(1913, 7, 4), Date(1913, 9, 1),
+            Date(1913, 10, 13), Date(1913, 11, 4), Date(1913, 11, 27),
+            Date(1913, 12, 25), Date(1914, 1, 1), Date(1914, 2, 12),
+            Date(1914, 2, 23), Date(1914, 4, 10), Date(1914, 5, 30),
+            Date(1914, 7, 4), Date(1914, 9, 7), Date(1914, 10, 12),
+            Date(1914, 11, 3), Date(1914, 11, 26), Date(1914, 12, 25),
+            Date(1915, 1, 1), Date(1915, 2, 12), Date(1915, 2, 22),
+            Date(1915, 4, 2), Date(1915, 5, 31), Date(1915, 7, 5),
+            Date(1915, 9, 6), Date(1915, 10, 12), Date(1915, 11, 2),
+            Date(1915, 11, 25), Date(1915, 12, 25), Date(1916, 1, 1),
+            Date(1916, 2, 12), Date(1916, 2, 22), Date(1916, 4, 21),
+            Date(1916, 5, 30), Date(1916, 7, 4), Date(1916, 9, 4),
+            Date(1916, 10, 12), Date(1916, 11, 7), Date(1916, 11, 30),
+            Date(1916, 12, 25), Date(1917, 1, 1), Date(1917, 2, 12),
+            Date(1917, 2, 22), Date(1917, 4, 6), Date(1917, 5, 30),
+            Date(1917, 7, 4), Date(1917, 9, 3), Date(1917, 10, 12),
+            Date(1917, 11, 6), Date(1917, 11, 29), Date(1917, 12, 25),
+            Date(1918, 1, 1), Date(1918, 2, 12), Date(1918, 2, 22),
+            Date(1918, 3, 29), Date(1918, 5, 30), Date(1918, 7, 4),
+            Date(1918, 9, 2), Date(1918, 10, 12), Date(1918, 11, 5),
+            Date(1918, 11, 28), Date(1918, 12, 25), Date(1919, 1, 1),
+            Date(1919, 2, 12), Date(1919, 2, 22), Date(1919, 4, 18),
+            Date(1919, 5, 30), Date(1919, 7, 4), Date(1919, 9, 1),
+            Date(1919, 10, 13), Date(1919, 11, 4), Date(1919, 11, 27),
+            Date(1919, 12, 25), Date(1920, 1, 1), Date(1920, 2, 12),
+            Date(1920, 2, 23), Date(1920, 4, 2), Date(1920, 5, 31),
+            Date(1920, 7, 5), Date(1920, 9, 6), Date(1920, 10, 12),
+            Date(1920, 11, 2), Date(1920, 11, 25), Date(1920, 12, 25),
+            Date(1921, 1, 1), Date(1921, 2, 12), Date(1921, 2, 22),
+            Date(1921, 3, 25), Date(1921, 5, 30), Date(1921, 7, 4),
+            Date(1921, 9, 5), Date(1921, 10, 12), Date(1921, 11, 8),
+            Date(1921, 11, 24), Date(1921, 12, 26), Date(1922, 1, 2),
+            Date(1922, 2, 13), Date(1922, 2, 22), Date(1922, 4, 14),
+            Date(1922, 5, 30), Date(1922, 7, 4), Date(1922, 9, 4),
+            Date(1922, 10, 12), Date(1922, 11, 7), Date(1922, 11, 30),
+            Date(1922, 12, 25), Date(1923, 1, 1), Date(1923, 2, 12),
+            Date(1923, 2, 22), Date(1923, 3, 30), Date(1923, 5, 30),
+            Date(1923, 7, 4), Date(1923, 9, 3), Date(1923, 10, 12),
+            Date(1923, 11, 6), Date(1923, 11, 29), Date(1923, 12, 25),
+            Date(1924, 1, 1), Date(1924, 2, 12), Date(1924, 2, 22),
+            Date(1924, 4, 18), Date(1924, 5, 30), Date(1924, 7, 4),
+            Date(1924, 9, 1), Date(1924, 10, 13), Date(1924, 11, 4),
+            Date(1924, 11, 27), Date(1924, 12, 25), Date(1925, 1, 1),
+            Date(1925, 2, 12), Date(1925, 2, 23), Date(1925, 4, 10),
+            Date(1925, 5, 30), Date(1925, 7, 4), Date(1925, 9, 7),
+            Date(1925, 10, 12), Date(1925, 11, 3), Date(1925, 11, 26),
+            Date(1925, 12, 25), Date(1926, 1, 1), Date(1926, 2, 12),
+            Date(1926, 2, 22), Date(1926, 4, 2), Date(1926, 5, 31),
+            Date(1926, 7, 5), Date(1926, 9, 6), Date(1926, 10, 12),
+            Date(1926, 11, 2), Date(1926, 11, 25), Date(1926, 12, 25),
+            Date(1927, 1, 1), Date(1927, 2, 12), Date(1927, 2, 22),
+            Date(1927, 4, 15), Date(1927, 5, 30), Date(1927, 7, 4),
+            Date(1927, 9, 5), Date(1927, 10, 12), Date(1927, 11, 8),
+            Date(1927, 11, 24), Date(1927, 12, 26), Date(1928, 1, 2),
+            Date(1928, 2, 13), Date(1928, 2, 22), Date(1928, 4, 6),
+            Date(1928, 5, 30), Date(1928, 7, 4), Date(1928, 9, 3),
+            Date(1928, 10, 12), Date(1928, 11, 6), Date(1928, 11, 29),
+            Date(1928, 12, 25), Date(1929, 1, 1), Date(1929, 2, 12),
+            Date(1929, 2, 22), Date(1929, 3, 29), Date(1929, 5, 30),
+            Date(1929, 7, 4), Date(1929, 9, 2), Date(1929, 10, 12),
+            Date(1929, 11, 1), Date(1929, 11, 5), Date(1929, 11, 28),
+            Date(1929, 11, 29), Date(1929, 12, 25), Date(1930, 1, 1),
+            Date(1930, 2, 12), Date(1930, 2, 22), Date(1930, 4, 18),
+            Date(1930, 5, 30), Date(1930, 7, 4), Date(1930, 9, 1),
+            Date(1930, 10, 13), Date(1930, 11, 4), Date(1930, 11, 27),
+            Date(1930, 12, 25), Date(1931, 1, 1), Date(1931, 2, 12),
+            Date(1931, 2, 23), Date(1931, 4, 3), Date(1931, 5, 30),
+            Date(1931, 7, 4), Date(1931, 9, 7), Date(1931, 10, 12),
+            Date(1931, 11, 3), Date(1931, 11, 26), Date(1931, 12, 25),
+            Date(1932, 1, 1), Date(1932, 2, 12), Date(1932, 2, 22),
+            Date(1932, 3, 25), Date(1932, 5, 30), Date(1932, 7, 4),
+            Date(1932, 9, 5), Date(1932, 10, 12), Date(1932, 11, 8),
+            Date(1932, 11, 24), Date(1932, 12, 26), Date(1933, 1, 2),
+            Date(1933, 2, 13), Date(1933, 2, 22), Date(1933, 3, 6),
+            Date(1933, 3, 7), Date(1933, 3, 8), Date(1933, 3, 9),
+            Date(1933, 3, 10), Date(1933, 3, 11), Date(1933, 3, 12),
+            Date(1933, 3, 13), Date(1933, 3, 14), Date(1933, 4, 14),
+            Date(1933, 5, 30), Date(1933, 7, 4), Date(1933, 9, 4),
+            Date(1933, 10, 12), Date(1933, 11, 7), Date(1933, 11, 30),
+            Date(1933, 12, 25), Date(1934, 1, 1), Date(1934, 2, 12),
+            Date(1934, 2, 22), Date(1934, 3, 30), Date(1934, 5, 30),
+            Date(1934, 7, 4), Date(1934, 9, 3), Date(1934, 10, 12),
+            Date(1934, 11, 6), Date(1934, 11, 12), Date(1934, 11, 29),
+            Date(1934, 12, 25), Date(1935, 1, 1), Date(1935, 2, 12),
+            Date(1935, 2, 22), Date(1935, 4, 19), Date(1935, 5, 30),
+            Date(1935, 7, 4), Date(1935, 9, 2), Date(1935, 10, 12),
+            Date(1935, 11, 5), Date(1935, 11, 11), Date(1935, 11, 28),
+            Date(1935, 12, 25), Date(1936, 1, 1), Date(1936, 2, 12),
+            Date(1936, 2, 22), Date(1936, 4, 10), Date(1936, 5, 30),
+            Date(1936, 7, 4), Date(1936, 9, 7), Date(1936, 10, 12),
+            Date(1936, 11, 3), Date(1936, 11, 11), Date(1936, 11, 26),
+            Date(1936, 12, 25), Date(1937, 1, 1), Date(1937, 2, 12),
+            Date(1937, 2, 22), Date(1937, 3, 26), Date(1937, 5, 31),
+            Date(1937, 7, 5), Date(1937, 9, 6), Date(1937, 10, 12),
+            Date(1937, 11, 2), Date(1937, 11, 11), Date(1937, 11, 25),
+            Date(1937, 12, 25), Date(1938, 1, 1), Date(1938, 2, 12),
+            Date(1938, 2, 22), Date(1938, 4, 15), Date(1938, 5, 30),
+            Date(1938, 7, 4), Date(1938, 9, 5), Date(1938, 10, 12),
+            Date(1938, 11, 8), Date(1938, 11, 11), Date(1938, 11, 24),
+            Date(1938, 12, 26), Date(1939, 1, 2), Date(1939, 2, 13),
+            Date(1939, 2, 22), Date(1939, 4, 7), Date(1939, 5, 30),
+            Date(1939, 7, 4), Date(1939, 9, 4), Date(1939, 10, 12),
+            Date(1939, 11, 7), Date(1939, 11, 11), Date(1939, 11, 23),
+            Date(1939, 12, 25), Date(1940, 1, 1), Date(1940, 2, 12),
+            Date(1940, 2, 22), Date(1940, 3, 22), Date(1940, 5, 30),
+            Date(1940, 7, 4), Date(1940, 9, 2), Date(1940, 10, 12),
+            Date(1940, 11, 5), Date(1940, 11, 11), Date(1940, 11, 21),
+            Date(1940, 12, 25), Date(1941, 1, 1), Date(1941, 2, 12),
+            Date(1941, 2, 22), Date(1941, 4, 11), Date(1941, 5, 30),
+            Date(1941, 7, 4), Date(1941, 9, 1), Date(1941, 10, 13),
+            Date(1941, 11, 4), Date(1941, 11, 11), Date(1941, 11, 20),
+            Date(1941, 12, 25), Date(1942, 1, 1), Date(1942, 2, 12),
+            Date(1942, 2, 23), Date(1942, 4, 3), Date(1942, 5, 30),
+            Date(1942, 7, 4), Date(1942, 9, 7), Date(1942, 10, 12),
+            Date(1942, 11, 3), Date(1942, 11, 11), Date(1942, 11, 26),
+            Date(1942, 12, 25), Date(1943, 1, 1), Date(1943, 2, 12),
+            Date(1943, 2, 22), Date(1943, 4, 23), Date(1943, 5, 31),
+            Date(1943, 7, 5), Date(1943, 9, 6), Date(1943, 10, 12),
+            Date(1943, 11, 2), Date(1943, 11, 11), Date(1943, 11, 25),
+            Date(1943, 12, 25), Date(1944, 1, 1), Date(1944, 2, 12),
+            Date(1944, 2, 22), Date(1944, 4, 7), Date(1944, 5, 30),
+            Date(1944, 7, 4), Date(1944, 9, 4), Date(1944, 10, 12),
+            Date(1944, 11, 7), Date(1944, 11, 11), Date(1944, 11, 23),
+            Date(1944, 12, 25), Date(1945, 1, 1), Date(1945, 2, 12),
+            Date(1945, 2, 22), Date(1945, 3, 30), Date(1945, 5, 30),
+            Date(1945, 7, 4), Date(1945, 8, 15), Date(1945, 8, 16),
+            Date(1945, 9, 3), Date(1945, 10, 12), Date(1945, 11, 6),
+            Date(1945, 11, 12), Date(1945, 11, 22), Date(1945, 12, 24),
+            Date(1945, 12, 25), Date(1946, 1, 1), Date(1946, 2, 12),
+            Date(1946, 2, 22), Date(1946, 4, 19), Date(1946, 5, 30),
+            Date(1946, 7, 4), Date(1946, 9, 2), Date(1946, 10, 12),
+            Date(1946, 11, 5), Date(1946, 11, 11), Date(1946, 11, 28),
+            Date(1946, 12, 25), Date(1947, 1, 1), Date(1947, 2, 12),
+            Date(1947, 2, 22), Date(1947, 4, 4), Date(1947, 5, 30),
+            Date(1947, 7, 4), Date(1947, 9, 1), Date(1947, 10, 13),
+            Date(1947, 11, 4), Date(1947, 11, 11), Date(1947, 11, 27),
+            Date(1947, 12, 25), Date(1948, 1, 1), Date(1948, 2, 12),
+            Date(1948, 2, 23), Date(1948, 3, 26), Date(1948, 5, 31),
+            Date(1948, 7, 5), Date(1948, 9, 6), Date(1948, 10, 12),
+            Date(1948, 11, 2), Date(1948, 11, 11), Date(1948, 11, 25),
+            Date(1948, 12, 25), Date(1949, 1, 1), Date(1949, 2, 12),
+            Date(1949, 2, 22), Date(1949, 4, 15), Date(1949, 5, 30),
+            Date(1949, 7, 4), Date(1949, 9, 5), Date(1949, 10, 12),
+            Date(1949, 11, 8), Date(1949, 11, 11), Date(1949, 11, 24),
+            Date(1949, 12, 26), Date(1950, 1, 2), Date(1950, 2, 13),
+            Date(1950, 2, 22), Date(1950, 4, 7), Date(1950, 5, 30),
+            Date(1950, 7, 4), Date(1950, 9, 4), Date(1950, 10, 12),
+            Date(1950, 11, 7), Date(1950, 11, 11), Date(1950, 11, 23),
+            Date(1950, 12, 25), Date(1951, 1, 1), Date(1951, 2, 12),
+            Date(1951, 2, 22), Date(1951, 3, 23), Date(1951, 5, 30),
+            Date(1951, 7, 4), Date(1951, 9, 3), Date(1951, 10, 12),
+            Date(1951, 11, 6), Date(1951, 11, 12), Date(1951, 11, 22),
+            Date(1951, 12, 25), Date(1952, 1, 1), Date(1952, 2, 12),
+            Date(1952, 2, 22), Date(1952, 4, 11), Date(1952, 5, 30),
+            Date(1952, 7, 4), Date(1952, 9, 1), Date(1952, 10, 13),
+            Date(1952, 11, 4), Date(1952, 11, 11), Date(1952, 11, 27),
+            Date(1952, 12, 25), Date(1953, 1, 1), Date(1953, 2, 12),
+            Date(1953, 2, 23), Date(1953, 4, 3), Date(1953, 5, 30),
+            Date(1953, 7, 4), Date(1953, 9, 7), Date(1953, 10, 12),
+            Date(1953, 11, 3), Date(1953, 11, 11), Date(1953, 11, 26),
+            Date(1953, 12, 25), Date(1954, 1, 1), Date(1954, 2, 22),
+            Date(1954, 4, 16), Date(1954, 5, 31), Date(1954, 7, 5),
+            Date(1954, 9, 6), Date(1954, 11, 2), Date(1954, 11, 25),
+            Date(1954, 12, 24), Date(1955, 1, 1), Date(1955, 2, 22),
+            Date(1955, 4, 8), Date(1955, 5, 30), Date(1955, 7, 4),
+            Date(1955, 9, 5), Date(1955, 11, 8), Date(1955, 11, 24),
+            Date(1955, 12, 26), Date(1956, 1, 2), Date(1956, 2, 22),
+            Date(1956, 3, 30), Date(1956, 5, 30), Date(1956, 7, 4),
+            Date(1956, 9, 3), Date(1956, 11, 6), Date(1956, 11, 22),
+            Date(1956, 12, 24), Date(1956, 12, 25), Date(1957, 1, 1),
+            Date(1957, 2, 22), Date(1957, 4, 19), Date(1957, 5, 30),
+            Date(1957, 7, 4), Date(1957, 9, 2), Date(1957, 11, 5),
+            Date(1957, 11, 28), Date(1957, 12, 25), Date(1958, 1, 1),
+            Date(1958, 2, 22), Date(1958, 4, 4), Date(1958, 5, 30),
+            Date(1958, 7, 4), Date(1958, 9, 1), Date(1958, 11, 4),
+            Date(1958, 11, 27), Date(1958, 12, 25), Date(1958, 12, 26),
+            Date(1959, 1, 1), Date(1959, 2, 23), Date(1959, 3, 27),
+            Date(1959, 5, 30), Date(1959, 7, 3), Date(1959, 9, 7),
+            Date(1959, 11, 3), Date(1959, 11, 26), Date(1959, 12, 25),
+            Date(1960, 1, 1), Date(1960, 2, 22), Date(1960, 4, 15),
+            Date(1960, 5, 30), Date(1960, 7, 4), Date(1960, 9, 5),
+            Date(1960, 11, 8), Date(1960, 11, 24), Date(1960, 12, 26),
+            Date(1961, 1, 2), Date(1961, 2, 22), Date(1961, 3, 31),
+            Date(1961, 5, 29), Date(1961, 5, 30), Date(1961, 7, 4),
+            Date(1961, 9, 4), Date(1961, 11, 7), Date(1961, 11, 23),
+            Date(1961, 12, 25), Date(1962, 1, 1), Date(1962, 2, 22),
+            Date(1962, 4, 20), Date(1962, 5, 30), Date(1962, 7, 4),
+            Date(1962, 9, 3), Date(1962, 11, 6), Date(1962, 11, 22),
+            Date(1962, 12, 25), Date(1963, 1, 1), Date(1963, 2, 22),
+            Date(1963, 4, 12), Date(1963, 5, 30), Date(1963, 7, 4),
+            Date(1963, 9, 2), Date(1963, 11, 5), Date(1963, 11, 25),
+            Date(1963, 11, 28), Date(1963, 12, 25), Date(1964, 1, 1),
+            Date(1964, 2, 21), Date(1964, 3, 27), Date(1964, 5, 29),
+            Date(1964, 7, 3), Date(1964, 9, 7), Date(1964, 11, 3),
+            Date(1964, 11, 26), Date(1964, 12, 25), Date(1965, 1, 1),
+            Date(1965, 2, 22), Date(1965, 4, 16), Date(1965, 5, 31),
+            Date(1965, 7, 5), Date(1965, 9, 6), Date(1965, 11, 2),
+            Date(1965, 11, 25), Date(1965, 12, 24), Date(1966, 1, 1),
+            Date(1966, 2, 22), Date(1966, 4, 8), Date(1966, 5, 30),
+            Date(1966, 7, 4), Date(1966, 9, 5), Date(1966, 11, 8),
+            Date(1966, 11, 24), Date(1966, 12, 26), Date(1967, 1, 2),
+            Date(1967, 2, 22), Date(1967, 3, 24), Date(1967, 5, 30),
+            Date(1967, 7, 4), Date(1967, 9, 4), Date(1967, 11, 7),
+            Date(1967, 11, 23), Date(1967, 12, 25), Date(1968, 1, 1),
+            Date(1968, 2, 12), Date(1968, 2, 22), Date(1968, 4, 9),
+            Date(1968, 4, 12), Date(1968, 5, 30), Date(1968, 6, 12),
+            Date(1968, 6, 19), Date(1968, 6, 26), Date(1968, 7, 4),
+            Date(1968, 7, 5), Date(1968, 7, 10), Date(1968, 7, 17),
+            Date(1968, 7, 24), Date(1968, 7, 31), Date(1968, 8, 7),
+            Date(1968, 8, 14), Date(1968, 8, 21), Date(1968, 8, 28),
+            Date(1968, 9, 2), Date(1968, 9, 11), Date(1968, 9, 18),
+            Date(1968, 9, 25), Date(1968, 10, 2), Date(1968, 10, 9),
+            Date(1968, 10, 16), Date(1968, 10, 23), Date(1968, 10, 30),
+            Date(1968, 11, 5), Date(1968, 11, 5), Date(1968, 11, 11),
+            Date(1968, 11, 20), Date(1968, 11, 28), Date(1968, 12, 4),
+            Date(1968, 12, 11), Date(1968, 12, 18), Date(1968, 12, 25),
+            Date(1968, 12, 25), Date(1969, 1, 1), Date(1969, 2, 10),
+            Date(1969, 2, 21), Date(1969, 3, 31), Date(1969, 4, 4),
+            Date(1969, 5, 30), Date(1969, 7, 4), Date(1969, 7, 21),
+            Date(1969, 9, 1), Date(1969, 11, 27), Date(1969, 12, 25),
+            Date(1970, 1, 1), Date(1970, 2, 23), Date(1970, 3, 27),
+            Date(1970, 7, 3), Date(1970, 9, 7), Date(1970, 11, 26),
+            Date(1970, 12, 25), Date(1971, 1, 1), Date(1971, 2, 15),
+            Date(1971, 4, 9), Date(1971, 5, 31), Date(1971, 7, 5),
+            Date(1971, 9, 6), Date(1971, 11, 25), Date(1971, 12, 24),
+            Date(1972, 1, 1), Date(1972, 2, 21), Date(1972, 3, 31),
+            Date(1972, 5, 29), Date(1972, 7, 4), Date(1972, 9, 4),
+            Date(1972, 11, 7), Date(1972, 11, 7), Date(1972, 11, 7),
+            Date(1972, 11, 7), Date(1972, 11, 23), Date(1972, 12, 25),
+            Date(1972, 12, 28), Date(1973, 1, 1), Date(1973, 1, 25),
+            Date(1973, 2, 19), Date(1973, 4, 20), Date(1973, 5, 28),
+            Date(1973, 7, 4), Date(1973, 9, 3), Date(1973, 11, 22),
+            Date(1973, 12, 25), Date(1974, 1, 1), Date(1974, 2, 18),
+            Date(1974, 4, 12), Date(1974, 5, 27), Date(1974, 7, 4),
+            Date(1974, 9, 2), Date(1974, 11, 28), Date(1974, 12, 25),
+            Date(1975, 1, 1), Date(1975, 2, 17), Date(1975, 3, 28),
+            Date(1975, 5, 26), Date(1975, 7, 4), Date(1975, 9, 1),
+            Date(1975, 11, 27), Date(1975, 12, 25), Date(1976, 1, 1),
+            Date(1976, 2, 16), Date(1976, 4, 16), Date(1976, 5, 31),
+            Date(1976, 7, 5), Date(1976, 9, 6), Date(1976, 11, 2),
+            Date(1976, 11, 2), Date(1976, 11, 2), Date(1976, 11, 2),
+            Date(1976, 11, 25), Date(1976, 12, 24), Date(1977, 1, 1),
+            Date(1977, 2, 21), Date(1977, 4, 8), Date(1977, 5, 30),
+            Date(1977, 7, 4), Date(1977, 7, 14), Date(1977, 9, 5),
+            Date(1977, 11, 24), Date(1977, 12, 26), Date(1978, 1, 2),
+            Date(1978, 2, 20), Date(1978, 3, 24), Date(1978, 5, 29),
+            Date(1978, 7, 4), Date(1978, 9, 4), Date(1978, 11, 23),
+            Date(1978, 12, 25), Date(1979, 1, 1), Date(1979, 2, 19),
+            Date(1979, 4, 13), Date(1979, 5, 28), Date(1979, 7, 4),
+            Date(1979, 9, 3), Date(1979, 11, 22), Date(1979, 12, 25),
+            Date(1980, 1, 1), Date(1980, 2, 18), Date(1980, 4, 4),
+            Date(1980, 5, 26), Date(1980, 7, 4), Date(1980, 9, 1),
+            Date(1980, 11, 4), Date(1980, 11, 4), Date(1980, 11, 4),
+            Date(1980, 11, 4), Date(1980, 11, 27), Date(1980, 12, 25),
+            Date(1981, 1, 1), Date(1981, 2, 16), Date(1981, 4, 17),
+            Date(1981, 5, 25), Date(1981, 7, 3), Date(1981, 9, 7),
+            Date(1981, 11, 26), Date(1981, 12, 25), Date(1982, 1, 1),
+            Date(1982, 2, 15), Date(1982, 4, 9), Date(1982, 5, 31),
+            Date(1982, 7, 5), Date(1982, 9, 6), Date(1982, 11, 25),
+            Date(1982, 12, 24), Date(1983, 1, 1), Date(1983, 2, 21),
+            Date(1983, 4, 1), Date(1983, 5, 30), Date(1983, 7, 4),
+            Date(1983, 9, 5), Date(1983, 11, 24), Date(1983, 12, 26),
+            Date(1984, 1, 2), Date(1984, 2, 20), Date(1984, 4, 20),
+            Date(1984, 5, 28), Date(1984, 7, 4), Date(1984, 9, 3),
+            Date(1984, 11, 22), Date(1984, 12, 25), Date(1985, 1, 1),
+            Date(1985, 2, 18), Date(1985, 4, 5), Date(1985, 5, 27),
+            Date(1985, 7, 4), Date(1985, 9, 2), Date(1985, 9, 27),
+            Date(1985, 11, 28), Date(1985, 12, 25), Date(1986, 1, 1),
+            Date(1986, 2, 17), Date(1986, 3, 28), Date(1986, 5, 26),
+            Date(1986, 7, 4), Date(1986, 9, 1), Date(1986, 11, 27),
+            Date(1986, 12, 25), Date(1987, 1, 1), Date(1987, 2, 16),
+            Date(1987, 4, 17), Date(1987, 5, 25), Date(1987, 7, 3),
+            Date(1987, 9, 7), Date(1987, 11, 26), Date(1987, 12, 25),
+            Date(1988, 1, 1), Date(1988, 2, 15), Date(1988, 4, 1),
+            Date(1988, 5, 30), Date(1988, 7, 4), Date(1988, 9, 5),
+            Date(1988, 11, 24), Date(1988, 12, 26), Date(1989, 1, 2),
+            Date(1989, 2, 20), Date(1989, 3, 24), Date(1989, 5, 29),
+            Date(1989, 7, 4), Date(1989, 9, 4), Date(1989, 11, 23),
+            Date(1989, 12, 25), Date(1990, 1, 1), Date(1990, 2, 19),
+            Date(1990, 4, 13), Date(1990, 5, 28), Date(1990, 7, 4),
+            Date(1990, 9, 3), Date(1990, 11, 22), Date(1990, 12, 25),
+            Date(1991, 1, 1), Date(1991, 2, 18), Date(1991, 3, 29),
+            Date(1991, 5, 27), Date(1991, 7, 4), Date(1991, 9, 2),
+            Date(1991, 11, 28), Date(1991, 12, 25), Date(1992, 1, 1),
+            Date(1992, 2, 17), Date(1992, 4, 17), Date(1992, 5, 25),
+            Date(1992, 7, 3), Date(1992, 9, 7), Date(1992, 11, 26),
+            Date(1992, 12, 25), Date(1993, 1, 1), Date(1993, 2, 15),
+            Date(1993, 4, 9), Date(1993, 5, 31), Date(1993, 7, 5),
+            Date(1993, 9, 6), Date(1993, 11, 25), Date(1993, 12, 24),
+            Date(1994, 1, 1), Date(1994, 2, 21), Date(1994, 4, 1),
+            Date(1994, 4, 27), Date(1994, 5, 30), Date(1994, 7, 4),
+            Date(1994, 9, 5), Date(1994, 11, 24), Date(1994, 12, 26),
+            Date(1995, 1, 2), Date(1995, 2, 20), Date(1995, 4, 14),
+            Date(1995, 5, 29), Date(1995, 7, 4), Date(1995, 9, 4),
+            Date(1995, 11, 23), Date(1995, 12, 25), Date(1996, 1, 1),
+            Date(1996, 2, 19), Date(1996, 4, 5), Date(1996, 5, 27),
+            Date(1996, 7, 4), Date(1996, 9, 2), Date(1996, 11, 28),
+            Date(1996, 12, 25), Date(1997, 1, 1), Date(1997, 2, 17),
+            Date(1997, 3, 28), Date(1997, 5, 26), Date(1997, 7, 4),
+            Date(1997, 9, 1), Date(1997, 11, 27), Date(1997, 12, 25),
+            Date(1998, 1, 1), Date(1998, 1, 19), Date(1998, 2, 16),
+            Date(1998, 4, 10), Date(1998, 5, 25), Date(1998, 7, 3),
+            Date(1998, 9, 7), Date(1998, 11, 26), Date(1998, 12, 25),
+            Date(1999, 1, 1), Date(1999, 1, 18), Date(1999, 2, 15),
+            Date(1999, 4, 2), Date(1999, 5, 31), Date(1999, 7, 5),
+            Date(1999, 9, 6), Date(1999, 11, 25), Date(1999, 12, 24),
+            Date(2000, 1, 1), Date(2000, 1, 17), Date(2000, 2, 21),
+            Date(2000, 4, 21), Date(2000, 5, 29), Date(2000, 7, 4),
+            Date(2000, 9, 4), Date(2000, 11, 23), Date(2000, 12, 25),
+            Date(2001, 1, 1), Date(2001, 1, 15), Date(2001, 2, 19),
+            Date(2001, 4, 13), Date(2001, 5, 28), Date(2001, 7, 4),
+            Date(2001, 9, 3), Date(2001, 9, 11), Date(2001, 9, 12),
+            Date(2001, 9, 13), Date(2001, 9, 14), Date(2001, 9, 15),
+            Date(2001, 9, 16), Date(2001, 11, 22), Date(2001, 12, 25),
+            Date(2002, 1, 1), Date(2002, 1, 21), Date(2002, 2, 18),
+            Date(2002, 3, 29), Date(2002, 5, 27), Date(2002, 7, 4),
+            Date(2002, 9, 2), Date(2002, 11, 28), Date(2002, 12, 25),
+            Date(2003, 1, 1), Date(2003, 1, 20), Date(2003, 2, 17),
+            Date(2003, 4, 18), Date(2003, 5, 26), Date(2003, 7, 4),
+            Date(2003, 9, 1), Date(2003, 11, 27), Date(2003, 12, 25),
+            Date(2004, 1, 1), Date(2004, 1, 19), Date(2004, 2, 16),
+            Date(2004, 4, 9), Date(2004, 5, 31), Date(2004, 6, 11),
+            Date(2004, 7, 5), Date(2004, 9, 6), Date(2004, 11, 25),
+            Date(2004, 12, 24), Date(2005, 1, 1), Date(2005, 1, 17),
+            Date(2005, 2, 21), Date(2005, 3, 25), Date(2005, 5, 30),
+            Date(2005, 7, 4), Date(2005, 9, 5), Date(2005, 11, 24),
+            Date(2005, 12, 26), Date(2006, 1, 2), Date(2006, 1, 16),
+            Date(2006, 2, 20), Date(2006, 4, 14), Date(2006, 5, 29),
+            Date(2006, 7, 4), Date(2006, 9, 4), Date(2006, 11, 23),
+            Date(2006, 12, 25), Date(2007, 1, 1), Date(2007, 1, 2),
+            Date(2007, 1, 15), Date(2007, 2, 19), Date(2007, 4, 6),
+            Date(2007, 5, 28), Date(2007, 7, 4), Date(2007, 9, 3),
+            Date(2007, 11, 22), Date(2007, 12, 25), Date(2008, 1, 1),
+            Date(2008, 1, 21), Date(2008, 2, 18), Date(2008, 3, 21),
+            Date(2008, 5, 26), Date(2008, 7, 4), Date(2008, 9, 1),
+            Date(2008, 11, 27), Date(2008, 12, 25), Date(2009, 1, 1),
+            Date(2009, 1, 19), Date(2009, 2, 16), Date(2009, 4, 10),
+            Date(2009, 5, 25), Date(2009, 7, 3), Date(2009, 9, 7),
+            Date(2009, 11, 26), Date(2009, 12, 25), Date(2010, 1, 1),
+            Date(2010, 1, 18), Date(2010, 2, 15), Date(2010, 4, 2),
+            Date(2010, 5, 31), Date(2010, 7, 5), Date(2010, 9, 6),
+            Date(2010, 11, 25), Date(2010, 12, 24), Date(2011, 1, 1),
+            Date(2011, 1, 17), Date(2011, 2, 21), Date(2011, 4, 22),
+            Date(2011, 5, 30), Date(2011, 7, 4), Date(2011, 9, 5),
+            Date(2011, 11, 24), Date(2011, 12, 26), Date(2012, 1, 2),
+            Date(2012, 1, 16), Date(2012, 2, 20), Date(2012, 4, 6),
+            Date(2012, 5, 28), Date(2012, 7, 4), Date(2012, 9, 3),
+            Date(2012, 10, 29), Date(2012, 10, 30), Date(2012, 11, 22),
+            Date(2012, 12, 25), Date(2013, 1, 1), Date(2013, 1, 21),
+            Date(2013, 2, 18), Date(2013, 3, 29), Date(2013, 5, 27),
+            Date(2013, 7, 4), Date(2013, 9, 2), Date(2013, 11, 28),
+            Date(2013, 12, 25), Date(2014, 1, 1), Date(2014, 1, 20),
+            Date(2014, 2, 17), Date(2014, 4, 18), Date(2014, 5, 26),
+            Date(2014, 7, 4), Date(2014, 9, 1), Date(2014, 11, 27),
+            Date(2014, 12, 25), Date(2015, 1, 1), Date(2015, 1, 19),
+            Date(2015, 2, 16), Date(2015, 4, 3), Date(2015, 5, 25),
+            Date(2015, 7, 3), Date(2015, 9, 7), Date(2015, 11, 26),
+            Date(2015, 12, 25), Date(2016, 1, 1), Date(2016, 1, 18),
+            Date(2016, 2, 15), Date(2016, 3, 25), Date(2016, 5, 30),
+            Date(2016, 7, 4), Date(2016, 9, 5), Date(2016, 11, 24),
+            Date(2016, 12, 26), Date(2017, 1, 2), Date(2017, 1, 16),
+            Date(2017, 2, 20), Date(2017, 4, 14), Date(2017, 5, 29),
+            Date(2017, 7, 4), Date(2017, 9, 4), Date(2017, 11, 23),
+            Date(2017, 12, 25), Date(2018, 1, 1), Date(2018, 1, 15),
+            Date(2018, 2, 19), Date(2018, 3, 30), Date(2018, 5, 28),
+            Date(2018, 7, 4), Date(2018, 9, 3), Date(2018, 11, 22),
+            Date(2018, 12, 25), Date(2019, 1, 1), Date(2019, 1, 21),
+            Date(2019, 2, 18), Date(2019, 4, 19), Date(2019, 5, 27),
+            Date(2019, 7, 4), Date(2019, 9, 2), Date(2019, 11, 28),
+            Date(2019, 12, 25), Date(2020, 1, 1), Date(2020, 1, 20),
+            Date(2020, 2, 17), Date(2020, 4, 10), Date(2020, 5, 25),
+            Date(2020, 7, 3), Date(2020, 9, 7), Date(2020, 11, 26),
+            Date(2020, 12, 25), Date(2021, 1, 1), Date(2021, 1, 18),
+            Date(2021, 2, 15), Date(2021, 4, 2), Date(2021, 5, 31),
+            Date(2021, 7, 5), Date(2021, 9, 6), Date(2021, 11, 25),
+            Date(2021, 12, 24), Date(2022, 1, 1), Date(2022, 1, 17),
+            Date(2022, 2, 21), Date(2022, 4, 15), Date(2022, 5, 30),
+            Date(2022, 7, 4), Date(2022, 9, 5), Date(2022, 11, 24),
+            Date(2022, 12, 26), Date(2023, 1, 2), Date(2023, 1, 16),
+            Date(2023, 2, 20), Date(2023, 4, 7), Date(2023, 5, 29),
+            Date(2023, 7, 4), Date(2023, 9, 4), Date(2023, 11, 23),
+            Date(2023, 12, 25), Date(2024, 1, 1), Date(2024, 1, 15),
+            Date(2024, 2, 19), Date(2024, 3, 29), Date(2024, 5, 27),
+            Date(2024, 7, 4), Date(2024, 9, 2), Date(2024, 11, 28),
+            Date(2024, 12, 25), Date(2025, 1, 1), Date(2025, 1, 20),
+            Date(2025, 2, 17), Date(2025, 4, 18), Date(2025, 5, 26),
+            Date(2025, 7, 4), Date(2025, 9, 1), Date(2025, 11, 27),
+            Date(2025, 12, 25), Date(2026, 1, 1), Date(2026, 1, 19),
+            Date(2026, 2, 16), Date(2026, 4, 3), Date(2026, 5, 25),
+            Date(2026, 7, 3), Date(2026, 9, 7), Date(2026, 11, 26),
+            Date(2026, 12, 25), Date(2027, 1, 1), Date(2027, 1, 18),
+            Date(2027, 2, 15), Date(2027, 3, 26), Date(2027, 5, 31),
+            Date(2027, 7, 5), Date(2027, 9, 6), Date(2027, 11, 25),
+            Date(2027, 12, 24), Date(2028, 1, 1), Date(2028, 1, 17),
+            Date(2028, 2, 21), Date(2028, 4, 14), Date(2028, 5, 29),
+            Date(2028, 7, 4), Date(2028, 9, 4), Date(2028, 11, 23),
+            Date(2028, 12, 25), Date(2029, 1, 1), Date(2029, 1, 15),
+            Date(2029, 2, 19), Date(2029, 3, 30), Date(2029, 5, 28),
+            Date(2029, 7, 4), Date(2029, 9, 3), Date(2029, 11, 22),
+            Date(2029, 12, 25), Date(2030, 1, 1), Date(2030, 1, 21),
+            Date(2030, 2, 18), Date(2030, 4, 19), Date(2030, 5, 27),
+            Date(2030, 7, 4), Date(2030, 9, 2), Date(2030, 11, 28),
+            Date(2030, 12, 25)}
+        nyse_holidays = _serial_bits(dates)
+    return nyse_holidays
 
 
 cdef class ChinaSseImpl(CalendarImpl):
     def __init__(self):
         pass
 
-    cdef bint isBizDay(self, Date date):
-        cdef int w = date.weekday()
-        if self.isWeekEnd(w) or date in sse_holDays:
+    cdef int compileBizBits(self) except -1:
+        # the rule reads the bitmap directly, as a call into the function holding the literal costs more than
+        # the lookup itself
+        _sse_holidays()
+        return CalendarImpl.compileBizBits(self)
+
+    cdef bint isBizSerialByRule(self, int serial):
+        if self.isWeekEnd(_weekday(serial)) or _has_serial(sse_holDays, serial):
             return False
         return True
 
@@ -919,9 +1234,12 @@ cdef class NYSEImpl(CalendarImpl):
     def __init__(self):
         pass
 
-    cdef bint isBizDay(self, Date date):
-        cdef int w = date.weekday()
-        if self.isWeekEnd(w) or date in nyse_holidays:
+    cdef int compileBizBits(self) except -1:
+        _nyse_holidays()
+        return CalendarImpl.compileBizBits(self)
+
+    cdef bint isBizSerialByRule(self, int serial):
+        if self.isWeekEnd(_weekday(serial)) or _has_serial(nyse_holidays, serial):
             return False
         return True
 
@@ -933,123 +1251,137 @@ cdef class NYSEImpl(CalendarImpl):
             return isinstance(right, NYSEImpl)
 
 
-cdef set ib_working_weekends = {
-    # 2005
-    Date.western_style(5, Months.February, 2005),
-    Date.western_style(6, Months.February, 2005),
-    Date.western_style(30, Months.April, 2005),
-    Date.western_style(8, Months.May, 2005),
-    Date.western_style(8, Months.October, 2005),
-    Date.western_style(9, Months.October, 2005),
-    Date.western_style(31, Months.December, 2005),
-    # 2006
-    Date.western_style(28, Months.January, 2006),
-    Date.western_style(29, Months.April, 2006),
-    Date.western_style(30, Months.April, 2006),
-    Date.western_style(30, Months.September, 2006),
-    Date.western_style(30, Months.December, 2006),
-    Date.western_style(31, Months.December, 2006),
-    # 2007
-    Date.western_style(17, Months.February, 2007),
-    Date.western_style(25, Months.February, 2007),
-    Date.western_style(28, Months.April, 2007),
-    Date.western_style(29, Months.April, 2007),
-    Date.western_style(29, Months.September, 2007),
-    Date.western_style(30, Months.September, 2007),
-    Date.western_style(29, Months.December, 2007),
-    # 2008
-    Date.western_style(2, Months.February, 2008),
-    Date.western_style(3, Months.February, 2008),
-    Date.western_style(4, Months.May, 2008),
-    Date.western_style(27, Months.September, 2008),
-    Date.western_style(28, Months.September, 2008),
-    # 2009
-    Date.western_style(4, Months.January, 2009),
-    Date.western_style(24, Months.January, 2009),
-    Date.western_style(1, Months.February, 2009),
-    Date.western_style(31, Months.May, 2009),
-    Date.western_style(27, Months.September, 2009),
-    Date.western_style(10, Months.October, 2009),
-    # 2010
-    Date.western_style(20, Months.February, 2010),
-    Date.western_style(21, Months.February, 2010),
-    Date.western_style(12, Months.June, 2010),
-    Date.western_style(13, Months.June, 2010),
-    Date.western_style(19, Months.September, 2010),
-    Date.western_style(25, Months.September, 2010),
-    Date.western_style(26, Months.September, 2010),
-    Date.western_style(9, Months.October, 2010),
-    # 2011
-    Date.western_style(30, Months.January, 2011),
-    Date.western_style(12, Months.February, 2011),
-    Date.western_style(2, Months.April, 2011),
-    Date.western_style(8, Months.October, 2011),
-    Date.western_style(9, Months.October, 2011),
-    Date.western_style(31, Months.December, 2011),
-    # 2012
-    Date.western_style(21, Months.January, 2012),
-    Date.western_style(29, Months.January, 2012),
-    Date.western_style(31, Months.March, 2012),
-    Date.western_style(1, Months.April, 2012),
-    Date.western_style(28, Months.April, 2012),
-    Date.western_style(29, Months.September, 2012),
-    # 2013
-    Date.western_style(5, Months.January, 2013),
-    Date.western_style(6, Months.January, 2013),
-    Date.western_style(16, Months.February, 2013),
-    Date.western_style(17, Months.February, 2013),
-    Date.western_style(7, Months.April, 2013),
-    Date.western_style(27, Months.April, 2013),
-    Date.western_style(28, Months.April, 2013),
-    Date.western_style(8, Months.June, 2013),
-    Date.western_style(9, Months.June, 2013),
-    Date.western_style(22, Months.September, 2013),
-    Date.western_style(29, Months.September, 2013),
-    Date.western_style(12, Months.October, 2013),
-    # 2014
-    Date.western_style(26, Months.January, 2014),
-    Date.western_style(8, Months.February, 2014),
-    Date.western_style(4, Months.May, 2014),
-    Date.western_style(28, Months.September, 2014),
-    Date.western_style(11, Months.October, 2014),
-    # 2015
-    Date.western_style(4, Months.January, 2015),
-    Date.western_style(15, Months.February, 2015),
-    Date.western_style(28, Months.February, 2015),
-    Date.western_style(6, Months.September, 2015),
-    Date.western_style(10, Months.October, 2015),
-    # 2016
-    Date.western_style(6, Months.February, 2016),
-    Date.western_style(14, Months.February, 2016),
-    Date.western_style(12, Months.June, 2016),
-    Date.western_style(18, Months.September, 2016),
-    Date.western_style(8, Months.October, 2016),
-    Date.western_style(9, Months.October, 2016),
-    # 2017
-    Date.western_style(22, Months.January, 2017),
-    Date.western_style(4, Months.February, 2017),
-    Date.western_style(1, Months.April, 2017),
-    Date.western_style(27, Months.May, 2017),
-    Date.western_style(30, Months.September, 2017),
-    # 2018
-    Date.western_style(11, Months.February, 2018),
-    Date.western_style(24, Months.February, 2018),
-    Date.western_style(8, Months.April, 2018),
-    Date.western_style(28, Months.April, 2018),
-    Date.western_style(29, Months.September, 2018),
-    Date.western_style(30, Months.September, 2018),
-}
-
-cdef ChinaSseImpl _sseImpl = ChinaSseImpl()
+cdef array.array ib_working_weekends = None
+
+
+cdef array.array _ib_working_weekends():
+    global ib_working_weekends
+    if ib_working_weekends is None:
+        dates = {
+            # 2005
+            Date.western_style(5, Months.February, 2005),
+            Date.western_style(6, Months.February, 2005),
+            Date.western_style(30, Months.April, 2005),
+            Date.western_style(8, Months.May, 2005),
+            Date.western_style(8, Months.October, 2005),
+            Date.western_style(9, Months.October, 2005),
+            Date.western_style(31, Months.December, 2005),
+            # 2006
+            Date.western_style(28, Months.January, 2006),
+            Date.western_style(29, Months.April, 2006),
+            Date.western_style(30, Months.April, 2006),
+            Date.western_style(30, Months.September, 2006),
+            Date.western_style(30, Months.December, 2006),
+            Date.western_style(31, Months.December, 2006),
+            # 2007
+            Date.western_style(17, Months.February, 2007),
+            Date.western_style(25, Months.February, 2007),
+            Date.western_style(28, Months.April, 2007),
+            Date.western_style(29, Months.April, 2007),
+            Date.western_style(29, Months.September, 2007),
+            Date.western_style(30, Months.September, 2007),
+            Date.western_style(29, Months.December, 2007),
+            # 2008
+            Date.western_style(2, Months.February, 2008),
+            Date.western_style(3, Months.February, 2008),
+            Date.western_style(4, Months.May, 2008),
+            Date.western_style(27, Months.September, 2008),
+            Date.western_style(28, Months.September, 2008),
+            # 2009
+            Date.western_style(4, Months.January, 2009),
+            Date.western_style(24, Months.January, 2009),
+            Date.western_style(1, Months.February, 2009),
+            Date.western_style(31, Months.May, 2009),
+            Date.western_style(27, Months.September, 2009),
+            Date.western_style(10, Months.October, 2009),
+            # 2010
+            Date.western_style(20, Months.February, 2010),
+            Date.western_style(21, Months.February, 2010),
+            Date.western_style(12, Months.June, 2010),
+            Date.western_style(13, Months.June, 2010),
+            Date.western_style(19, Months.September, 2010),
+            Date.western_style(25, Months.September, 2010),
+            Date.western_style(26, Months.September, 2010),
+            Date.western_style(9, Months.October, 2010),
+            # 2011
+            Date.western_style(30, Months.January, 2011),
+            Date.western_style(12, Months.February, 2011),
+            Date.western_style(2, Months.April, 2011),
+            Date.western_style(8, Months.October, 2011),
+            Date.western_style(9, Months.October, 2011),
+            Date.western_style(31, Months.December, 2011),
+            # 2012
+            Date.western_style(21, Months.January, 2012),
+            Date.western_style(29, Months.January, 2012),
+            Date.western_style(31, Months.March, 2012),
+            Date.western_style(1, Months.April, 2012),
+            Date.western_style(28, Months.April, 2012),
+            Date.western_style(29, Months.September, 2012),
+            # 2013
+            Date.western_style(5, Months.January, 2013),
+            Date.western_style(6, Months.January, 2013),
+            Date.western_style(16, Months.February, 2013),
+            Date.western_style(17, Months.February, 2013),
+            Date.western_style(7, Months.April, 2013),
+            Date.western_style(27, Months.April, 2013),
+            Date.western_style(28, Months.April, 2013),
+            Date.western_style(8, Months.June, 2013),
+            Date.western_style(9, Months.June, 2013),
+            Date.western_style(22, Months.September, 2013),
+            Date.western_style(29, Months.September, 2013),
+            Date.western_style(12, Months.October, 2013),
+            # 2014
+            Date.western_style(26, Months.January, 2014),
+            Date.western_style(8, Months.February, 2014),
+            Date.western_style(4, Months.May, 2014),
+            Date.western_style(28, Months.September, 2014),
+            Date.western_style(11, Months.October, 2014),
+            # 2015
+            Date.western_style(4, Months.January, 2015),
+            Date.western_style(15, Months.February, 2015),
+            Date.western_style(28, Months.February, 2015),
+            Date.western_style(6, Months.September, 2015),
+            Date.western_style(10, Months.October, 2015),
+            # 2016
+            Date.western_style(6, Months.February, 2016),
+            Date.western_style(14, Months.February, 2016),
+            Date.western_style(12, Months.June, 2016),
+            Date.western_style(18, Months.September, 2016),
+            Date.western_style(8, Months.October, 2016),
+            Date.western_style(9, Months.October, 2016),
+            # 2017
+            Date.western_style(22, Months.January, 2017),
+            Date.western_style(4, Months.February, 2017),
+            Date.western_style(1, Months.April, 2017),
+            Date.western_style(27, Months.May, 2017),
+            Date.western_style(30, Months.September, 2017),
+            # 2018
+            Date.western_style(11, Months.February, 2018),
+            Date.western_style(24, Months.February, 2018),
+            Date.western_style(8, Months.April, 2018),
+            Date.western_style(28, Months.April, 2018),
+            Date.western_style(29, Months.September, 2018),
+            Date.western_style(30, Months.September, 2018),
+        }
+        ib_working_weekends = _serial_bits(dates)
+    return ib_working_weekends
 
 cdef class ChinaIBImpl(CalendarImpl):
+    cdef CalendarImpl _sse
+
     def __init__(self):
         pass
 
-    cpdef bint isBizDay(self, Date date):
-        return _sseImpl.isBizDay(date) or date in ib_working_weekends
+    cdef int compileBizBits(self) except -1:
+        # tables loaded from a file are installed without compiling, so the SSE centre is only looked up here
+        self._sse = _get_impl('china.sse')
+        _ib_working_weekends()
+        return CalendarImpl.compileBizBits(self)
+
+    cdef bint isBizSerialByRule(self, int serial):
+        return self._sse.isBizSerial(serial) or _has_serial(ib_working_weekends, serial)
 
-    cpdef bint isWeekEnd(self, int weekDay):
+    cdef bint isWeekEnd(self, int weekDay):
         return weekDay == Weekdays.Saturday or weekDay == Weekdays.Sunday
 
     def __richcmp__(self, right, int op):
@@ -1060,9 +1392,8 @@ cdef class NullCalendar(CalendarImpl):
     def __init__(self):
         pass
 
-    cdef bint isBizDay(self, Date date):
-        cdef int w = date.weekday()
-        if self.isWeekEnd(w):
+    cdef bint isBizSerialByRule(self, int serial):
+        if self.isWeekEnd(_weekday(serial)):
             return False
         return True
 
@@ -1074,14 +1405,20 @@ cdef class NullCalendar(CalendarImpl):
             return isinstance(right, NullCalendar)
 
 cdef class ChinaCFFEXImpl(CalendarImpl):
+    cdef CalendarImpl _sse
+
     def __init__(self):
         pass
 
-    cdef bint isBizDay(self, Date date):
-        return _sseImpl.isBizDay(date)
+    cdef int compileBizBits(self) except -1:
+        self._sse = _get_impl('china.sse')
+        return CalendarImpl.compileBizBits(self)
+
+    cdef bint isBizSerialByRule(self, int serial):
+        return self._sse.isBizSerial(serial)
 
     cdef bint isWeekEnd(self, int weekDay):
-        return _sseImpl.isWeekEnd(weekDay)
+        return _get_impl('china.sse').isWeekEnd(weekDay)
 
     def __richcmp__(self, right, int op):
         if op == 2:
@@ -1132,13 +1469,17 @@ cdef class TargetImpl(WestenImpl):
     def __init__(self):
         pass
 
-    cdef bint isBizDay(self, Date date):
-        cdef int w = date.weekday()
-        cdef int d = date.day_of_month()
-        cdef int dd = date.day_of_year()
-        cdef int m = date.month()
-        cdef int y = date.year()
-        cdef int em = self.easterMonday(y)
+    cdef bint isBizSerialByRule(self, int serial):
+        cdef int w = _weekday(serial)
+        cdef int y
+        cdef int m
+        cdef int d
+        cdef int dd
+        cdef int em
+
+        serial_to_ymd(serial, &y, &m, &d)
+        dd = serial - serial_from_ymd(y, 1, 1) + 1
+        em = self.easterMonday(y)
 
         if (self.isWeekEnd(w)
                 or (d == 1 and m == Months.January)
@@ -1155,6 +1496,57 @@ cdef class TargetImpl(WestenImpl):
         if op == 2:
             return isinstance(right, TargetImpl)
 
+cdef class CustomImpl(CalendarImpl):
+    # holiday centre defined at runtime by register_holiday_center: the business days of its base centres,
+    # joined by intersection (open when all are open) or union (open when any is open), with extra holidays
+    # and business days on top. Each registered name gets its own subclass holding the definition (the base
+    # implementation types, fixed at registration) as class attributes, so that it is cached and loaded like
+    # a built-in centre
+    def __init__(self):
+        pass
+
+    cdef bint isBizSerialByRule(self, int serial):
+        return self.isBizSerial(serial)
+
+    cdef bint isWeekEnd(self, int weekDay):
+        cdef CalendarImpl base
+        cdef bint anyOpen = type(self).anyOpen
+
+        for implType in type(self).bases:
+            base = _impl_of(implType)
+            # weekend when a base has it for an intersection, when all bases have it for a union
+            if base.isWeekEnd(weekDay) != anyOpen:
+                return not anyOpen
+        return anyOpen
+
+    cdef int compileBizBits(self) except -1:
+        cdef CalendarImpl base
+        cdef type definition = type(self)
+        cdef bint anyOpen = definition.anyOpen
+        cdef unsigned char[::1] view = array.clone(_BYTE_TABLE, (MAX_SERIAL >> 3) + 1, False)
+        cdef bint first = True
+        cdef Py_ssize_t i
+        cdef int s
+
+        for implType in definition.bases:
+            base = _impl_of(implType)
+            if first:
+                view[:] = base._bizBits
+                first = False
+            elif anyOpen:
+                for i in range(view.shape[0]):
+                    view[i] |= base._bizBits[i]
+            else:
+                for i in range(view.shape[0]):
+                    view[i] &= base._bizBits[i]
+        for s in definition.holidays:
+            view[s >> 3] &= <unsigned char>~(1 << (s & 7))
+        for s in definition.bizDays:
+            view[s >> 3] |= <unsigned char>(1 << (s & 7))
+        self._bizBits = view
+        return 0
+
+
 cdef dict _holDict = {'china.sse': ChinaSseImpl,
                       'china.ib': ChinaIBImpl,
                       'china.cffex': ChinaCFFEXImpl,
@@ -1162,3 +1554,498 @@ cdef dict _holDict = {'china.sse': ChinaSseImpl,
                       'null': NullCalendar,
                       'nullcalendar': NullCalendar,
                       'nyse': NYSEImpl}
+cdef frozenset _builtinCenters = frozenset(_holDict)
+
+
+
+def compile_holiday_tables(str path, hol_centers=None):
+    # write the compiled tables of the given (by default all) holiday centres to a binary file, see
+    # _TABLE_LAYOUT; the file is replaced atomically so that running readers keep a consistent copy
+    cdef CalendarImpl impl
+    cdef list names = []
+    cdef list entries = []
+    cdef list tables = []
+    cdef Py_ssize_t offset
+
+    for name in (hol_centers if hol_centers is not None else _holDict):
+        name = name.lower()
+        if name not in _holDict:
+            raise ValueError("{0} is not a valid holiday center".format(name))
+        if len(name.encode('ascii')) > _ENTRY_NAME_SIZE:
+            raise ValueError("holiday center name {0} is longer than the {1:d} bytes a table file can hold"
+                             .format(name, _ENTRY_NAME_SIZE))
+        if not any(_holDict[n] is _holDict[name] for n in names):
+            names.append(name)
+
+    import numpy as np
+    offset = _HEADER.size + len(names) * _ENTRY.size
+    for name in names:
+        impl = _get_impl(name)
+        arrays = [np.ascontiguousarray(np.asarray(table), dtype=dtype) for table, (_, dtype) in
+                  zip((impl._bizBits, impl._bizCounts, impl._bizSerials, impl._holSerials, impl._nextBiz,
+                       impl._prevBiz, impl._monthEnd), _TABLE_LAYOUT)]
+        locations = []
+        for array in arrays:
+            padding = -offset % 8
+            tables.append(b'\0' * padding)
+            offset += padding
+            locations.extend([offset, array.shape[0]])
+            tables.append(array.tobytes())
+            offset += array.nbytes
+        entries.append(_ENTRY.pack(name.encode('ascii'), *(locations + [_definition_checksum(_holDict[name])])))
+
+    payload = b''.join(entries + tables)
+    header = _HEADER.pack(_TABLE_MAGIC, _TABLE_VERSION, MIN_SERIAL, MAX_SERIAL, len(names),
+                          zlib.crc32(payload) & 0xffffffff)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(header)
+        f.write(payload)
+    _replace(path + '.tmp', path)
+    return names
+
+
+def load_holiday_tables(str path):
+    # memory-map a file written by compile_holiday_tables read-only and use its tables, without copying,
+    # for the holiday centres it holds; processes loading the same file share one page cache copy
+    cdef CalendarImpl impl
+    cdef list names = []
+    import numpy as np
+
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mapped) < _HEADER.size:
+        raise ValueError("{0} is not a holiday table file".format(path))
+    magic, version, min_serial, max_serial, n, checksum = _HEADER.unpack_from(mapped, 0)
+    if magic != _TABLE_MAGIC:
+        raise ValueError("{0} is not a holiday table file".format(path))
+    if version != _TABLE_VERSION or min_serial != MIN_SERIAL or max_serial != MAX_SERIAL:
+        raise ValueError("{0} holds version {1:d} tables over serials [{2:d}, {3:d}], expected version {4:d} "
+                         "over [{5:d}, {6:d}]".format(path, version, min_serial, max_serial, _TABLE_VERSION,
+                                                      MIN_SERIAL, MAX_SERIAL))
+    # checksummed through a numpy view, as a py2 mmap cannot be wrapped in a memoryview
+    if zlib.crc32(np.frombuffer(mapped, dtype=np.uint8, offset=_HEADER.size)) & 0xffffffff != checksum:
+        raise ValueError("{0} is corrupted: checksum mismatch".format(path))
+
+    # the tables are read with bounds checking off, so every entry is validated before any is installed
+    loaded = []
+    for i in range(n):
+        fields = _ENTRY.unpack_from(mapped, _HEADER.size + i * _ENTRY.size)
+        name = fields[0].rstrip(b'\0').decode('ascii')
+        if name not in _holDict or fields[-1] != _definition_checksum(_holDict[name]):
+            # a centre registered in the process that wrote the file but not (yet) in this one, or registered
+            # there with another definition
+            continue
+        try:
+            tables = [np.frombuffer(mapped, dtype=dtype, count=fields[2 * k + 2], offset=fields[2 * k + 1])
+                      for k, (_, dtype) in enumerate(_TABLE_LAYOUT)]
+        except ValueError:
+            raise ValueError("{0} is corrupted: the tables of {1} lie outside the file".format(path, name))
+        _check_tables(path, name, tables)
+        loaded.append((name, tables))
+
+    for name, tables in loaded:
+        impl = _holDict[name]()
+        impl._bizBits, impl._bizCounts, impl._bizSerials, impl._holSerials, impl._nextBiz, impl._prevBiz, \
+            impl._monthEnd = tables
+        _implCache[_holDict[name]] = impl
+        names.append(name)
+    return names
+
+
+cdef unsigned int _definition_checksum(type implType):
+    # what the tables of a centre are compiled from: the implementation of a built-in centre, the bases, join
+    # and extra days of a registered one
+    if not issubclass(implType, CustomImpl):
+        return zlib.crc32(implType.__name__.encode('ascii')) & 0xffffffff
+    days = implType.holidays + implType.bizDays
+    description = [struct.pack('<?II', implType.anyOpen, len(implType.holidays), len(implType.bizDays)),
+                   struct.pack('<{0:d}i'.format(len(days)), *days)]
+    description.extend(struct.pack('<I', _definition_checksum(base)) for base in implType.bases)
+    return zlib.crc32(b''.join(description)) & 0xffffffff
+
+
+cdef int _check_tables(str path, str name, list tables) except -1:
+    bits, counts, serials, holidays, next_biz, prev_biz, month_end = tables
+    expected = [(MAX_SERIAL >> 3) + 1, MAX_SERIAL + 1, None, None, MAX_SERIAL + 1, MAX_SERIAL + 1,
+                _MONTHS]
+    if counts.shape[0] == MAX_SERIAL + 1:
+        # one entry per business day after a leading 0, indexed by the counts
+        expected[2] = int(counts[MAX_SERIAL]) + 1
+    for table, size, (label, _) in zip(tables, expected, _TABLE_LAYOUT):
+        if size is not None and table.shape[0] != size:
+            raise ValueError("{0} is corrupted: the {1} table of {2} holds {3:d} entries, expected {4:d}"
+                             .format(path, label, name, table.shape[0], size))
+    for table, (label, _) in zip(tables[1:], _TABLE_LAYOUT[1:]):
+        if table.shape[0] and (table.min() < 0 or table.max() > MAX_SERIAL):
+            raise ValueError("{0} is corrupted: the {1} table of {2} holds values outside [0, {3:d}]"
+                             .format(path, label, name, MAX_SERIAL))
+    return 0
+
+
+def register_holiday_center(str name, hol_centers=('null',), str join='intersection', holidays=(), biz_days=()):
+    # define a holiday centre usable by name like the built-in ones; its business day bitmap is computed once
+    # from the base centres, so queries on it cost the same as on a single centre. Registering a name again
+    # replaces its definition for calendars created afterwards
+    cdef list bases = []
+
+    name = name.lower()
+    if name in _builtinCenters:
+        raise ValueError("{0} is a built-in holiday center and can not be redefined".format(name))
+    if isinstance(hol_centers, basestring):
+        hol_centers = [hol_centers]
+    for base in hol_centers:
+        base = base.lower()
+        if base not in _holDict:
+            raise ValueError("{0} is not a valid description of a holiday center".format(base))
+        bases.append(_holDict[base])
+    if not bases:
+        raise ValueError("a holiday center needs at least one base holiday center")
+    if join not in ('intersection', 'union'):
+        raise ValueError("join must be 'intersection' or 'union', not {0}".format(join))
+
+    # the compiled tables of a replaced definition are only kept alive by the calendars still using them
+    _implCache.pop(_holDict.get(name), None)
+    _holDict[name] = type('CustomImpl_' + str(name), (CustomImpl,),
+                          {'bases': tuple(bases),
+                           'anyOpen': join == 'union',
+                           'holidays': tuple(sorted(check_date(d).__serial_number__ for d in holidays)),
+                           'bizDays': tuple(sorted(check_date(d).__serial_number__ for d in biz_days))})
+
+
+def unregister_holiday_center(str name):
+    name = name.lower()
+    if name in _builtinCenters:
+        raise ValueError("{0} is a built-in holiday center and can not be removed".format(name))
+    if name not in _holDict:
+        raise ValueError("{0} is not a valid description of a holiday center".format(name))
+    _implCache.pop(_holDict.pop(name), None)
+
+
+def holiday_centers():
+    # names accepted by Calendar, built-in and registered
+    return sorted(_holDict)
+
+
+# C API: serial in / serial out functions over the compiled tables of a holiday centre (Calendar._impl),
+# callable without the GIL. Serials or results outside the supported range give 0 and an unknown convention
+# gives -1
+
+cdef bint calendar_is_biz_day(CalendarImpl impl, int serial) nogil:
+    return impl.isBizSerial(serial)
+
+cdef int calendar_adjust(CalendarImpl impl, int serial, int c) nogil:
+    return impl.adjustSerial(serial, c)
+
+cdef int calendar_advance_bdays(CalendarImpl impl, int serial, int n) nogil:
+    # n-th business day strictly after (n > 0) or before (n < 0) serial, serial itself when n is 0
+    if serial < MIN_SERIAL or serial > MAX_SERIAL:
+        return 0
+    if n == 0:
+        return serial
+    return _nth_biz_serial(impl._bizCounts, impl._bizSerials, serial, n)
+
+cdef int calendar_advance(CalendarImpl impl, int serial, int n, int units, int c, bint endOfMonth) nogil:
+    # as Calendar.advance_date with Period(length=n, units=units)
+    return impl.advanceSerial(serial, n, units, c, endOfMonth)
+
+cdef int calendar_biz_days_between(CalendarImpl impl, int fromSerial, int toSerial, bint includeFirst,
+                                   bint includeLast) nogil:
+    cdef int wd = 0
+    cdef int lo
+    cdef int hi
+
+    if fromSerial < MIN_SERIAL or fromSerial > MAX_SERIAL or toSerial < MIN_SERIAL or toSerial > MAX_SERIAL:
+        return 0
+    if fromSerial != toSerial:
+        lo = min(fromSerial, toSerial)
+        hi = max(fromSerial, toSerial)
+        wd = _count_upto(impl._bizCounts, hi) - _count_upto(impl._bizCounts, lo - 1)
+        if impl.isBizSerial(fromSerial) and not includeFirst:
+            wd -= 1
+        if impl.isBizSerial(toSerial) and not includeLast:
+            wd -= 1
+    return wd
+
+
+def set_num_threads(n):
+    # number of threads the batch functions split large inputs over, 1 (the default, unless the
+    # MARKET_CALENDARS_NUM_THREADS environment variable says otherwise) to run in the calling thread
+    global _numThreads, _executor
+    if not isinstance(n, Integral):
+        raise TypeError("number of threads must be an integer, not {0!r}".format(n))
+    n = int(n)
+    if n < 1:
+        raise ValueError("number of threads must be positive, not {0:d}".format(n))
+    with _executorLock:
+        if n != _numThreads and _executor is not None:
+            # batches still running on the old pool shut it down when they are done
+            if not _poolUsers.get(_executor):
+                _executor.shutdown(wait=False)
+            _executor = None
+        _numThreads = n
+
+
+def get_num_threads():
+    return _numThreads
+
+
+# implementation detail
+
+# holiday table file: a header, one directory entry per holiday centre, then the tables of each
+# centre in _TABLE_LAYOUT order, each 8-byte aligned. All fields are little-endian and the header
+# checksum is the CRC-32 of everything after the header.
+#   header: magic, format version, MIN_SERIAL, MAX_SERIAL, number of centres, checksum
+#   entry:  NUL padded centre name, then (offset, item count) of every table, then the CRC-32 of the
+#           definition the tables were compiled from (see _definition_checksum)
+_TABLE_MAGIC = b'MCALTBL\0'
+_TABLE_VERSION = 3
+_TABLE_LAYOUT = (('bits', '<u1'), ('counts', '<i4'), ('serials', '<i4'), ('holidays', '<i4'), ('next', '<i4'),
+                 ('prev', '<i4'), ('month_end', '<i4'))
+_HEADER = struct.Struct('<8sIiiII')
+_ENTRY_NAME_SIZE = 32
+_ENTRY = struct.Struct('<{0:d}s'.format(_ENTRY_NAME_SIZE) + 'QQ' * len(_TABLE_LAYOUT) + 'I')
+# atomic rename over an existing file; py2 only has os.rename, which does not replace one on Windows
+_replace = getattr(os, 'replace', os.rename)
+
+cdef dict _implCache = {}
+_tablesPath = os.environ.get('MARKET_CALENDARS_TABLES')
+
+cdef CalendarImpl _get_impl(str holCenter):
+    # holiday centres are stateless, so one instance (and its compiled tables) is shared per centre
+    return _impl_of(_holDict[holCenter])
+
+cdef CalendarImpl _impl_of(type implType):
+    global _tablesPath
+    cdef CalendarImpl impl
+
+    if _tablesPath:
+        # precompiled tables named by MARKET_CALENDARS_TABLES, loaded once on first use
+        path, _tablesPath = _tablesPath, None
+        load_holiday_tables(path)
+
+    impl = _implCache.get(implType)
+    if impl is None:
+        impl = implType()
+        impl.compileBizBits()
+        impl.compileTables()
+        _implCache[implType] = impl
+    return impl
+
+cdef inline int _weekday(int serial) nogil:
+    # as Date.weekday
+    cdef int w = serial % 7
+    return 7 if w == 0 else w
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline int _count_upto(const int[::1] counts, int serial) nogil:
+    if serial < MIN_SERIAL:
+        return 0
+    return counts[serial]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _nth_biz_serial(const int[::1] counts, const int[::1] serials, int serial, int n) nogil:
+    # rank/select lookup of the n-th business day strictly after (n > 0) or before (n < 0) serial;
+    # returns 0 when the result falls outside the supported range
+    cdef int k
+
+    if serial < MIN_SERIAL or serial > MAX_SERIAL:
+        return 0
+    if n > 0:
+        k = _count_upto(counts, serial) + n
+    else:
+        k = _count_upto(counts, serial - 1) + n + 1
+    if k <= 0 or k >= serials.shape[0]:
+        return 0
+    return serials[k]
+
+cdef inline Date _checked_date(int serial, Date d):
+    if serial == -1:
+        raise ValueError("unknown business-day convention")
+    elif serial == 0:
+        raise ValueError("date rolled from {0} is out of bound. It must be in [1901, 2199]".format(d))
+    return date_from_serial(serial)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _bisect_left(const int[::1] a, int x) nogil:
+    cdef Py_ssize_t lo = 0
+    cdef Py_ssize_t hi = a.shape[0]
+    cdef Py_ssize_t mid
+
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if a[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+cdef object _biz_mask(CalendarImpl impl, int lo, int hi):
+    # business day flags of the serials in [lo, hi] unpacked in bulk from the bitmap
+    import numpy as np
+    bits = np.asarray(impl._bizBits)[lo >> 3:(hi >> 3) + 1]
+    return np.unpackbits(bits, bitorder='little')[lo & 7:(lo & 7) + hi - lo + 1].view(np.bool_)
+
+# calendar days scanned per step of the lazy iterators
+cdef enum:
+    _ITER_WINDOW = 4096
+
+cdef int _check_chunk_size(chunk_size) except -1:
+    if chunk_size is None:
+        return 0
+    if not isinstance(chunk_size, Integral):
+        raise TypeError("chunk size must be an integer, not {0!r}".format(chunk_size))
+    if chunk_size <= 0:
+        raise ValueError("chunk size {0} must be positive".format(chunk_size))
+    return chunk_size
+
+def _iter_serials(Calendar cal, Date from_date, Date to_date, bint biz, bint include_weekends, bint backward,
+                  int chunk_size):
+    cdef int lo = max(from_date.__serial_number__, MIN_SERIAL)
+    cdef int hi = min(to_date.__serial_number__, MAX_SERIAL)
+    cdef int window = max(chunk_size, _ITER_WINDOW)
+    cdef int a
+    cdef int b
+    import numpy as np
+
+    # leftovers of the previous windows, always fewer than chunk_size serials
+    pending = np.empty(0, dtype=np.intc)
+    while lo <= hi:
+        if backward:
+            a = max(lo, hi - window + 1)
+            b = hi
+            hi = a - 1
+        else:
+            a = lo
+            b = min(hi, lo + window - 1)
+            lo = b + 1
+        if biz:
+            serials = cal.biz_serials(date_from_serial(a), date_from_serial(b))
+        else:
+            serials = cal.holiday_serials(date_from_serial(a), date_from_serial(b), include_weekends)
+        if backward:
+            serials = serials[::-1]
+
+        if not chunk_size:
+            for s in serials.tolist():
+                yield date_from_serial(s)
+            continue
+        pending = np.concatenate((pending, serials))
+        while pending.shape[0] >= chunk_size:
+            yield pending[:chunk_size]
+            pending = pending[chunk_size:]
+    if pending.shape[0]:
+        yield pending
+
+# batch kernels: the batch functions fill their output in contiguous chunks with the GIL released, one
+# chunk per thread of a shared pool for large inputs. Chunks never overlap, so results do not depend on
+# the number of threads
+
+def _env_num_threads():
+    value = os.environ.get('MARKET_CALENDARS_NUM_THREADS', '').strip()
+    if not value:
+        return 1
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        warnings.warn("ignoring MARKET_CALENDARS_NUM_THREADS={0!r}, not a positive integer; "
+                      "the batch functions run in the calling thread".format(value), RuntimeWarning)
+        return 1
+    return n
+
+
+_numThreads = _env_num_threads()
+_executor = None
+_executorLock = threading.Lock()
+# pool -> number of batches running on it, so that a pool replaced by set_num_threads outlives them
+_poolUsers = {}
+
+
+cdef class _BatchTask(object):
+    cdef CalendarImpl impl
+    cdef int op
+    cdef int n
+    cdef int units
+    cdef int c
+    cdef bint endOfMonth
+    cdef const int[::1] serials
+    cdef int[::1] out
+    cdef unsigned char[::1] flags
+
+    def __call__(self, Py_ssize_t lo, Py_ssize_t hi):
+        with nogil:
+            self.run(lo, hi)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void run(self, Py_ssize_t lo, Py_ssize_t hi) nogil:
+        cdef Py_ssize_t i
+
+        if self.op == _BATCH_IS_BIZ_DAY:
+            for i in range(lo, hi):
+                self.flags[i] = self.impl.isBizSerial(self.serials[i])
+        elif self.op == _BATCH_ADJUST:
+            for i in range(lo, hi):
+                self.out[i] = self.impl.adjustSerial(self.serials[i], self.c)
+        else:
+            for i in range(lo, hi):
+                self.out[i] = self.impl.advanceSerial(self.serials[i], self.n, self.units, self.c, self.endOfMonth)
+
+
+cdef _BatchTask _batch_task(CalendarImpl impl, int op, const int[::1] serials, result):
+    cdef _BatchTask task = _BatchTask()
+    task.impl = impl
+    task.op = op
+    task.serials = serials
+    if op == _BATCH_IS_BIZ_DAY:
+        task.flags = result
+    else:
+        task.out = result
+    return task
+
+
+cdef int _run_batch(_BatchTask task) except -1:
+    global _executor
+    cdef Py_ssize_t size = task.serials.shape[0]
+    cdef Py_ssize_t chunks = min(_numThreads, size // _MIN_CHUNK)
+
+    if chunks <= 1:
+        task(0, size)
+        return 0
+
+    with _executorLock:
+        if _executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _executor = ThreadPoolExecutor(_numThreads)
+        executor = _executor
+        _poolUsers[executor] = _poolUsers.get(executor, 0) + 1
+    try:
+        bounds = [size * k // chunks for k in range(chunks + 1)]
+        for _ in executor.map(task, bounds[:-1], bounds[1:]):
+            pass
+    finally:
+        with _executorLock:
+            _poolUsers[executor] -= 1
+            if not _poolUsers[executor]:
+                del _poolUsers[executor]
+                if executor is not _executor:
+                    executor.shutdown(wait=False)
+    return 0
+
+
+cdef int _check_batch(result, int[::1] serials) except -1:
+    cdef int s
+    import numpy as np
+
+    failed = np.flatnonzero(result <= 0)
+    if failed.shape[0]:
+        s = serials[failed[0]]
+        if s < MIN_SERIAL or s > MAX_SERIAL:
+            raise ValueError("serial number {0:d} is out of bound. It must be in [1901, 2199]".format(s))
+        _checked_date(result[failed[0]], date_from_serial(s))
+    return 0
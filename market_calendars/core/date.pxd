@@ -1,3 +1,8 @@
+cdef enum:
+    MIN_SERIAL = 367  # 1901-01-01
+    MAX_SERIAL = 109574  # 2199-12-31
+    EPOCH_SERIAL = 25569  # 1970-01-01
+
 cdef class Date(object):
 
     cdef public int __serial_number__
@@ -20,4 +25,13 @@ cdef class Date(object):
     cdef _calculate_date(self, int year, int month, int day)
 
 
-cpdef check_date(date)
\ No newline at end of file
+cpdef check_date(date, bint strict= *)
+
+
+cdef int serial_from_ymd(int year, int month, int day) nogil
+cdef void serial_to_ymd(int serial, int* year, int* month, int* day) nogil
+cdef Date date_from_serial(int serial)
+cdef int advance_serial(int serial, int n, int units) nogil
+cpdef to_serial_array(dates)
+cpdef from_serial_array(serials, like)
+cpdef serials_to_datetime64(serials)
@@ -1,6 +1,5 @@
 import datetime as dt
-import six
-from dateutil.parser import parse
+import sys
 import cython
 from libc.math cimport floor
 from .enums._time_units cimport TimeUnits
@@ -9,12 +8,12 @@ from .period cimport Period
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef inline int month_length(int month, bint isLeap):
+cdef inline int month_length(int month, bint isLeap) nogil:
     return MONTH_LEAP_LENGTH[month - 1] if isLeap else MONTH_LENGTH[month - 1]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef inline int month_offset(int month, bint isLeap):
+cdef inline int month_offset(int month, bint isLeap) nogil:
     return MONTH_LEAP_OFFSET[month - 1] if isLeap else MONTH_OFFSET[month - 1]
 
 @cython.boundscheck(False)
@@ -29,9 +28,9 @@ cdef Date advance(Date date, int n, int units):
     cdef int leap_flag
 
     if units == TimeUnits.Days or units == TimeUnits.BDays:
-        return Date(serial_number=date.__serial_number__ + n)
+        return date_from_serial(date.__serial_number__ + n)
     elif units == TimeUnits.Weeks:
-        return Date(serial_number=date.__serial_number__ + 7 * n)
+        return date_from_serial(date.__serial_number__ + 7 * n)
     elif units == TimeUnits.Months:
         d = date._day
         m = date._month + n
@@ -65,31 +64,128 @@ cdef Date advance(Date date, int n, int units):
 
         return Date(y, m, d)
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int serial_from_ymd(int year, int month, int day) nogil:
+    return day + month_offset(month, YEAR_IS_LEAP[year - 1900]) + YEAR_OFFSET[year - 1900]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void serial_to_ymd(int serial, int* year, int* month, int* day) nogil:
+    # serial must be in [MIN_SERIAL, MAX_SERIAL]
+    year[0] = SERIAL_YEAR[serial - MIN_SERIAL]
+    month[0] = SERIAL_MONTH[serial - MIN_SERIAL]
+    day[0] = SERIAL_DAY[serial - MIN_SERIAL]
+
+cdef Date date_from_serial(int serial):
+    # Date factory bypassing __init__; shares one instance per serial when interning is on
+    cdef Date date
+
+    if serial < MIN_SERIAL or serial > MAX_SERIAL:
+        raise ValueError('serial number {0:d} is out of bound. It must be in [1901, 2199]'.format(serial))
+    if _internDates:
+        date = _internedDates[serial - MIN_SERIAL]
+        if date is None:
+            date = _new_date(serial)
+            _internedDates[serial - MIN_SERIAL] = date
+        return date
+    return _new_date(serial)
+
+def _unpickle_date(int serial):
+    return date_from_serial(serial)
+
+def set_date_interning(bint enabled):
+    # opt-in: Date arithmetic and the Calendar / Schedule functions then return one shared instance per
+    # serial, so those dates must not be modified in place; turning it off releases the shared instances
+    global _internDates, _internedDates
+    if enabled and _internedDates is None:
+        _internedDates = [None] * (MAX_SERIAL - MIN_SERIAL + 1)
+    elif not enabled:
+        _internedDates = None
+    _internDates = enabled
+
+def is_date_interning():
+    return _internDates
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int advance_serial(int serial, int n, int units) nogil:
+    # serial counterpart of advance; returns 0 when the result falls outside [1901, 2199]
+    cdef int y
+    cdef int m
+    cdef int d
+    cdef int length
+
+    if serial < MIN_SERIAL or serial > MAX_SERIAL:
+        return 0
+    if units == TimeUnits.Days or units == TimeUnits.BDays:
+        serial += n
+    elif units == TimeUnits.Weeks:
+        serial += 7 * n
+    elif units == TimeUnits.Months or units == TimeUnits.Years:
+        serial_to_ymd(serial, &y, &m, &d)
+        if units == TimeUnits.Months:
+            m += n - 1
+            y += m // 12
+            m = m % 12 + 1
+        else:
+            y += n
+        if y <= 1900 or y >= 2200:
+            return 0
+        length = month_length(m, YEAR_IS_LEAP[y - 1900])
+        if d > length:
+            d = length
+        serial = serial_from_ymd(y, m, d)
+    else:
+        return 0
+
+    if serial < MIN_SERIAL or serial > MAX_SERIAL:
+        return 0
+    return serial
+
+cpdef to_serial_array(dates):
+    # flat int32 serial numbers of a datetime64 or integer serial array; the values are checked in
+    # their own type before being narrowed, so NaT or wide integers cannot wrap into valid serials
+    import numpy as np
+    values = np.asarray(dates)
+    if values.dtype.kind == 'M':
+        values = values.astype('datetime64[D]')
+        if np.isnat(values).any():
+            raise ValueError("NaT is not a valid date")
+        values = values.view(np.int64) + EPOCH_SERIAL
+    elif values.dtype.kind not in 'iu':
+        raise TypeError("dates must be datetime64 or integer serial numbers, not {0}".format(values.dtype))
+    if values.size and (values.min() < MIN_SERIAL or values.max() > MAX_SERIAL):
+        bad = values.ravel()[np.flatnonzero((values.ravel() < MIN_SERIAL) | (values.ravel() > MAX_SERIAL))[0]]
+        raise ValueError("serial number {0:d} is out of bound. It must be in [1901, 2199]".format(bad))
+    return np.ascontiguousarray(values.ravel(), dtype=np.intc)
+
+cpdef from_serial_array(serials, like):
+    # reshape serials as the input array like, converted back to datetime64[D] when like is
+    import numpy as np
+    values = np.asarray(like)
+    serials = np.asarray(serials).reshape(values.shape)
+    if values.dtype.kind == 'M':
+        return serials_to_datetime64(serials)
+    return serials
+
+cpdef serials_to_datetime64(serials):
+    import numpy as np
+    return (np.asarray(serials) - EPOCH_SERIAL).astype('datetime64[D]')
+
+@cython.freelist(256)
 cdef class Date(object):
-    @cython.cdivision(True)
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def __init__(self, int year=0, int month=0, int day=0, int serial_number=0):
-        cdef int leap
-        cdef int y
-        cdef int m
-        cdef int d
-
         if serial_number:
+            if serial_number < MIN_SERIAL or serial_number > MAX_SERIAL:
+                raise ValueError('serial number {0:d} is out of bound. '
+                                 'It must be in [1901, 2199]'.format(serial_number))
             self.__serial_number__ = serial_number
-
-            y = (int(serial_number / 365)) + 1900
-            if serial_number <= YEAR_OFFSET[y - 1900]:
-                y -= 1
-
-            d = serial_number - YEAR_OFFSET[y - 1900]
-            m = int(d / 30) + 1
-            leap = Date.is_leap(y)
-            while d <= month_offset(m, leap):
-                m -= 1
-
-            py_assert(1900 < y < 2200, ValueError, 'year {0:d} is out of bound. It must be in [1901, 2199]'.format(y))
-            self._year = y
-            self._month = m
-            self._day = d - month_offset(m, leap)
+            self._year = SERIAL_YEAR[serial_number - MIN_SERIAL]
+            self._month = SERIAL_MONTH[serial_number - MIN_SERIAL]
+            self._day = SERIAL_DAY[serial_number - MIN_SERIAL]
             return
         elif serial_number and (year or month or day):
             raise ValueError("When serial number is offered, no year or month or day number should be entered")
@@ -137,24 +233,30 @@ cdef class Date(object):
             return self.__serial_number__ >= other.__serial_number__
 
     def __add__(self, period):
-        if isinstance(period, Period):
+        if not isinstance(self, Date):
+            return NotImplemented
+        elif isinstance(period, Period):
             return advance(self, period.length(), period.units())
         elif isinstance(period, int):
-            return Date(serial_number=self.__serial_number__ + period)
-        else:
+            return date_from_serial(self.__serial_number__ + period)
+        elif isinstance(period, basestring):
             period = Period(period)
             return advance(self, period.length(), period.units())
+        return NotImplemented
 
     def __sub__(self, period):
-        if isinstance(period, Period):
+        if not isinstance(self, Date):
+            return NotImplemented
+        elif isinstance(period, Period):
             return advance(self, -period.length(), period.units())
         elif isinstance(period, int):
-            return Date(serial_number=self.__serial_number__ - period)
+            return date_from_serial(self.__serial_number__ - period)
         elif isinstance(period, Date):
             return self.__serial_number__ - period.__serial_number__
-        else:
+        elif isinstance(period, basestring):
             period = Period(period)
             return advance(self, -period.length(), period.units())
+        return NotImplemented
 
     def __hash__(self):
         return self.__serial_number__
@@ -228,8 +330,8 @@ cdef class Date(object):
         return YEAR_IS_LEAP[year - 1900]
 
     @staticmethod
-    def from_excel_serial_number(serial_number):
-        return Date(serial_number=serial_number)
+    def from_excel_serial_number(int serial_number):
+        return date_from_serial(serial_number)
 
     @staticmethod
     def from_datetime(date_time):
@@ -252,9 +354,8 @@ cdef class Date(object):
         return Date(self._year, self._month, self._day)
 
     def __reduce__(self):
-        d = {}
-
-        return Date, (self._year, self._month, self._day), d
+        # just the serial number, rebuilt without going through __init__
+        return _unpickle_date, (self.__serial_number__,)
 
     def __setstate__(self, state):
         pass
@@ -278,10 +379,96 @@ cdef class Date(object):
         date_time = self.to_datetime()
         return date_time.strftime(date_format)
 
-cpdef check_date(date):
-    if isinstance(date, six.string_types):
+cpdef check_date(date, bint strict=False):
+    # Date passes through, YYYY-MM-DD and YYYYMMDD strings, datetime.date / datetime / pandas.Timestamp and
+    # numpy.datetime64 are converted directly; other strings fall back to dateutil unless strict
+    cdef Date parsed
+
+    if isinstance(date, Date):
+        return date
+    elif isinstance(date, basestring):
+        # subclasses such as numpy.str_ are parsed as plain strings
+        parsed = _parse_iso(date if type(date) is str else str(date))
+        if parsed is not None:
+            return parsed
+        if date.strip().lower() == 'nat':
+            raise ValueError("{0!r} is not a date".format(date))
+        if strict:
+            raise ValueError("{0} is not an ISO-8601 date (YYYY-MM-DD or YYYYMMDD)".format(date))
+        from dateutil.parser import parse
         date = parse(date)
-    return Date.from_datetime(date)
+    elif date != date:
+        # NaT of numpy or pandas, the only dates unequal to themselves
+        raise ValueError("{0!r} is not a date".format(date))
+    elif not isinstance(date, dt.date):
+        # numpy is imported lazily, and a numpy.datetime64 can only exist once it has been
+        np = sys.modules.get('numpy')
+        if np is not None and isinstance(date, np.datetime64):
+            return _date_from_serial(date.astype('datetime64[D]').astype(np.int64) + EPOCH_SERIAL)
+    return _date_from_ymd(date.year, date.month, date.day)
+
+# implementation detail
+
+cdef bint _internDates = False
+cdef list _internedDates = None
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Date _new_date(int serial):
+    cdef Date date = Date.__new__(Date)
+    date.__serial_number__ = serial
+    date._year = SERIAL_YEAR[serial - MIN_SERIAL]
+    date._month = SERIAL_MONTH[serial - MIN_SERIAL]
+    date._day = SERIAL_DAY[serial - MIN_SERIAL]
+    return date
+
+cdef Date _date_from_ymd(int year, int month, int day):
+    if not 1900 < year < 2200:
+        raise ValueError('year {0:d} is out of bound. It must be in [1901, 2199]'.format(year))
+    if not 1 <= month <= 12:
+        raise ValueError('month {0:d} is out of bound. It must be in [1, 12]'.format(month))
+    if not 1 <= day <= month_length(month, YEAR_IS_LEAP[year - 1900]):
+        raise ValueError('day {0:d} is out of bound for {1:d}-{2:02d}'.format(day, year, month))
+    return Date(year, month, day)
+
+cdef Date _date_from_serial(long long serial):
+    if not MIN_SERIAL <= serial <= MAX_SERIAL:
+        raise ValueError('serial number {0:d} is out of bound. It must be in [1901, 2199]'.format(serial))
+    return date_from_serial(<int>serial)
+
+cdef int _parse_digits(str date_str, Py_ssize_t start, Py_ssize_t length):
+    cdef int value = 0
+    cdef Py_UCS4 ch
+    cdef Py_ssize_t i
+
+    for i in range(start, start + length):
+        ch = date_str[i]
+        if ch < 48 or ch > 57:  # not in '0'..'9'
+            return -1
+        value = value * 10 + <int>ch - 48
+    return value
+
+cdef Date _parse_iso(str date_str):
+    # exactly YYYY-MM-DD or YYYYMMDD; None for any other layout, time parts included
+    cdef Py_ssize_t n = len(date_str)
+    cdef int y
+    cdef int m
+    cdef int d
+
+    if n == 10 and date_str[4] == u'-' and date_str[7] == u'-':
+        y = _parse_digits(date_str, 0, 4)
+        m = _parse_digits(date_str, 5, 2)
+        d = _parse_digits(date_str, 8, 2)
+    elif n == 8:
+        y = _parse_digits(date_str, 0, 4)
+        m = _parse_digits(date_str, 4, 2)
+        d = _parse_digits(date_str, 6, 2)
+    else:
+        return None
+
+    if y < 0 or m < 0 or d < 0:
+        return None
+    return _date_from_ymd(y, m, d)
 
 cdef bint YEAR_IS_LEAP[301]
 cdef int YEAR_OFFSET[301]
@@ -432,3 +619,25 @@ MONTH_OFFSET[:] = [0, 31, 59, 90, 120, 151,  # Jan - Jun
 MONTH_LEAP_OFFSET[:] = [0, 31, 60, 91, 121, 152,  # Jan - Jun
                         182, 213, 244, 274, 305, 335,  # Jun - Dec
                         366]
+
+# year, month and day of every supported serial, indexed by serial - MIN_SERIAL
+cdef unsigned short SERIAL_YEAR[MAX_SERIAL - MIN_SERIAL + 1]
+cdef unsigned char SERIAL_MONTH[MAX_SERIAL - MIN_SERIAL + 1]
+cdef unsigned char SERIAL_DAY[MAX_SERIAL - MIN_SERIAL + 1]
+
+
+cdef void _fill_serial_tables():
+    cdef int i = 0
+    cdef int y
+    cdef int m
+    cdef int d
+
+    for y in range(1901, 2200):
+        for m in range(1, 13):
+            for d in range(1, month_length(m, YEAR_IS_LEAP[y - 1900]) + 1):
+                SERIAL_YEAR[i] = y
+                SERIAL_MONTH[i] = m
+                SERIAL_DAY[i] = d
+                i += 1
+
+_fill_serial_tables()
@@ -0,0 +1,23 @@
+cdef class DateArray(object):
+
+    cdef readonly object _data
+    cdef const int[::1] _serials
+    cdef Py_ssize_t _shape[1]
+    cdef Py_ssize_t _strides[1]
+
+    cdef _set_data(self, serials)
+
+    cpdef year(self)
+
+    cpdef month(self)
+
+    cpdef day_of_month(self)
+
+    cpdef weekday(self)
+
+    cpdef to_datetime64(self)
+
+    cpdef list tolist(self)
+
+
+cdef DateArray date_array_from_serials(serials, bint owned= *)
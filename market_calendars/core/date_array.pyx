@@ -0,0 +1,239 @@
+import cython
+from numbers import Integral
+from cpython.buffer cimport PyBUF_WRITABLE, PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES
+from .date cimport Date, MIN_SERIAL, MAX_SERIAL, EPOCH_SERIAL
+from .date cimport check_date, date_from_serial, serial_to_ymd, advance_serial, to_serial_array
+from .date cimport serials_to_datetime64
+from .period cimport Period
+from .period import check_period
+from .enums._time_units cimport TimeUnits
+
+
+cdef class DateArray(object):
+    # immutable sequence of dates stored as a contiguous int32 array of serial numbers;
+    # numpy.asarray gives a read-only view of the serials without copying
+    def __init__(self, dates=()):
+        if isinstance(dates, DateArray):
+            self._set_data((<DateArray>dates)._data)
+            return
+
+        import numpy as np
+        values = np.asarray(dates)
+        if values.dtype.kind in 'iuM':
+            serials = np.array(to_serial_array(values))
+        elif values.size == 0:
+            serials = np.empty(0, dtype=np.intc)
+        else:
+            serials = np.array([check_date(d).__serial_number__ for d in values.ravel().tolist()], dtype=np.intc)
+
+        if serials.shape[0] and (serials.min() < MIN_SERIAL or serials.max() > MAX_SERIAL):
+            raise ValueError("serial numbers must be in [{0:d}, {1:d}], i.e. dates in [1901, 2199]"
+                             .format(MIN_SERIAL, MAX_SERIAL))
+        self._set_data(serials)
+
+    cdef _set_data(self, serials):
+        serials.flags.writeable = False
+        self._data = serials
+        self._serials = serials
+        self._shape[0] = serials.shape[0]
+        self._strides[0] = sizeof(int)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef year(self):
+        cdef Py_ssize_t i
+        cdef int y
+        cdef int m
+        cdef int d
+        import numpy as np
+        result = np.empty(self._serials.shape[0], dtype=np.intc)
+        cdef int[::1] out = result
+
+        for i in range(self._serials.shape[0]):
+            serial_to_ymd(self._serials[i], &y, &m, &d)
+            out[i] = y
+        return result
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef month(self):
+        cdef Py_ssize_t i
+        cdef int y
+        cdef int m
+        cdef int d
+        import numpy as np
+        result = np.empty(self._serials.shape[0], dtype=np.intc)
+        cdef int[::1] out = result
+
+        for i in range(self._serials.shape[0]):
+            serial_to_ymd(self._serials[i], &y, &m, &d)
+            out[i] = m
+        return result
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef day_of_month(self):
+        cdef Py_ssize_t i
+        cdef int y
+        cdef int m
+        cdef int d
+        import numpy as np
+        result = np.empty(self._serials.shape[0], dtype=np.intc)
+        cdef int[::1] out = result
+
+        for i in range(self._serials.shape[0]):
+            serial_to_ymd(self._serials[i], &y, &m, &d)
+            out[i] = d
+        return result
+
+    cpdef weekday(self):
+        # 1 (Sunday) to 7 (Saturday), as Date.weekday
+        weekdays = self._data % 7
+        weekdays[weekdays == 0] = 7
+        return weekdays
+
+    cpdef to_datetime64(self):
+        return serials_to_datetime64(self._data)
+
+    cpdef list tolist(self):
+        return [date_from_serial(s) for s in self._data.tolist()]
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        if flags & PyBUF_WRITABLE:
+            raise BufferError("DateArray is read-only")
+        buffer.buf = <char *>&self._serials[0] if self._serials.shape[0] else NULL
+        buffer.obj = self
+        buffer.len = self._serials.shape[0] * sizeof(int)
+        buffer.readonly = 1
+        buffer.itemsize = sizeof(int)
+        buffer.format = NULL
+        if flags & PyBUF_FORMAT:
+            buffer.format = b'i'
+        buffer.ndim = 1
+        buffer.shape = self._shape if flags & PyBUF_ND else NULL
+        buffer.strides = self._strides if flags & PyBUF_STRIDES == PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
+
+    def __len__(self):
+        return self._serials.shape[0]
+
+    def __getitem__(self, item):
+        import numpy as np
+        if isinstance(item, slice) or not np.isscalar(item):
+            return date_array_from_serials(self._data[item])
+        return date_from_serial(self._data[item])
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __richcmp__(self, other, int op):
+        import numpy as np
+        if isinstance(other, DateArray):
+            other = (<DateArray>other)._data
+        elif isinstance(other, (int, np.integer)) or isinstance(other, np.ndarray) and other.dtype.kind in 'iu':
+            # serial numbers
+            pass
+        elif isinstance(other, (np.ndarray, list, tuple)):
+            other = DateArray(other)._data
+        else:
+            other = check_date(other).__serial_number__
+        if op == 0:
+            return self._data < other
+        elif op == 1:
+            return self._data <= other
+        elif op == 2:
+            return self._data == other
+        elif op == 3:
+            return self._data != other
+        elif op == 4:
+            return self._data > other
+        elif op == 5:
+            return self._data >= other
+
+    def __add__(self, period):
+        if not isinstance(self, DateArray):
+            self, period = period, self
+        # Integral covers numpy integer scalars, which would otherwise fall through to numpy and give a raw
+        # serial array
+        if not isinstance(period, (Period, basestring, Integral)):
+            return NotImplemented
+        return _advance(self, period, 1)
+
+    def __sub__(self, period):
+        # DateArray - DateArray or Date gives the day differences
+        if not isinstance(self, DateArray):
+            return NotImplemented
+        elif isinstance(period, DateArray):
+            return (<DateArray>self)._data - (<DateArray>period)._data
+        elif isinstance(period, Date):
+            return (<DateArray>self)._data - (<Date>period).__serial_number__
+        elif not isinstance(period, (Period, basestring, Integral)):
+            return NotImplemented
+        return _advance(self, period, -1)
+
+    def __str__(self):
+        return str(self.to_datetime64())
+
+    def __repr__(self):
+        return "DateArray({0})".format([str(d) for d in self.to_datetime64()])
+
+    def __reduce_ex__(self, protocol):
+        # the serials as little-endian int32; from protocol 5 on they can travel out-of-band, and are
+        # wrapped again without a copy when loaded
+        serials = self._data.astype('<i4', copy=False)
+        if protocol >= 5:
+            from pickle import PickleBuffer
+            return _unpickle_date_array, (PickleBuffer(serials),)
+        return _unpickle_date_array, (serials.tobytes(),)
+
+
+cdef DateArray date_array_from_serials(serials, bint owned=False):
+    # wraps serials already known to be in [MIN_SERIAL, MAX_SERIAL], without validation. The array is
+    # made read-only, so a writable one is copied unless the caller hands it over (owned)
+    cdef DateArray result = DateArray.__new__(DateArray)
+    import numpy as np
+    values = np.ascontiguousarray(serials, dtype=np.intc)
+    if not owned and values is serials and values.flags.writeable:
+        values = values.copy()
+    result._set_data(values)
+    return result
+
+def _unpickle_date_array(buffer):
+    import numpy as np
+    serials = np.frombuffer(buffer, dtype='<i4')
+    if serials.shape[0] and (serials.min() < MIN_SERIAL or serials.max() > MAX_SERIAL):
+        raise ValueError("serial numbers must be in [{0:d}, {1:d}], i.e. dates in [1901, 2199]"
+                         .format(MIN_SERIAL, MAX_SERIAL))
+    return date_array_from_serials(serials)
+
+# implementation detail
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef DateArray _advance(DateArray dates, period, int sign):
+    cdef Period p
+    cdef int n
+    cdef int units
+    cdef Py_ssize_t i
+    cdef const int[::1] serials = dates._serials
+    import numpy as np
+    result = np.empty(serials.shape[0], dtype=np.intc)
+    cdef int[::1] out = result
+
+    if isinstance(period, Integral):
+        p = Period(length=int(period), units=TimeUnits.Days)
+    else:
+        p = check_period(period)
+    n = sign * p.length()
+    units = p.units()
+
+    for i in range(serials.shape[0]):
+        out[i] = advance_serial(serials[i], n, units)
+        if out[i] == 0:
+            raise ValueError("date {0} advanced by {1} is out of bound. It must be in [1901, 2199]"
+                             .format(date_from_serial(serials[i]), p if sign > 0 else -p))
+    return date_array_from_serials(result, True)
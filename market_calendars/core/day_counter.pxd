@@ -0,0 +1,19 @@
+from .date cimport Date
+from .calendar cimport Calendar, CalendarImpl
+
+cdef class DayCounter(object):
+    cdef readonly int convention
+    cdef readonly Calendar calendar
+    cdef CalendarImpl _impl
+
+    cpdef int day_count(self, Date d1, Date d2)
+    cpdef double year_fraction(self, Date d1, Date d2)
+    cpdef day_count_batch(self, start, end)
+    cpdef year_fraction_batch(self, start, end)
+    cpdef accrual_fractions(self, dates)
+
+
+# C API for Cython extensions, serial in / serial out and callable without the GIL; serials must be in
+# [MIN_SERIAL, MAX_SERIAL] and impl is only used, and must not be None, for Business/252
+cdef int dc_day_count(int convention, CalendarImpl impl, int s1, int s2) nogil
+cdef double dc_year_fraction(int convention, CalendarImpl impl, int s1, int s2) nogil
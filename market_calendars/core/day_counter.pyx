@@ -0,0 +1,202 @@
+import cython
+from .enums._day_counters cimport DayCounters
+from .date cimport Date, serial_from_ymd, serial_to_ymd, to_serial_array
+from .date_array import DateArray
+from .calendar cimport Calendar, CalendarImpl, calendar_biz_days_between
+from .schedule cimport Schedule
+
+_NAMES = ['Actual/360', 'Actual/365 (Fixed)', 'Actual/Actual (ISDA)', '30/360 (US)', '30E/360', '30E/360 (ISDA)',
+          'Business/252']
+
+_ALIASES = {'actual/360': DayCounters.Actual360,
+            'act/360': DayCounters.Actual360,
+            'actual/365 (fixed)': DayCounters.Actual365Fixed,
+            'actual/365f': DayCounters.Actual365Fixed,
+            'act/365f': DayCounters.Actual365Fixed,
+            'actual/actual (isda)': DayCounters.ActualActualISDA,
+            'act/act (isda)': DayCounters.ActualActualISDA,
+            'act/act': DayCounters.ActualActualISDA,
+            '30/360 (us)': DayCounters.Thirty360US,
+            '30/360': DayCounters.Thirty360US,
+            '30u/360': DayCounters.Thirty360US,
+            '30e/360': DayCounters.Thirty360European,
+            '30e/360 (isda)': DayCounters.Thirty360ISDA,
+            '30e/360 isda': DayCounters.Thirty360ISDA,
+            'business/252': DayCounters.Business252,
+            'bus/252': DayCounters.Business252}
+
+
+cdef class DayCounter(object):
+    # day counts and year fractions between dates under one convention; Business/252 counts the
+    # business days of the given calendar
+    def __init__(self, convention, Calendar calendar=None):
+        if isinstance(convention, basestring):
+            try:
+                convention = _ALIASES[convention.lower()]
+            except KeyError:
+                raise ValueError("{0} is not a known day counter, e.g. {1}".format(convention, ', '.join(_NAMES)))
+        elif not 0 <= convention < len(_NAMES):
+            raise ValueError("unknown day counter convention {0}".format(convention))
+        if convention == DayCounters.Business252 and calendar is None:
+            raise ValueError("Business/252 needs a calendar to count business days")
+
+        self.convention = convention
+        self.calendar = calendar
+        self._impl = calendar._impl if calendar is not None else None
+
+    @property
+    def name(self):
+        return _NAMES[self.convention]
+
+    cpdef int day_count(self, Date d1, Date d2):
+        return dc_day_count(self.convention, self._impl, d1.__serial_number__, d2.__serial_number__)
+
+    cpdef double year_fraction(self, Date d1, Date d2):
+        return dc_year_fraction(self.convention, self._impl, d1.__serial_number__, d2.__serial_number__)
+
+    cpdef day_count_batch(self, start, end):
+        # start and end are broadcast against each other: datetime64, int serial, DateArray or Date sequences
+        return _batch(self, start, end, False)
+
+    cpdef year_fraction_batch(self, start, end):
+        return _batch(self, start, end, True)
+
+    cpdef accrual_fractions(self, dates):
+        # year fractions of the periods between consecutive dates, e.g. of a Schedule
+        if isinstance(dates, Schedule):
+            dates = (<Schedule>dates).dates_array()
+        serials = _serials(dates)
+        return _batch(self, serials[:-1], serials[1:], True)
+
+    def __richcmp__(DayCounter self, right, int op):
+        # the calendar only matters to Business/252, and compares by its holiday tables, shared by all the names
+        # of a centre
+        if op == 2 or op == 3:
+            equal = isinstance(right, DayCounter) and self.convention == (<DayCounter>right).convention \
+                    and (self.convention != DayCounters.Business252 or self._impl is (<DayCounter>right)._impl)
+            return equal if op == 2 else not equal
+        return NotImplemented
+
+    def __repr__(self):
+        if self.calendar is None:
+            return "DayCounter('{0}')".format(self.name)
+        return "DayCounter('{0}', Calendar('{1}'))".format(self.name, self.calendar.name)
+
+    def __reduce__(self):
+        return DayCounter, (self.convention, self.calendar)
+
+# implementation detail
+
+cdef inline bint _isLeap(int year) nogil:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+cdef inline int _monthDays(int year, int month) nogil:
+    if month == 2:
+        return 29 if _isLeap(year) else 28
+    elif month == 4 or month == 6 or month == 9 or month == 11:
+        return 30
+    return 31
+
+cdef int _thirty360(int convention, int s1, int s2) nogil:
+    cdef int y1
+    cdef int m1
+    cdef int d1
+    cdef int y2
+    cdef int m2
+    cdef int d2
+
+    serial_to_ymd(s1, &y1, &m1, &d1)
+    serial_to_ymd(s2, &y2, &m2, &d2)
+    if convention == DayCounters.Thirty360US:
+        # bond basis: the end date is only cut to the 30th when the start date is
+        if d1 == 31:
+            d1 = 30
+        if d2 == 31 and d1 == 30:
+            d2 = 30
+    elif convention == DayCounters.Thirty360European:
+        d1 = min(d1, 30)
+        d2 = min(d2, 30)
+    else:
+        # month ends become the 30th, February included; the exception for a February maturity is
+        # left to the caller, as the counter does not know which date is the maturity
+        if d1 == _monthDays(y1, m1):
+            d1 = 30
+        if d2 == _monthDays(y2, m2):
+            d2 = 30
+    return 360 * (y2 - y1) + 30 * (m2 - m1) + d2 - d1
+
+cdef double _actualActualISDA(int s1, int s2) nogil:
+    cdef int y1
+    cdef int y2
+    cdef int m
+    cdef int d
+    cdef double days1
+    cdef double days2
+
+    if s1 > s2:
+        return -_actualActualISDA(s2, s1)
+    serial_to_ymd(s1, &y1, &m, &d)
+    serial_to_ymd(s2, &y2, &m, &d)
+    days1 = 366.0 if _isLeap(y1) else 365.0
+    if y1 == y2:
+        return (s2 - s1) / days1
+    # the rest of the first year and the start of the last one over their own lengths, whole years in between
+    days2 = 366.0 if _isLeap(y2) else 365.0
+    return (serial_from_ymd(y1, 12, 31) + 1 - s1) / days1 + (y2 - y1 - 1) + (s2 - serial_from_ymd(y2, 1, 1)) / days2
+
+cdef int dc_day_count(int convention, CalendarImpl impl, int s1, int s2) nogil:
+    if convention == DayCounters.Business252:
+        if s1 <= s2:
+            return calendar_biz_days_between(impl, s1, s2, True, False)
+        return -calendar_biz_days_between(impl, s2, s1, True, False)
+    elif convention >= DayCounters.Thirty360US:
+        return _thirty360(convention, s1, s2)
+    return s2 - s1
+
+cdef double dc_year_fraction(int convention, CalendarImpl impl, int s1, int s2) nogil:
+    if convention == DayCounters.Actual360:
+        return (s2 - s1) / 360.0
+    elif convention == DayCounters.Actual365Fixed:
+        return (s2 - s1) / 365.0
+    elif convention == DayCounters.ActualActualISDA:
+        return _actualActualISDA(s1, s2)
+    elif convention == DayCounters.Business252:
+        return dc_day_count(convention, impl, s1, s2) / 252.0
+    return _thirty360(convention, s1, s2) / 360.0
+
+cdef object _serials(dates):
+    # int32 serial numbers of dates in [1901, 2199], in the shape of dates; to_serial_array rejects NaT
+    # and out of range values before narrowing them
+    import numpy as np
+    values = np.asarray(dates)
+    if values.dtype.kind not in 'iuM':
+        values = np.asarray(DateArray(values.ravel())).reshape(values.shape)
+    return to_serial_array(values).reshape(values.shape)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _batch(DayCounter dc, start, end, bint fraction):
+    cdef Py_ssize_t i
+    cdef int convention = dc.convention
+    cdef CalendarImpl impl = dc._impl
+    import numpy as np
+    start, end = np.broadcast_arrays(_serials(start), _serials(end))
+    shape = start.shape
+    cdef const int[::1] s1 = np.ascontiguousarray(start.ravel())
+    cdef const int[::1] s2 = np.ascontiguousarray(end.ravel())
+    cdef int[::1] counts
+    cdef double[::1] fractions
+
+    if fraction:
+        result = np.empty(s1.shape[0], dtype=np.float64)
+        fractions = result
+        with nogil:
+            for i in range(s1.shape[0]):
+                fractions[i] = dc_year_fraction(convention, impl, s1[i], s2[i])
+    else:
+        result = np.empty(s1.shape[0], dtype=np.intc)
+        counts = result
+        with nogil:
+            for i in range(s1.shape[0]):
+                counts[i] = dc_day_count(convention, impl, s1[i], s2[i])
+    return result.reshape(shape)
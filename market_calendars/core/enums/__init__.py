@@ -3,10 +3,12 @@ from .weekdays import Weekdays
 from .time_units import TimeUnits
 from .bizday_conventions import BizDayConventions
 from .date_generation import DateGeneration
+from .day_counters import DayCounters
 
 __all__ = ['Months',
            'Weekdays',
            'TimeUnits',
            'BizDayConventions',
-           'DateGeneration']
+           'DateGeneration',
+           'DayCounters']
 
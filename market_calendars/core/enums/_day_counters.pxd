@@ -0,0 +1,8 @@
+cdef public enum DayCounters:
+    Actual360 = 0
+    Actual365Fixed = 1
+    ActualActualISDA = 2
+    Thirty360US = 3
+    Thirty360European = 4
+    Thirty360ISDA = 5
+    Business252 = 6
\ No newline at end of file
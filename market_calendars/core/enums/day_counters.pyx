@@ -0,0 +1,10 @@
+from ._day_counters cimport DayCounters as dcs
+
+cpdef enum DayCounters:
+    Actual360 = dcs.Actual360
+    Actual365Fixed = dcs.Actual365Fixed
+    ActualActualISDA = dcs.ActualActualISDA
+    Thirty360US = dcs.Thirty360US
+    Thirty360European = dcs.Thirty360European
+    Thirty360ISDA = dcs.Thirty360ISDA
+    Business252 = dcs.Business252
@@ -20,6 +20,7 @@ cdef class Schedule(object):
     cdef public Date _evaluation_date
 
     cpdef size_t size(self)
+    cpdef dates_array(self)
     cpdef bint is_regular(self, size_t i)
     cpdef Calendar calendar(self)
     cpdef Period tenor(self)
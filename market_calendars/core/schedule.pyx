@@ -1,10 +1,18 @@
 from .calendar cimport Calendar
+from .calendar cimport CalendarImpl
 from .date cimport Date
+from .date cimport to_serial_array
+from .date cimport serials_to_datetime64
+from .date cimport serial_from_ymd
+from .date cimport serial_to_ymd
+from .date cimport date_from_serial
+from .date_array cimport date_array_from_serials
 from .period cimport Period
 from .enums._bizday_conventions cimport BizDayConventions
 from .enums._time_units cimport TimeUnits
 from .enums._date_generation cimport DateGeneration
 from .assert_utils cimport py_assert
+from .period import check_period
 
 cdef class Schedule(object):
     def __init__(self,
@@ -20,15 +28,9 @@ cdef class Schedule(object):
                  Date next_to_last_date=None,
                  Date evaluation_date=None):
 
-        cdef int i
-        cdef size_t date_len
-        cdef Calendar null_calendar
         cdef Date eval_date
         cdef int y
-        cdef int periods
-        cdef Date seed
-        cdef Date temp
-        cdef Date exit_date
+        cdef list serials
 
         # Initialize private data
         self._effective_date = effective_date
@@ -38,8 +40,6 @@ cdef class Schedule(object):
         self._convention = convention
         self._termination_convention = termination_convention
         self._rule = date_generation_rule
-        self._dates = []
-        self._is_regular = []
 
         if tenor < Period("1M"):
             self._end_of_month = False
@@ -109,168 +109,32 @@ cdef class Schedule(object):
             else:
                 raise ValueError("unknown rule ({0:d})".format(self._rule))
 
-        # calendar needed for endOfMonth adjustment
-        null_calendar = Calendar("Null")
-        periods = 1
-
         if self._rule == DateGeneration.Zero:
             self._tenor = Period(length=0, units=TimeUnits.Years)
-            self._dates.extend([effective_date, termination_date])
-            self._is_regular.append(True)
-        elif self._rule == DateGeneration.Backward:
-            self._dates.append(termination_date)
-            seed = termination_date
-            if self._next_to_last_date:
-                self._dates.insert(0, self._next_to_last_date)
-                temp = null_calendar.advance_date(seed,
-                                                Period(length=-periods * self._tenor.length(),
-                                                       units=self._tenor.units()),
-                                                convention, self._end_of_month)
-                if temp != self._next_to_last_date:
-                    self._is_regular.insert(0, False)
-                else:
-                    self._is_regular.insert(0, True)
-                seed = self._next_to_last_date
-
-            exit_date = effective_date
-            if self._first_date:
-                exit_date = self._first_date
-
-            while True:
-                temp = null_calendar.advance_date(seed,
-                                                Period(length=-periods * self._tenor.length(),
-                                                       units=self._tenor.units()),
-                                                convention, self._end_of_month)
-                if temp < exit_date:
-                    if self._first_date and self._cal.adjust_date(self._dates[0], convention) != self._cal.adjust_date(
-                            self._first_date, convention):
-                        self._dates.insert(0, self._first_date)
-                        self._is_regular.insert(0, False)
-                    break
-                else:
-                    # skip dates that would result in duplicates
-                    # after adjustment
-                    if self._cal.adjust_date(self._dates[0], convention) != self._cal.adjust_date(temp, convention):
-                        self._dates.insert(0, temp)
-                        self._is_regular.insert(0, True)
-                    periods += 1
-
-            if self._cal.adjust_date(self._dates[0], convention) != self._cal.adjust_date(effective_date, convention):
-                self._dates.insert(0, effective_date)
-                self._is_regular.insert(0, False)
-
-        elif self._rule == DateGeneration.Forward:
-            self._dates.append(effective_date)
-
-            seed = self._dates[-1]
-
-            if self._first_date:
-                self._dates.append(self._first_date)
-                temp = null_calendar.advance_date(seed,
-                                                Period(length=periods * self._tenor.length(),
-                                                       units=self._tenor.units()),
-                                                convention, self._end_of_month)
-                if temp != self._first_date:
-                    self._is_regular.append(False)
-                else:
-                    self._is_regular.append(True)
-                seed = self._first_date
-
-            exit_date = termination_date
-            if self._next_to_last_date:
-                exit_date = self._next_to_last_date
-
-            while True:
-                temp = null_calendar.advance_date(seed,
-                                                Period(length=periods * self._tenor.length(),
-                                                       units=self._tenor.units()),
-                                                convention, self._end_of_month)
-                if temp > exit_date:
-                    if self._next_to_last_date and self._cal.adjust_date(self._dates[-1],
-                                                                        convention) != self._cal.adjust_date(
-                        self._next_to_last_date, convention):
-                        self._dates.append(self._next_to_last_date)
-                        self._is_regular.append(False)
-                    break
-                else:
-                    # skip dates that would result in duplicates
-                    # after adjustment
-                    if self._cal.adjust_date(self._dates[-1], convention) != self._cal.adjust_date(temp, convention):
-                        self._dates.append(temp)
-                        self._is_regular.append(True)
-                    periods += 1
-
-            if self._cal.adjust_date(self._dates[-1], termination_convention) != self._cal.adjust_date(termination_date,
-                                                                                                     termination_convention):
-                self._dates.append(termination_date)
-                self._is_regular.append(False)
-        else:
-            raise ValueError("unknown rule ({0:d})".format(self._rule))
-
-        # adjustments
-        if self._end_of_month and self._cal.is_end_of_month(seed):
-            # adjust to end of month
-            if convention == BizDayConventions.Unadjusted:
-                for i in range(len(self._dates) - 1):
-                    self._dates[i] = Date.end_of_month(self._dates[i])
-            else:
-                for i in range(len(self._dates) - 1):
-                    self._dates[i] = self._cal.end_of_month(self._dates[i])
 
-            if termination_convention != BizDayConventions.Unadjusted:
-                self._dates[0] = self._cal.end_of_month(self._dates[0])
-                self._dates[-1] = self._cal.end_of_month(self._dates[-1])
-            else:
-                if self._rule == DateGeneration.Backward:
-                    self._dates[-1] = Date.end_of_month(self._dates[-1])
-                else:
-                    self._dates[0] = Date.end_of_month(self._dates[0])
-        else:
-            for i in range(len(self._dates) - 1):
-                self._dates[i] = self._cal.adjust_date(self._dates[i], convention)
-
-            if termination_convention != BizDayConventions.Unadjusted:
-                self._dates[-1] = self._cal.adjust_date(self._dates[-1], termination_convention)
-
-        # Final safety checks to remove extra next-to-last date, if
-        # necessary.  It can happen to be equal or later than the end
-        # date due to EOM adjustments (see the Schedule test suite
-        # for an example).
-
-        date_len = len(self._dates)
-
-        if date_len >= 2 and self._dates[date_len - 2] >= self._dates[-1]:
-            self._is_regular[date_len - 2] = (self._dates[date_len - 2] == self._dates[-1])
-            self._dates[date_len - 2] = self._dates[-1]
-            self._dates.pop()
-            self._is_regular.pop()
-
-        if len(self._dates) >= 2 and self._dates[1] <= self._dates[0]:
-            self._is_regular[1] = (self._dates[1] == self._dates[0])
-            self._dates[1] = self._dates[0]
-            self._dates = self._dates[1:]
-            self._is_regular = self._is_regular[1:]
-
-        py_assert(len(self._dates) >= 1, ValueError, "degenerate single date ({0}) schedule\n"
-                                                       "seed date: {1}\n"
-                                                       "exit date: {2}\n"
-                                                       "effective date: {3}\n"
-                                                       "first date: {4}\n"
-                                                       "next to last date: {5}\n"
-                                                       "termination date: {6}\n"
-                                                       "generation rule: {7}\n"
-                                                       "end of month: {8}\n"
-        .format(self._dates[0],
-                seed, exit_date,
-                effective_date,
-                first_date,
-                next_to_last_date,
-                termination_date,
-                self._rule, self._end_of_month))
+        serials = []
+        self._is_regular = []
+        _generate(self._cal._impl,
+                  effective_date.__serial_number__,
+                  termination_date.__serial_number__,
+                  self._tenor.length(),
+                  self._tenor.units(),
+                  convention,
+                  termination_convention,
+                  self._rule,
+                  self._end_of_month,
+                  self._first_date.__serial_number__ if self._first_date else 0,
+                  self._next_to_last_date.__serial_number__ if self._next_to_last_date else 0,
+                  serials,
+                  self._is_regular)
+        self._dates = [date_from_serial(s) for s in serials]
 
     cpdef size_t size(self):
         return len(self._dates)
 
+    cpdef dates_array(self):
+        return date_array_from_serials([d.__serial_number__ for d in self._dates])
+
     cpdef Calendar calendar(self):
         return self._cal
 
@@ -299,20 +163,31 @@ cdef class Schedule(object):
                         self._next_to_last_date,
                         self._evaluation_date)
 
-    def __reduce__(self):
-        d = {}
-
-        return Schedule, (self._effective_date,
-                          self._termination_date,
-                          self._tenor,
-                          self._cal,
-                          self._convention,
-                          self._termination_convention,
-                          self._rule,
-                          self._end_of_month,
-                          self._first_date,
-                          self._next_to_last_date,
-                          self._evaluation_date), d
+    def __reduce_ex__(self, protocol):
+        # the generated dates travel as packed little-endian int32 serials, out-of-band from protocol 5
+        # on, and the regularity flags as bytes, so that unpickling does not run the generation again. A
+        # missing effective date, left to the Backward rule, is 0
+        import numpy as np
+        serials = np.array([d.__serial_number__ for d in self._dates], dtype='<i4')
+        if protocol >= 5:
+            from pickle import PickleBuffer
+            serials = PickleBuffer(serials)
+        else:
+            serials = serials.tobytes()
+        return _unpickle_schedule, (self._effective_date.__serial_number__ if self._effective_date else 0,
+                                    self._termination_date.__serial_number__,
+                                    self._tenor.length(),
+                                    self._tenor.units(),
+                                    self._cal,
+                                    self._convention,
+                                    self._termination_convention,
+                                    self._rule,
+                                    self._end_of_month,
+                                    self._first_date.__serial_number__ if self._first_date else 0,
+                                    self._next_to_last_date.__serial_number__ if self._next_to_last_date else 0,
+                                    self._evaluation_date.__serial_number__,
+                                    serials,
+                                    np.array(self._is_regular, dtype=np.bool_).tobytes())
 
     def __setstate__(self, state):
         pass
@@ -330,3 +205,295 @@ cdef class Schedule(object):
                    and self._first_date == other._first_date \
                    and self._next_to_last_date == other._next_to_last_date \
                    and self._evaluation_date == other._evaluation_date
+
+
+def _unpickle_schedule(int effective,
+                       int termination,
+                       int length,
+                       int units,
+                       Calendar calendar,
+                       int convention,
+                       int termination_convention,
+                       int rule,
+                       bint end_of_month,
+                       int first,
+                       int next_to_last,
+                       int evaluation,
+                       serials,
+                       is_regular):
+    cdef Schedule schedule = Schedule.__new__(Schedule)
+    import numpy as np
+
+    schedule._effective_date = date_from_serial(effective) if effective else None
+    schedule._termination_date = date_from_serial(termination)
+    schedule._tenor = Period(length=length, units=units)
+    schedule._cal = calendar
+    schedule._convention = convention
+    schedule._termination_convention = termination_convention
+    schedule._rule = rule
+    schedule._end_of_month = end_of_month
+    schedule._first_date = date_from_serial(first) if first else None
+    schedule._next_to_last_date = date_from_serial(next_to_last) if next_to_last else None
+    schedule._evaluation_date = date_from_serial(evaluation)
+    schedule._dates = [date_from_serial(s) for s in np.frombuffer(serials, dtype='<i4').tolist()]
+    schedule._is_regular = np.frombuffer(is_regular, dtype=np.bool_).tolist()
+    return schedule
+
+
+def schedule_batch(effective_dates,
+                   termination_dates,
+                   tenors,
+                   Calendar calendar,
+                   int convention=BizDayConventions.Following,
+                   int termination_convention=BizDayConventions.Following,
+                   int date_generation_rule=DateGeneration.Forward,
+                   bint end_of_month=False,
+                   bint as_schedules=False):
+    # one schedule per (effective, termination, tenor), all sharing the calendar tables
+    cdef int[::1] effective = to_serial_array(effective_dates)
+    cdef int[::1] termination = to_serial_array(termination_dates)
+    cdef Py_ssize_t n = effective.shape[0]
+    cdef Py_ssize_t i
+    cdef Period tenor
+    cdef Schedule schedule
+    cdef int rule
+    cdef bint eom
+    cdef list serials = []
+    cdef list is_regular
+    cdef Date evaluation_date = Date.today_date()
+    import numpy as np
+
+    if termination.shape[0] != n:
+        raise ValueError("{0:d} effective dates but {1:d} termination dates".format(n, termination.shape[0]))
+    if isinstance(tenors, (Period, str)):
+        tenors = [check_period(tenors)] * n
+    elif len(tenors) != n:
+        raise ValueError("{0:d} effective dates but {1:d} tenors".format(n, len(tenors)))
+    else:
+        tenors = [check_period(t) for t in tenors]
+
+    schedules = []
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    for i in range(n):
+        tenor = tenors[i]
+        if effective[i] >= termination[i]:
+            raise ValueError("effective date ({0}) later than or equal to termination date ({1})"
+                             .format(Date(serial_number=effective[i]), Date(serial_number=termination[i])))
+        if tenor.length() < 0:
+            raise ValueError("non positive tenor ({0:d}) not allowed".format(tenor.length()))
+
+        rule = DateGeneration.Zero if tenor.length() == 0 else date_generation_rule
+        eom = end_of_month and not tenor < _oneMonth
+        is_regular = []
+        _generate(calendar._impl, effective[i], termination[i], tenor.length(), tenor.units(), convention,
+                  termination_convention, rule, eom, 0, 0, serials, is_regular)
+
+        if as_schedules:
+            schedule = Schedule.__new__(Schedule)
+            schedule._effective_date = date_from_serial(effective[i])
+            schedule._termination_date = date_from_serial(termination[i])
+            schedule._tenor = _zeroTenor if rule == DateGeneration.Zero else tenor
+            schedule._cal = calendar
+            schedule._convention = convention
+            schedule._termination_convention = termination_convention
+            schedule._rule = rule
+            schedule._end_of_month = eom
+            schedule._evaluation_date = evaluation_date
+            schedule._dates = [date_from_serial(s) for s in serials]
+            schedule._is_regular = is_regular
+            schedules.append(schedule)
+            serials = []
+        else:
+            offsets[i + 1] = len(serials)
+
+    if as_schedules:
+        return schedules
+    result = np.array(serials, dtype=np.intc)
+    if np.asarray(effective_dates).dtype.kind == 'M':
+        result = serials_to_datetime64(result)
+    return result, offsets
+
+
+# implementation detail
+
+cdef Period _oneMonth = Period("1M")
+cdef Period _zeroTenor = Period(length=0, units=TimeUnits.Years)
+
+# calendar needed for endOfMonth adjustment, compiled on first use
+cdef CalendarImpl _nullImpl = None
+
+
+cdef CalendarImpl _null_impl():
+    global _nullImpl
+    if _nullImpl is None:
+        _nullImpl = Calendar("Null")._impl
+    return _nullImpl
+
+
+cdef inline int _checked(int serial) except 0:
+    if serial == -1:
+        raise ValueError("unknown business-day convention")
+    elif serial == 0:
+        raise ValueError("schedule date is out of bound. It must be in [1901, 2199]")
+    return serial
+
+
+cdef int _month_end(int serial) nogil:
+    # calendar (not business) last day of the month, as Date.end_of_month
+    cdef int y
+    cdef int m
+    cdef int d
+
+    serial_to_ymd(serial, &y, &m, &d)
+    if m == 12:
+        return serial_from_ymd(y, 12, 31)
+    return serial_from_ymd(y, m + 1, 1) - 1
+
+
+cdef int _generate(CalendarImpl impl,
+                   int effective,
+                   int termination,
+                   int length,
+                   int units,
+                   int convention,
+                   int termination_convention,
+                   int rule,
+                   bint end_of_month,
+                   int first,
+                   int next_to_last,
+                   list dates,
+                   list is_regular) except -1:
+    # appends the schedule serials to dates, and the regularity of each period to is_regular
+    cdef int periods = 1
+    cdef int seed = 0
+    cdef int exit_date = 0
+    cdef int temp
+    cdef Py_ssize_t i
+    cdef Py_ssize_t date_len
+    cdef list generated = []
+    cdef CalendarImpl null_impl = _null_impl()
+
+    if rule == DateGeneration.Zero:
+        generated.extend([effective, termination])
+        is_regular.append(True)
+    elif rule == DateGeneration.Backward:
+        # generated from the termination date, in reverse order
+        generated.append(termination)
+        seed = termination
+        if next_to_last:
+            generated.append(next_to_last)
+            temp = _checked(null_impl.advanceSerial(seed, -periods * length, units, convention, end_of_month))
+            is_regular.append(temp == next_to_last)
+            seed = next_to_last
+
+        exit_date = effective
+        if first:
+            exit_date = first
+
+        while True:
+            temp = _checked(null_impl.advanceSerial(seed, -periods * length, units, convention, end_of_month))
+            if temp < exit_date:
+                if first and _checked(impl.adjustSerial(generated[-1], convention)) \
+                        != _checked(impl.adjustSerial(first, convention)):
+                    generated.append(first)
+                    is_regular.append(False)
+                break
+            else:
+                # skip dates that would result in duplicates
+                # after adjustment
+                if _checked(impl.adjustSerial(generated[-1], convention)) \
+                        != _checked(impl.adjustSerial(temp, convention)):
+                    generated.append(temp)
+                    is_regular.append(True)
+                periods += 1
+
+        if _checked(impl.adjustSerial(generated[-1], convention)) != _checked(impl.adjustSerial(effective, convention)):
+            generated.append(effective)
+            is_regular.append(False)
+
+        generated.reverse()
+        is_regular.reverse()
+    elif rule == DateGeneration.Forward:
+        generated.append(effective)
+        seed = effective
+
+        if first:
+            generated.append(first)
+            temp = _checked(null_impl.advanceSerial(seed, periods * length, units, convention, end_of_month))
+            is_regular.append(temp == first)
+            seed = first
+
+        exit_date = termination
+        if next_to_last:
+            exit_date = next_to_last
+
+        while True:
+            temp = _checked(null_impl.advanceSerial(seed, periods * length, units, convention, end_of_month))
+            if temp > exit_date:
+                if next_to_last and _checked(impl.adjustSerial(generated[-1], convention)) \
+                        != _checked(impl.adjustSerial(next_to_last, convention)):
+                    generated.append(next_to_last)
+                    is_regular.append(False)
+                break
+            else:
+                # skip dates that would result in duplicates
+                # after adjustment
+                if _checked(impl.adjustSerial(generated[-1], convention)) \
+                        != _checked(impl.adjustSerial(temp, convention)):
+                    generated.append(temp)
+                    is_regular.append(True)
+                periods += 1
+
+        if _checked(impl.adjustSerial(generated[-1], termination_convention)) \
+                != _checked(impl.adjustSerial(termination, termination_convention)):
+            generated.append(termination)
+            is_regular.append(False)
+    else:
+        raise ValueError("unknown rule ({0:d})".format(rule))
+
+    # adjustments
+    if end_of_month and seed and impl.isEndOfMonthSerial(seed):
+        # adjust to end of month
+        if convention == BizDayConventions.Unadjusted:
+            for i in range(len(generated) - 1):
+                generated[i] = _month_end(generated[i])
+        else:
+            for i in range(len(generated) - 1):
+                generated[i] = _checked(impl.endOfMonthSerial(generated[i]))
+
+        if termination_convention != BizDayConventions.Unadjusted:
+            generated[0] = _checked(impl.endOfMonthSerial(generated[0]))
+            generated[-1] = _checked(impl.endOfMonthSerial(generated[-1]))
+        else:
+            if rule == DateGeneration.Backward:
+                generated[-1] = _month_end(generated[-1])
+            else:
+                generated[0] = _month_end(generated[0])
+    else:
+        for i in range(len(generated) - 1):
+            generated[i] = _checked(impl.adjustSerial(generated[i], convention))
+
+        if termination_convention != BizDayConventions.Unadjusted:
+            generated[-1] = _checked(impl.adjustSerial(generated[-1], termination_convention))
+
+    # Final safety checks to remove extra next-to-last date, if
+    # necessary.  It can happen to be equal or later than the end
+    # date due to EOM adjustments (see the Schedule test suite
+    # for an example).
+
+    date_len = len(generated)
+
+    if date_len >= 2 and generated[date_len - 2] >= generated[-1]:
+        is_regular[date_len - 2] = (generated[date_len - 2] == generated[-1])
+        generated[date_len - 2] = generated[-1]
+        generated.pop()
+        is_regular.pop()
+
+    if len(generated) >= 2 and generated[1] <= generated[0]:
+        is_regular[1] = (generated[1] == generated[0])
+        generated[1] = generated[0]
+        del generated[0]
+        del is_regular[0]
+
+    dates.extend(generated)
+    return 0
@@ -1,18 +1,20 @@
-from pytz import timezone
-from .core import Calendar
 from market_calendars import MarketCalendar
+from .market_calendar import cached_core_calendar, cached_timezone
 
 
 class ChinaSSECalendar(MarketCalendar):
     aliases = ['China.SSE', 'china.sse', 'China.sse']
+    # morning and afternoon sessions around the 11:30-13:00 lunch break
+    sessions = (('09:30', '11:30'), ('13:00', '15:00'))
+
     @property
     def name(self):
         return 'China.SSE'
 
     @property
     def tz(self):
-        return timezone('Asia/Shanghai')
+        return cached_timezone('Asia/Shanghai')
 
     @property
     def core_calendar(self):
-        return Calendar('China.SSE')
\ No newline at end of file
+        return cached_core_calendar('China.SSE')
\ No newline at end of file
@@ -1,6 +1,5 @@
-from pytz import timezone
-from .core import Calendar
 from market_calendars import MarketCalendar
+from .market_calendar import cached_core_calendar, cached_timezone
 
 
 class NullCalendar(MarketCalendar):
@@ -11,8 +10,8 @@ class NullCalendar(MarketCalendar):
 
     @property
     def tz(self):
-        return timezone('Asia/Shanghai')
+        return cached_timezone('Asia/Shanghai')
 
     @property
     def core_calendar(self):
-        return Calendar('Null')
\ No newline at end of file
+        return cached_core_calendar('Null')
\ No newline at end of file
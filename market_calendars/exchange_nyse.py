@@ -1,10 +1,12 @@
-from pytz import timezone
-from .core import Calendar
 from market_calendars import MarketCalendar
+from .core import check_date, Date, Months, Weekdays
+from .market_calendar import cached_core_calendar, cached_timezone
 
 
 class NYSEExchangeCalendar(MarketCalendar):
     aliases = ['NYSE', 'NASDAQ', 'BATS']
+    sessions = (('09:30', '16:00'),)
+    early_close = '13:00'
 
     @property
     def name(self):
@@ -12,8 +14,29 @@ class NYSEExchangeCalendar(MarketCalendar):
 
     @property
     def tz(self):
-        return timezone('America/New_York')
+        return cached_timezone('America/New_York')
 
     @property
     def core_calendar(self):
-        return Calendar('nyse')
+        return cached_core_calendar('nyse')
+
+    def early_close_days(self, start_date, end_date):
+        """
+        1 pm closes: the day after Thanksgiving (since 1993), July 3rd (since 1995) and Christmas Eve (since 1993),
+        when they are business days
+        :param start_date: start date
+        :param end_date: end date
+        :return: int serial number array
+        """
+        start_date = check_date(start_date)
+        end_date = check_date(end_date)
+        cal = self.core_calendar
+        days = []
+        for year in range(max(start_date.year(), 1993), end_date.year() + 1):
+            days.append(Date.nth_weekday(4, Weekdays.Thursday, Months.November, year) + 1)
+            if year >= 1995:
+                days.append(Date(year, Months.July, 3))
+            days.append(Date(year, Months.December, 24))
+        import numpy as np
+        return np.array(sorted(d.serial_number for d in days
+                               if start_date <= d <= end_date and cal.is_biz_day(d)), dtype=np.intc)
@@ -1,45 +1,326 @@
 # Fork of zipline from Quantopian. Licensed under MIT
+import bisect
+import collections
+import datetime
 import functools
+import sys
+import threading
+import time
 import six
 from abc import ABCMeta, abstractmethod
 from .class_registry import RegisteryMeta
-from .core import check_date, check_period, TimeUnits, DateGeneration, Schedule
+from . import sessions
+from .core import (check_date, check_period, serials_to_datetime64, Calendar, Date, DateArray, TimeUnits,
+                   DateGeneration, Schedule)
 
 MarketCalendarMeta = type('MarketCalendarMeta', (ABCMeta, RegisteryMeta), {})
 
+_cache_lock = threading.Lock()
+_market_calendars = {}
+_core_calendars = {}
+_timezones = {}
+
+
+def cached_core_calendar(hol_center):
+    """
+    Process-wide core.Calendar of a holiday center, constructed on first use
+    :param hol_center: name of the holiday center, e.g. 'China.SSE'
+    :return: core.Calendar
+    """
+    try:
+        return _core_calendars[hol_center]
+    except KeyError:
+        with _cache_lock:
+            if hol_center not in _core_calendars:
+                _core_calendars[hol_center] = Calendar(hol_center)
+            return _core_calendars[hol_center]
+
+
+def cached_timezone(name):
+    """
+    Process-wide pytz time zone of the given name, constructed on first use
+    :param name: time zone name, e.g. 'Asia/Shanghai'
+    :return: pytz timezone
+    """
+    try:
+        return _timezones[name]
+    except KeyError:
+        from pytz import timezone
+        return _timezones.setdefault(name, timezone(name))
+
+
+def clear_calendar_cache():
+    """
+    Drop the cached MarketCalendar and core.Calendar instances so that they are rebuilt on next access, and the
+    memoized query results
+    """
+    with _cache_lock:
+        _market_calendars.clear()
+        _core_calendars.clear()
+    cache = _query_cache
+    if cache is not None:
+        cache.clear()
+
+
+def discard_cached_calendar(calendar_class, hol_center):
+    """
+    Drop the cached instances of one calendar, e.g. when it is redefined: its shared MarketCalendar instance, the
+    core.Calendar of its holiday center and the memoized query results
+    :param calendar_class: MarketCalendar subclass
+    :param hol_center: name of its holiday center
+    """
+    with _cache_lock:
+        _market_calendars.pop(calendar_class, None)
+        _core_calendars.pop(hol_center, None)
+    cache = _query_cache
+    if cache is not None:
+        cache.clear()
+
+
+OUTPUT_FORMATS = ('datetime', 'string', 'date', 'serial', 'datetime64', 'pandas', 'date_array')
+
+
+def convert_dates(dates, output_format='datetime'):
+    """
+    Convert a core.Date, or a sequence / serial number array of them, into the chosen output format
+    :param dates: core.Date, list of core.Date, Schedule or int serial number array
+    :param output_format: 'datetime', 'string', 'date' (core.Date), 'serial' (int serial number array),
+        'datetime64' (numpy datetime64[D] array), 'pandas' (pandas.DatetimeIndex) or 'date_array' (core.DateArray)
+    :return: dates in the chosen format; a single date gives the scalar counterpart of the format
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError('output_format {0} is not one of {1}'.format(output_format, OUTPUT_FORMATS))
+
+    if isinstance(dates, Date):
+        if output_format == 'datetime':
+            return dates.to_datetime()
+        elif output_format == 'string':
+            return str(dates)
+        elif output_format == 'date' or output_format == 'date_array':
+            return dates
+        elif output_format == 'serial':
+            return dates.serial_number
+        serials = serials_to_datetime64(dates.serial_number)
+        return serials if output_format == 'datetime64' else _pandas().Timestamp(serials)
+
+    import numpy as np
+    if isinstance(dates, np.ndarray):
+        if output_format == 'date':
+            return [Date.from_excel_serial_number(s) for s in dates.tolist()]
+        serials = dates
+    else:
+        dates = list(dates)
+        if output_format == 'date':
+            return dates
+        serials = np.fromiter((d.serial_number for d in dates), dtype=np.intc, count=len(dates))
+
+    if output_format == 'serial':
+        return serials
+    elif output_format == 'date_array':
+        return DateArray(serials)
+    elif output_format == 'datetime64':
+        return serials_to_datetime64(serials)
+    elif output_format == 'pandas':
+        return _pandas().DatetimeIndex(serials_to_datetime64(serials))
+    elif output_format == 'string':
+        return np.datetime_as_string(serials_to_datetime64(serials), unit='D').tolist()
+    return serials_to_datetime64(serials).astype('datetime64[us]').tolist()
+
+
+def _converted(dates, output_format):
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError('output_format {0} is not one of {1}'.format(output_format, OUTPUT_FORMATS))
+    return (convert_dates(d, output_format) for d in dates)
+
+
+def _pandas():
+    import pandas
+    return pandas
+
 
 def valid_output(func):
     """
-    A decorator to ensure the return date is in chosen format('string' or 'datetime.datetime')
+    A decorator to return the dates in the format chosen by the output_format keyword (see convert_dates),
+    'datetime.datetime' by default, or 'string' when return_string is set
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         return_data = func(*args, **kwargs)
-        return_string = kwargs.get('return_string', False)
-        if isinstance(return_data, list) or isinstance(return_data, Schedule):
-            return [d.to_datetime() for d in return_data] if not return_string else [str(d) for d in return_data]
-        else:
-            return return_data.to_datetime() if not return_string else str(return_data)
+        return convert_dates(return_data, _output_format(kwargs))
 
     return wrapper
 
 
+def _output_format(kwargs):
+    return kwargs.get('output_format', 'string' if kwargs.get('return_string', False) else 'datetime')
+
+
+QueryCacheInfo = collections.namedtuple('QueryCacheInfo', ['hits', 'misses', 'evictions', 'expirations', 'maxsize',
+                                                           'ttl', 'currsize'])
+
+
+class _QueryCache(object):
+    """
+    Bounded LRU cache of query results, with an optional time to live; safe to share between threads
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                expiry, value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return _MISSING
+            if expiry is not None and expiry <= _monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return _MISSING
+            # re-inserted to mark it most recently used; OrderedDict.move_to_end is py3 only
+            self._entries[key] = self._entries.pop(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        expiry = _monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (expiry, value)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def info(self):
+        with self._lock:
+            return QueryCacheInfo(self.hits, self.misses, self.evictions, self.expirations, self.maxsize, self.ttl,
+                                  len(self._entries))
+
+
+_MISSING = object()
+# py2 has no monotonic clock in the standard library
+_monotonic = getattr(time, 'monotonic', time.time)
+_query_cache = None
+
+
+def enable_query_cache(maxsize=1024, ttl=None):
+    """
+    Memoize the results of MarketCalendar.holidays, biz_days and schedule, keyed on the calendar and the normalized
+    arguments. Cached results are immutable: tuples instead of lists and read-only numpy arrays. Enabling it again
+    starts an empty cache with the new settings
+    :param maxsize: maximum number of results kept, the least recently used are evicted first
+    :param ttl: seconds a result stays valid, None to keep results until evicted
+    """
+    global _query_cache
+    if maxsize <= 0:
+        raise ValueError('cache size {0} must be positive'.format(maxsize))
+    if ttl is not None and ttl <= 0:
+        raise ValueError('time to live {0} must be positive'.format(ttl))
+    _query_cache = _QueryCache(maxsize, ttl)
+
+
+def disable_query_cache():
+    """
+    Stop memoizing MarketCalendar queries and drop the cached results
+    """
+    global _query_cache
+    _query_cache = None
+
+
+def query_cache_info():
+    """
+    Statistics of the query cache
+    :return: QueryCacheInfo(hits, misses, evictions, expirations, maxsize, ttl, currsize), None when it is disabled
+    """
+    cache = _query_cache
+    return cache.info() if cache is not None else None
+
+
+def memoized_query(normalize):
+    """
+    A decorator to serve the results of a MarketCalendar query from the query cache when it is enabled
+    :param normalize: function of the query arguments returning a hashable key that identifies the result
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = _query_cache
+            if cache is None:
+                return func(self, *args, **kwargs)
+            key = (type(self), func.__name__, normalize(*args, **kwargs))
+            result = cache.get(key)
+            if result is _MISSING:
+                result = _freeze(func(self, *args, **kwargs))
+                cache.put(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _freeze(result):
+    if isinstance(result, list):
+        return tuple(result)
+    # an array result means numpy is already imported
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(result, np.ndarray):
+        result.flags.writeable = False
+    return result
+
+
+def _range_key(start_date, end_date, **kwargs):
+    return (check_date(start_date).serial_number, check_date(end_date).serial_number,
+            kwargs.get('include_weekends', True), _output_format(kwargs))
+
+
+def _schedule_key(start_date, end_date, tenor, **kwargs):
+    tenor = check_period(tenor)
+    return (check_date(start_date).serial_number, check_date(end_date).serial_number, tenor.length(), tenor.units(),
+            kwargs.get('date_rule', 0), kwargs.get('date_generation_rule', 1), _output_format(kwargs))
+
+
 class MarketCalendar(six.with_metaclass(MarketCalendarMeta)):
     """
     An MarketCalendar represents the timing information of a single market or exchange.
     Unless otherwise noted all times are in UTC and use Pandas data structures.
     """
 
+    # local (open, close) times of the trading sessions of a day, e.g. (('09:30', '16:00'),)
+    sessions = ()
+    # local closing time of the days returned by early_close_days
+    early_close = None
+
     def __init__(self):
-        pass
+        self._boundaries = None
 
     @classmethod
     def factory(cls, name):
         """
         :param name: The name of the MarketCalendar to be retrieved.
-        :return: MarketCalendar of the desired calendar.
+        :return: MarketCalendar of the desired calendar, shared by all callers.
         """
-        return cls._regmeta_instance_factory(name)
+        calendar_class = cls._regmeta_class_factory(name)
+        try:
+            return _market_calendars[calendar_class]
+        except KeyError:
+            with _cache_lock:
+                if calendar_class not in _market_calendars:
+                    _market_calendars[calendar_class] = calendar_class()
+                return _market_calendars[calendar_class]
 
     @classmethod
     def calendar_names(cls):
@@ -75,20 +356,46 @@ class MarketCalendar(six.with_metaclass(MarketCalendarMeta)):
         """
         raise NotImplementedError()
 
+    @memoized_query(_range_key)
     @valid_output
     def holidays(self, start_date, end_date, **kwargs):
         start_date = check_date(start_date)
         end_date = check_date(end_date)
         include_weekends = kwargs.get('include_weekends', True)
-        ret_list = self.core_calendar.holiday_dates_list(start_date, end_date, include_weekends)
-        return ret_list
+        return self.core_calendar.holiday_serials(start_date, end_date, include_weekends)
 
+    @memoized_query(_range_key)
     @valid_output
     def biz_days(self, start_date, end_date, **kwargs):
         start_date = check_date(start_date)
         end_date = check_date(end_date)
-        ret_list = self.core_calendar.biz_dates_list(start_date, end_date)
-        return ret_list
+        return self.core_calendar.biz_serials(start_date, end_date)
+
+    def iter_holidays(self, start_date, end_date, backward=False, chunk_size=None, **kwargs):
+        """
+        Lazily iterate the holidays in [start_date, end_date]; memory does not grow with the length of the range and
+        the iteration can stop at any point
+        :param backward: walk from end_date back to start_date
+        :param chunk_size: None to yield the days one at a time, or the number of days per yielded chunk
+        :param include_weekends: as holidays
+        :param output_format: see convert_dates; chunks come as arrays (or lists) in that format
+        :return: generator of dates, or of chunks of dates
+        """
+        days = self.core_calendar.iter_holidays(check_date(start_date), check_date(end_date),
+                                                kwargs.get('include_weekends', True), backward, chunk_size)
+        return _converted(days, _output_format(kwargs))
+
+    def iter_biz_days(self, start_date, end_date, backward=False, chunk_size=None, **kwargs):
+        """
+        Lazily iterate the business days in [start_date, end_date]; memory does not grow with the length of the range
+        and the iteration can stop at any point
+        :param backward: walk from end_date back to start_date
+        :param chunk_size: None to yield the days one at a time, or the number of days per yielded chunk
+        :param output_format: see convert_dates; chunks come as arrays (or lists) in that format
+        :return: generator of dates, or of chunks of dates
+        """
+        days = self.core_calendar.iter_biz_days(check_date(start_date), check_date(end_date), backward, chunk_size)
+        return _converted(days, _output_format(kwargs))
 
     def is_biz_day(self, ref_date):
         ref_date = check_date(ref_date)
@@ -117,8 +424,36 @@ class MarketCalendar(six.with_metaclass(MarketCalendarMeta)):
         ref_date = check_date(ref_date)
         convention = kwargs.get('convention', 0)
         period = check_period(period)
-        return self.core_calendar.advance_date(ref_date, period, convention)
+        end_of_month = kwargs.get('end_of_month', False)
+        return self.core_calendar.advance_date(ref_date, period, convention, end_of_month)
 
+    def is_biz_day_batch(self, ref_dates):
+        """
+        :param ref_dates: numpy datetime64 or int serial number array
+        :return: numpy bool array
+        """
+        return self.core_calendar.is_biz_day_batch(ref_dates)
+
+    def adjust_date_batch(self, ref_dates, **kwargs):
+        """
+        :param ref_dates: numpy datetime64 or int serial number array
+        :return: numpy array of the same kind and shape as ref_dates
+        """
+        convention = kwargs.get('convention', 0)
+        return self.core_calendar.adjust_date_batch(ref_dates, convention)
+
+    def advance_date_batch(self, ref_dates, period, **kwargs):
+        """
+        :param ref_dates: numpy datetime64 or int serial number array
+        :param period: Period or period string applied to every date, e.g. '2b'
+        :param end_of_month: keep month ends at month ends, as advance_date
+        :return: numpy array of the same kind and shape as ref_dates
+        """
+        convention = kwargs.get('convention', 0)
+        end_of_month = kwargs.get('end_of_month', False)
+        return self.core_calendar.advance_date_batch(ref_dates, period, convention, end_of_month)
+
+    @memoized_query(_schedule_key)
     @valid_output
     def schedule(self, start_date, end_date, tenor, **kwargs):
         start_date = check_date(start_date)
@@ -128,20 +463,184 @@ class MarketCalendar(six.with_metaclass(MarketCalendarMeta)):
         date_generation_rule = kwargs.get('date_generation_rule', 1)
         cal = self.core_calendar
         if tenor.units() == TimeUnits.BDays:
-            schedule = []
-            if date_generation_rule == DateGeneration.Forward:
-                d = cal.adjust_date(start_date, date_rule)
-                while d <= end_date:
-                    schedule.append(d)
-                    d = cal.advance_date(d, tenor, date_rule)
-            elif date_generation_rule == DateGeneration.Backward:
-                d = cal.adjust_date(end_date, date_rule)
-                while d >= start_date:
-                    schedule.append(d)
-                    d = cal.advance_date(d, -tenor, date_rule)
-                schedule = sorted(schedule)
+            if date_generation_rule == DateGeneration.Forward or date_generation_rule == DateGeneration.Backward:
+                schedule = cal.biz_day_schedule(start_date, end_date, tenor.length(), date_rule, date_generation_rule)
+            else:
+                schedule = []
         else:
             schedule = Schedule(start_date, end_date, tenor, cal, convention=date_rule,
                                 date_generation_rule=date_generation_rule)
 
         return schedule
+
+    def early_close_days(self, start_date, end_date):
+        """
+        Business days between start_date and end_date on which the market closes at early_close
+        :param start_date: start date
+        :param end_date: end date
+        :return: int serial number array
+        """
+        import numpy as np
+        return np.empty(0, dtype=np.intc)
+
+    def session_table(self, start_date, end_date):
+        """
+        UTC open and close times of the trading sessions held between start_date and end_date; a lunch break
+        splits a day into two sessions
+        :param start_date: start date
+        :param end_date: end date
+        :return: (opens, closes), numpy datetime64[ns] arrays with one entry per session, in time order
+        """
+        start_date = check_date(start_date)
+        end_date = check_date(end_date)
+        days = serials_to_datetime64(self.core_calendar.biz_serials(start_date, end_date))
+        early_close_days = serials_to_datetime64(self.early_close_days(start_date, end_date))
+        return sessions.session_bounds(days, self.sessions, self.tz, early_close_days, self.early_close)
+
+    def session_grid(self, start_date, end_date, freq='1min', closed='left', chunk_size=1000000):
+        """
+        UTC timestamps every freq through the trading sessions between start_date and end_date, generated in
+        chunks so that multi-year minute or second grids never materialize at once
+        :param start_date: start date
+        :param end_date: end date
+        :param freq: grid step, e.g. '1min', '5min', '1s' or a timedelta
+        :param closed: 'left' keeps the session opens and drops the closes, 'right' the opposite, 'both' keeps both
+        :param chunk_size: number of timestamps per chunk; only the last one can be shorter
+        :return: generator of numpy datetime64[ns] arrays, in time order
+        """
+        opens, closes = self.session_table(start_date, end_date)
+        return sessions.session_grid(opens, closes, freq, closed, chunk_size)
+
+    def is_open_at(self, timestamp):
+        """
+        Whether the market is in a trading session at the given instant
+        :param timestamp: numpy datetime64, datetime (naive ones are taken as UTC) or int nanoseconds since the epoch
+        :return: bool
+        """
+        ns = _to_utc_ns(timestamp)
+        cached = self._boundaries
+        if cached is None or not cached[0] <= ns < cached[1]:
+            cached = self._boundaries_around(ns)
+        return bisect.bisect_right(cached[2], ns) & 1 == 1
+
+    def next_open(self, timestamp):
+        """
+        Start of the first trading session opening strictly after the given instant
+        :param timestamp: numpy datetime64, datetime (naive ones are taken as UTC) or int nanoseconds since the epoch
+        :return: numpy datetime64[ns] in UTC, None after the supported range
+        """
+        return self._next_boundary(_to_utc_ns(timestamp), 0)
+
+    def next_close(self, timestamp):
+        """
+        End of the first trading session closing strictly after the given instant, i.e. of the current session
+        when the market is open
+        :param timestamp: numpy datetime64, datetime (naive ones are taken as UTC) or int nanoseconds since the epoch
+        :return: numpy datetime64[ns] in UTC, None after the supported range
+        """
+        return self._next_boundary(_to_utc_ns(timestamp), 1)
+
+    def _next_boundary(self, ns, parity):
+        # first open (parity 0) or close (parity 1) after ns
+        cached = self._boundaries_around(ns)
+        while True:
+            boundaries = cached[2]
+            i = bisect.bisect_right(boundaries, ns)
+            if (i & 1) != parity:
+                i += 1
+            if i < len(boundaries):
+                import numpy as np
+                return np.datetime64(boundaries[i], 'ns')
+            if cached[4] == 2199:
+                return None
+            # the next boundary lies after the cached years, e.g. on a long holiday at their end
+            cached = self._cache_boundaries(cached[3], min(cached[4] + _BOUNDARY_YEARS, 2199))
+
+    def _boundaries_around(self, ns):
+        # the cached session boundaries, extended to cover ns when they do not yet
+        cached = self._boundaries
+        if cached is not None and cached[0] <= ns < cached[1]:
+            return cached
+
+        year = min(max(1970 + ns // _NS_PER_YEAR, 1901), 2199)
+        first = max(year - _BOUNDARY_YEARS, 1901)
+        last = min(year + _BOUNDARY_YEARS, 2199)
+        if cached is not None:
+            first = min(first, cached[3])
+            last = max(last, cached[4])
+        return self._cache_boundaries(first, last)
+
+    def _cache_boundaries(self, first, last):
+        # sorted UTC opens and closes, interleaved, of the sessions in years [first, last], as a list of int
+        # nanoseconds for bisect. The cache is one tuple (lowest and highest covered instants, boundaries,
+        # first, last), replaced as a whole so that concurrent readers always see a consistent one
+        import numpy as np
+        opens, closes = self.session_table(Date(first, 1, 1), Date(last, 12, 31))
+        boundaries = np.empty(2 * opens.shape[0], dtype=np.int64)
+        boundaries[0::2] = opens.astype(np.int64)
+        boundaries[1::2] = closes.astype(np.int64)
+
+        # sessions belong to local dates, so a day at each end of the years is left out of the covered range
+        lo = -(1 << 63) if first == 1901 else _year_start_ns(first) + _NS_PER_DAY
+        hi = 1 << 63 if last == 2199 else _year_start_ns(last + 1) - _NS_PER_DAY
+        self._boundaries = (lo, hi, boundaries.tolist(), first, last)
+        return self._boundaries
+
+
+# years of sessions cached around the instants looked up, on each side
+_BOUNDARY_YEARS = 2
+_NS_PER_DAY = 86400 * 10 ** 9
+_NS_PER_YEAR = 31556952 * 10 ** 9
+_EPOCH = datetime.datetime(1970, 1, 1)
+_NAT_NS = -(1 << 63)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+
+def _year_start_ns(year):
+    delta = datetime.datetime(year, 1, 1) - _EPOCH
+    return _delta_ns(delta.days, delta.seconds, delta.microseconds)
+
+
+def _to_utc_ns(timestamp):
+    """
+    :param timestamp: int nanoseconds since the epoch, numpy datetime64, pandas Timestamp, datetime (naive ones
+        are taken as UTC) or ISO string
+    :return: int nanoseconds since the epoch
+    """
+    # dispatched on the exact type first, as numpy scalar operations cost a microsecond each; item() of a
+    # datetime64[ns] is its int value, the cheapest way out of numpy, or None for NaT. numpy is imported lazily,
+    # and a numpy scalar can only exist once it has been
+    cls = type(timestamp)
+    if cls is int:
+        return timestamp
+    np = sys.modules.get('numpy')
+    if np is not None and cls is np.datetime64:
+        value = (timestamp if timestamp.dtype == 'datetime64[ns]' else timestamp.astype('datetime64[ns]')).item()
+        if value is None:
+            raise ValueError("{0!r} is not a valid timestamp".format(timestamp))
+        return value
+    elif isinstance(timestamp, datetime.datetime):
+        if cls is not datetime.datetime:
+            value = getattr(timestamp, 'value', None)
+            if value is not None:
+                # pandas Timestamp, already in UTC nanoseconds; pandas.NaT carries the NaT sentinel
+                if value == _NAT_NS:
+                    raise ValueError("{0!r} is not a valid timestamp".format(timestamp))
+                return value
+        value = _delta_ns(timestamp.toordinal() - _EPOCH_ORDINAL,
+                          timestamp.hour * 3600 + timestamp.minute * 60 + timestamp.second, timestamp.microsecond)
+        offset = timestamp.utcoffset()
+        if offset is not None:
+            value -= _delta_ns(offset.days, offset.seconds, offset.microseconds)
+        return value
+    elif isinstance(timestamp, six.integer_types) or np is not None and isinstance(timestamp, np.integer):
+        return int(timestamp)
+    import numpy as np
+    value = np.datetime64(timestamp, 'ns').item()
+    if value is None:
+        raise ValueError("{0!r} is not a valid timestamp".format(timestamp))
+    return value
+
+
+def _delta_ns(days, seconds, microseconds):
+    return ((days * 86400 + seconds) * 1000000 + microseconds) * 1000
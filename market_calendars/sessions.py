@@ -0,0 +1,140 @@
+"""
+Intraday trading sessions: the local session times of a MarketCalendar turned into UTC datetime64[ns]
+open / close arrays, and timestamp grids over those sessions generated chunk by chunk
+"""
+import datetime
+import re
+
+NS_PER_SECOND = 10 ** 9
+
+_FREQ_UNITS = {'s': 1, 'sec': 1, 'min': 60, 't': 60, 'h': 3600}
+_FREQ = re.compile(r'^\s*(\d*)\s*([a-z]+)\s*$')
+
+
+def parse_time(value):
+    """
+    Local time of day of a session boundary
+    :param value: 'HH:MM', 'HH:MM:SS' or datetime.time; '24:00' is the end of the day
+    :return: int, nanoseconds since local midnight
+    """
+    if isinstance(value, datetime.time):
+        return ((value.hour * 60 + value.minute) * 60 + value.second) * NS_PER_SECOND + value.microsecond * 1000
+    fields = [int(f) for f in value.split(':')]
+    if not 2 <= len(fields) <= 3 or fields[0] > 24 or any(f < 0 or f > 59 for f in fields[1:]):
+        raise ValueError('{0} is not a valid time of day, e.g. 09:30 or 09:30:00'.format(value))
+    seconds = fields[0] * 3600 + fields[1] * 60 + (fields[2] if len(fields) == 3 else 0)
+    if seconds > 86400:
+        raise ValueError('{0} is not a valid time of day, e.g. 09:30 or 09:30:00'.format(value))
+    return seconds * NS_PER_SECOND
+
+
+def parse_freq(freq):
+    """
+    Step of a timestamp grid
+    :param freq: e.g. '1min', '5min', '30s', '1h', a datetime.timedelta or a numpy timedelta64
+    :return: int, positive number of nanoseconds
+    """
+    import numpy as np
+    if isinstance(freq, datetime.timedelta):
+        freq = np.timedelta64(freq)
+    if isinstance(freq, np.timedelta64):
+        step = int(freq.astype('timedelta64[ns]').astype(np.int64))
+    else:
+        match = _FREQ.match(str(freq).lower())
+        if not match or match.group(2) not in _FREQ_UNITS:
+            raise ValueError('{0} is not a valid frequency, e.g. 1min, 30s or 1h'.format(freq))
+        step = int(match.group(1) or 1) * _FREQ_UNITS[match.group(2)] * NS_PER_SECOND
+    if step <= 0:
+        raise ValueError('frequency {0} must be positive'.format(freq))
+    return step
+
+
+def utc_offsets(tz, days):
+    """
+    UTC offset of a time zone at noon of each day; trading sessions never straddle a DST switch
+    :param tz: pytz (or any tzinfo) time zone
+    :param days: numpy datetime64[D] array
+    :return: numpy int64 array of offsets in nanoseconds
+    """
+    import numpy as np
+    offsets = np.empty(days.shape[0], dtype=np.int64)
+    if not days.shape[0]:
+        return offsets
+
+    def offset(day):
+        noon = datetime.datetime.combine(day.astype(datetime.date), datetime.time(12))
+        return int(tz.utcoffset(noon).total_seconds()) * NS_PER_SECOND
+
+    # offsets change a couple of times a year at most, so only the months whose first day disagrees
+    # with the first day of the next month are looked up day by day
+    months = days.astype('datetime64[M]')
+    first_days = np.arange(months[0], months[-1] + 2).astype('datetime64[D]')
+    month_offsets = np.array([offset(d) for d in first_days], dtype=np.int64)
+    month_index = (months - months[0]).astype(np.int64)
+    offsets[:] = month_offsets[month_index]
+    for k in np.flatnonzero(month_offsets[:-1] != month_offsets[1:]):
+        in_month = np.flatnonzero(month_index == k)
+        offsets[in_month] = [offset(d) for d in days[in_month]]
+    return offsets
+
+
+def session_bounds(days, sessions, tz, early_close_days=None, early_close=None):
+    """
+    UTC open and close times of the sessions held on each day
+    :param days: numpy datetime64[D] array of trading days, sorted
+    :param sessions: sequence of (open, close) local times, see parse_time, in order
+    :param tz: time zone of the local times
+    :param early_close_days: optional datetime64[D] array of the days closing at early_close
+    :param early_close: local closing time of those days; sessions starting after it are dropped
+    :return: (opens, closes), numpy datetime64[ns] arrays with one entry per session, sorted
+    """
+    import numpy as np
+    if not sessions:
+        raise ValueError('no trading sessions are defined')
+    local = [(parse_time(o), parse_time(c)) for o, c in sessions]
+    if any(o >= c for o, c in local) or any(c > o for (_, c), (o, _) in zip(local, local[1:])):
+        raise ValueError('sessions {0} must be non-empty and in order'.format(sessions))
+
+    midnights = days.astype('datetime64[ns]').astype(np.int64) - utc_offsets(tz, days)
+    opens = midnights[:, None] + np.array([o for o, _ in local], dtype=np.int64)
+    closes = midnights[:, None] + np.array([c for _, c in local], dtype=np.int64)
+    keep = np.ones(opens.shape, dtype=np.bool_)
+
+    if early_close_days is not None and early_close_days.shape[0]:
+        early = np.isin(days, early_close_days)
+        early_time = midnights[early, None] + parse_time(early_close)
+        keep[early] = opens[early] < early_time
+        closes[early] = np.minimum(closes[early], early_time)
+    return opens[keep].view('datetime64[ns]'), closes[keep].view('datetime64[ns]')
+
+
+def session_grid(opens, closes, freq='1min', closed='left', chunk_size=1000000):
+    """
+    Timestamps every freq from the open of each session, generated chunk by chunk so that long spans
+    never materialize at once
+    :param opens: numpy datetime64[ns] array of session opens
+    :param closes: numpy datetime64[ns] array of the matching session closes
+    :param freq: grid step, see parse_freq
+    :param closed: 'left' keeps the open and drops the close, 'right' the opposite and 'both' keeps both
+    :param chunk_size: number of timestamps per chunk; only the last one can be shorter
+    :return: generator of numpy datetime64[ns] arrays, in time order
+    """
+    import numpy as np
+    if closed not in ('left', 'right', 'both'):
+        raise ValueError("closed must be 'left', 'right' or 'both', not {0}".format(closed))
+    if chunk_size <= 0:
+        raise ValueError('chunk size {0:d} must be positive'.format(chunk_size))
+    step = parse_freq(freq)
+    opens = np.asarray(opens, dtype='datetime64[ns]').astype(np.int64)
+    closes = np.asarray(closes, dtype='datetime64[ns]').astype(np.int64)
+
+    first = opens + step if closed == 'right' else opens
+    last = closes - 1 if closed == 'left' else closes
+    counts = np.maximum((last - first) // step + 1, 0)
+    ends = np.cumsum(counts)
+    total = int(ends[-1]) if ends.shape[0] else 0
+
+    for lo in range(0, total, chunk_size):
+        index = np.arange(lo, min(lo + chunk_size, total), dtype=np.int64)
+        session = np.searchsorted(ends, index, side='right')
+        yield (first[session] + (index - (ends[session] - counts[session])) * step).view('datetime64[ns]')
@@ -1,5 +1,6 @@
 import pytz
 import unittest
+import numpy as np
 from datetime import datetime as dt
 from market_calendars.exchange_china_sse import ChinaSSECalendar
 
@@ -43,6 +44,21 @@ class TestChinaSSECalendar(unittest.TestCase):
         expected = ['2016-05-03', '2016-05-04', '2016-05-05', '2016-05-06', '2016-05-09', '2016-05-10']
         self.assertEquals(biz_days, expected)
 
+    def test_iterators(self):
+        days = self.cal.iter_biz_days('2016-04-20', '2199-12-31')
+        self.assertEqual([next(days) for _ in range(9)], self.cal.biz_days('2016-04-20', '2016-05-03'))
+
+        days = self.cal.iter_holidays('2016-04-20', '2016-05-10', backward=True, return_string=True)
+        self.assertEqual(list(days), self.cal.holidays('2016-04-20', '2016-05-10', return_string=True)[::-1])
+
+        chunks = list(self.cal.iter_biz_days('2016-01-01', '2016-12-31', chunk_size=100, output_format='datetime64'))
+        self.assertEqual([len(c) for c in chunks], [100, 100, 44])
+        self.assertEqual(np.concatenate(chunks).tolist(),
+                         self.cal.biz_days('2016-01-01', '2016-12-31', output_format='datetime64').tolist())
+
+        with self.assertRaises(ValueError):
+            self.cal.iter_biz_days('2016-01-01', '2016-12-31', output_format='str')
+
     def test_is_holiday(self):
         self.assertTrue(self.cal.is_holiday('2016-10-01'))
         self.assertTrue(self.cal.is_holiday('20170501'))
@@ -70,6 +86,19 @@ class TestChinaSSECalendar(unittest.TestCase):
         self.assertEquals(self.cal.advance_date('20170427', '1w', return_string=True), '2017-05-04')
         self.assertEquals(self.cal.advance_date('20180429', '1b'), dt(2018, 5, 2))
 
+    def test_batch_functions(self):
+        dates = np.array(['2017-04-27', '2017-10-01', '2018-04-29'], dtype='datetime64[D]')
+        self.assertEqual(self.cal.is_biz_day_batch(dates).tolist(), [True, False, False])
+        self.assertEqual(self.cal.adjust_date_batch(dates, convention=2).tolist(),
+                         np.array(['2017-04-27', '2017-09-29', '2018-04-27'], dtype='datetime64[D]').tolist())
+        self.assertEqual(self.cal.advance_date_batch(dates, '2b').tolist(),
+                         np.array(['2017-05-02', '2017-10-10', '2018-05-03'], dtype='datetime64[D]').tolist())
+
+        month_ends = np.array(['2018-02-28', '2018-04-27'], dtype='datetime64[D]')
+        self.assertEqual(self.cal.advance_date_batch(month_ends, '1m', end_of_month=True).tolist(),
+                         [self.cal.advance_date(d, '1m', end_of_month=True).date() for d in month_ends.tolist()])
+        self.assertEqual(self.cal.advance_date('2018-02-28', '1m', end_of_month=True), dt(2018, 3, 30))
+
     def test_schedule(self):
         calculated = self.cal.schedule('2018-01-01', '2018-02-01', '3b', date_generation_rule=1)
         expected = [dt(2018, 1, 3, 0, 0), dt(2018, 1, 8, 0, 0), dt(2018, 1, 11, 0, 0), dt(2018, 1, 16, 0, 0),
@@ -79,3 +108,48 @@ class TestChinaSSECalendar(unittest.TestCase):
         calculated = self.cal.schedule('2018-01-05', '2018-02-01', '1w', return_string=True, date_generation_rule=2)
         expected = ['2018-01-05', '2018-01-12', '2018-01-19', '2018-01-26', '2018-02-01']
         self.assertEquals(calculated, expected)
+
+    def test_session_table(self):
+        opens, closes = self.cal.session_table('2018-02-14', '2018-02-22')
+        self.assertEqual(opens.dtype, np.dtype('datetime64[ns]'))
+        self.assertEqual(np.datetime_as_string(opens, unit='m').tolist(),
+                         ['2018-02-14T01:30', '2018-02-14T05:00', '2018-02-22T01:30', '2018-02-22T05:00'])
+        self.assertEqual(np.datetime_as_string(closes, unit='m').tolist(),
+                         ['2018-02-14T03:30', '2018-02-14T07:00', '2018-02-22T03:30', '2018-02-22T07:00'])
+
+        opens, closes = self.cal.session_table('2018-02-17', '2018-02-18')
+        self.assertEqual((opens.shape, closes.shape), ((0,), (0,)))
+
+    def test_session_grid(self):
+        chunks = list(self.cal.session_grid('2018-02-13', '2018-02-14', chunk_size=100))
+        self.assertEqual([len(c) for c in chunks], [100, 100, 100, 100, 80])
+        minutes = np.concatenate(chunks)
+        self.assertTrue((np.diff(minutes) > np.timedelta64(0)).all())
+        self.assertEqual(np.datetime_as_string(minutes[[0, 119, 120, 239]], unit='m').tolist(),
+                         ['2018-02-13T01:30', '2018-02-13T03:29', '2018-02-13T05:00', '2018-02-13T06:59'])
+
+        minutes = np.concatenate(list(self.cal.session_grid('2018-02-13', '2018-02-13', '30min', closed='right')))
+        self.assertEqual(np.datetime_as_string(minutes, unit='m').tolist(),
+                         ['2018-02-13T02:00', '2018-02-13T02:30', '2018-02-13T03:00', '2018-02-13T03:30',
+                          '2018-02-13T05:30', '2018-02-13T06:00', '2018-02-13T06:30', '2018-02-13T07:00'])
+        seconds = list(self.cal.session_grid('2018-02-13', '2018-02-13', '1s', closed='both', chunk_size=10 ** 6))
+        self.assertEqual(len(seconds[0]), 2 * (7200 + 1))
+
+        with self.assertRaises(ValueError):
+            _ = list(self.cal.session_grid('2018-02-13', '2018-02-13', '1d'))
+        with self.assertRaises(ValueError):
+            _ = list(self.cal.session_grid('2018-02-13', '2018-02-13', closed='none'))
+
+    def test_is_open_at(self):
+        self.assertIs(self.cal.tz, self.cal.tz)
+        shanghai = self.cal.tz
+        self.assertTrue(self.cal.is_open_at(shanghai.localize(dt(2018, 2, 14, 11, 29))))
+        self.assertFalse(self.cal.is_open_at(shanghai.localize(dt(2018, 2, 14, 12, 0))))
+        self.assertTrue(self.cal.is_open_at(shanghai.localize(dt(2018, 2, 14, 13, 0))))
+        self.assertFalse(self.cal.is_open_at(shanghai.localize(dt(2018, 2, 15, 10, 0))))
+
+        lunch = np.datetime64('2018-02-14T04:00')
+        self.assertEqual(self.cal.next_open(lunch), np.datetime64('2018-02-14T05:00'))
+        self.assertEqual(self.cal.next_close(lunch), np.datetime64('2018-02-14T07:00'))
+        # Spring Festival
+        self.assertEqual(self.cal.next_open(np.datetime64('2018-02-14T08:00')), np.datetime64('2018-02-22T01:30'))
@@ -1,6 +1,9 @@
 import pytz
 import unittest
+import numpy as np
+import pandas as pd
 from datetime import datetime as dt
+from market_calendars.core import Date
 from market_calendars.exchange_nyse import NYSEExchangeCalendar
 
 
@@ -40,6 +43,36 @@ class TestNYSECalendar(unittest.TestCase):
                     '2016-06-08', '2016-06-09', '2016-06-10']
         self.assertEquals(biz_days, expected)
 
+    def test_output_format(self):
+        expected = ['2018-01-01', '2018-01-15', '2018-02-19']
+        serials = [Date(2018, 1, 1).serial_number, Date(2018, 1, 15).serial_number, Date(2018, 2, 19).serial_number]
+
+        holidays = self.cal.holidays('2018-01-01', '2018-02-28', include_weekends=False, output_format='date')
+        self.assertEqual(holidays, [Date(2018, 1, 1), Date(2018, 1, 15), Date(2018, 2, 19)])
+        holidays = self.cal.holidays('2018-01-01', '2018-02-28', include_weekends=False, output_format='serial')
+        self.assertEqual(holidays.tolist(), serials)
+        holidays = self.cal.holidays('2018-01-01', '2018-02-28', include_weekends=False, output_format='datetime64')
+        self.assertEqual(holidays.tolist(), np.array(expected, dtype='datetime64[D]').tolist())
+        holidays = self.cal.holidays('2018-01-01', '2018-02-28', include_weekends=False, output_format='pandas')
+        self.assertTrue(holidays.equals(pd.DatetimeIndex(expected)))
+
+        biz_days = self.cal.biz_days('2017-04-20', '2017-04-25', output_format='datetime64')
+        self.assertEqual(biz_days.tolist(), np.array(['2017-04-20', '2017-04-21', '2017-04-24', '2017-04-25'],
+                                                     dtype='datetime64[D]').tolist())
+
+        self.assertEqual(self.cal.adjust_date('20171123', output_format='date'), Date(2017, 11, 24))
+        self.assertEqual(self.cal.adjust_date('20171123', output_format='serial'), Date(2017, 11, 24).serial_number)
+        self.assertEqual(self.cal.advance_date('20170427', '2b', output_format='datetime64'), np.datetime64('2017-05-01'))
+        self.assertEqual(self.cal.advance_date('20170427', '2b', output_format='pandas'), pd.Timestamp('2017-05-01'))
+
+        calculated = self.cal.schedule('2018-01-05', '2018-02-01', '1w', date_generation_rule=2, output_format='serial')
+        self.assertEqual(calculated.tolist(), [Date(2018, 1, 5).serial_number, Date(2018, 1, 12).serial_number,
+                                               Date(2018, 1, 19).serial_number, Date(2018, 1, 26).serial_number,
+                                               Date(2018, 2, 1).serial_number])
+
+        with self.assertRaises(ValueError):
+            _ = self.cal.adjust_date('20171123', output_format='excel')
+
     def test_is_holiday(self):
         self.assertTrue(self.cal.is_holiday('2018-01-15'))
         self.assertTrue(self.cal.is_holiday('20140418'))
@@ -76,3 +109,59 @@ class TestNYSECalendar(unittest.TestCase):
         calculated = self.cal.schedule('2018-01-05', '2018-02-01', '1w', return_string=True, date_generation_rule=2)
         expected = ['2018-01-05', '2018-01-12', '2018-01-19', '2018-01-26', '2018-02-01']
         self.assertEquals(calculated, expected)
+
+    def test_session_table(self):
+        # New York switches to daylight saving time on 2018-03-11
+        opens, closes = self.cal.session_table('2018-03-08', '2018-03-13')
+        self.assertEqual(np.datetime_as_string(opens, unit='m').tolist(),
+                         ['2018-03-08T14:30', '2018-03-09T14:30', '2018-03-12T13:30', '2018-03-13T13:30'])
+        self.assertEqual(np.datetime_as_string(closes, unit='m').tolist(),
+                         ['2018-03-08T21:00', '2018-03-09T21:00', '2018-03-12T20:00', '2018-03-13T20:00'])
+
+    def test_early_closes(self):
+        self.assertEqual([Date(serial_number=s) for s in self.cal.early_close_days('2018-01-01', '2018-12-31')],
+                         [Date(2018, 7, 3), Date(2018, 11, 23), Date(2018, 12, 24)])
+        # July 3rd 2015 was the observed Independence Day
+        self.assertEqual([Date(serial_number=s) for s in self.cal.early_close_days('2015-01-01', '2015-12-31')],
+                         [Date(2015, 11, 27), Date(2015, 12, 24)])
+
+        opens, closes = self.cal.session_table('2018-11-21', '2018-11-23')
+        self.assertEqual(np.datetime_as_string(closes, unit='m').tolist(), ['2018-11-21T21:00', '2018-11-23T18:00'])
+        minutes = np.concatenate(list(self.cal.session_grid('2018-11-21', '2018-11-23')))
+        self.assertEqual(len(minutes), 390 + 210)
+
+    def test_is_open_at(self):
+        ny = pytz.timezone('America/New_York')
+        self.assertIs(self.cal.tz, self.cal.tz)
+        self.assertTrue(self.cal.is_open_at(ny.localize(dt(2018, 3, 12, 9, 30))))
+        self.assertFalse(self.cal.is_open_at(ny.localize(dt(2018, 3, 12, 9, 29, 59))))
+        self.assertFalse(self.cal.is_open_at(ny.localize(dt(2018, 3, 12, 16, 0))))
+        self.assertTrue(self.cal.is_open_at(np.datetime64('2018-03-12T19:59:59')))
+        self.assertTrue(self.cal.is_open_at(pd.Timestamp('2018-11-23 17:59:59', tz='UTC')))
+        self.assertFalse(self.cal.is_open_at(dt(2018, 11, 23, 18, 0)))
+        self.assertFalse(self.cal.is_open_at(np.datetime64('2018-07-04T15:00')))
+        self.assertTrue(self.cal.is_open_at(int(np.datetime64('2018-07-05T15:00', 'ns').astype(np.int64))))
+        instant = np.datetime64('2018-03-12T19:59:59.123456', 'ns')
+        for timestamp in [np.datetime64('2018-03-12T19:59:59.123456'), np.datetime64('2018-03-12T19:59:59.123', 'ms'),
+                          dt(2018, 3, 12, 19, 59, 59, 123456), ny.localize(dt(2018, 3, 12, 15, 59, 59, 123456)),
+                          pd.Timestamp(instant), np.int64(instant.astype(np.int64)), '2018-03-12T19:59:59.123456']:
+            self.assertEqual(self.cal.next_close(timestamp), np.datetime64('2018-03-12T20:00'), repr(timestamp))
+            self.assertTrue(self.cal.is_open_at(timestamp), repr(timestamp))
+        for timestamp in [np.datetime64('NaT'), np.datetime64('NaT', 'ns'), pd.NaT, 'NaT']:
+            with self.assertRaisesRegex(ValueError, 'NaT'):
+                self.cal.is_open_at(timestamp)
+            with self.assertRaisesRegex(ValueError, 'NaT'):
+                self.cal.next_open(timestamp)
+
+    def test_next_open_and_close(self):
+        friday = np.datetime64('2018-11-23T17:00')
+        self.assertEqual(self.cal.next_close(friday), np.datetime64('2018-11-23T18:00'))
+        self.assertEqual(self.cal.next_open(friday), np.datetime64('2018-11-26T14:30'))
+        self.assertEqual(self.cal.next_close(np.datetime64('2018-11-23T18:00')), np.datetime64('2018-11-26T21:00'))
+        self.assertEqual(self.cal.next_open(np.datetime64('2018-11-26T14:30')), np.datetime64('2018-11-27T14:30'))
+
+        # far apart instants and the ends of the supported range
+        self.assertEqual(self.cal.next_open(np.datetime64('2029-12-31T23:00')), np.datetime64('2030-01-02T14:30'))
+        self.assertEqual(self.cal.next_open(np.datetime64('1990-12-31T22:00')), np.datetime64('1991-01-02T14:30'))
+        self.assertIsNone(self.cal.next_open(np.datetime64('2199-12-31T22:00')))
+        self.assertFalse(self.cal.is_open_at(np.datetime64('1850-01-01')))
@@ -0,0 +1,192 @@
+import unittest
+import datetime
+import gc
+import threading
+import time
+import os
+import subprocess
+import sys
+import weakref
+import market_calendars as mcal
+from market_calendars.core import Date, holiday_centers, register_holiday_center, unregister_holiday_center
+from market_calendars.exchange_china_sse import ChinaSSECalendar
+
+
+class TestCalendarRegistry(unittest.TestCase):
+    def tearDown(self):
+        for name in ['SSE+NASDAQ', 'Mix']:
+            if name in mcal.get_calendar_names():
+                mcal.unregister_calendar(name)
+        mcal.clear_calendar_cache()
+
+    def test_get_calendar_is_cached(self):
+        cal = mcal.get_calendar('China.SSE')
+        self.assertIs(mcal.get_calendar('China.SSE'), cal)
+        self.assertIs(mcal.get_calendar('china.sse'), cal)
+        self.assertIsInstance(cal, ChinaSSECalendar)
+        self.assertIsNot(mcal.get_calendar('NYSE'), cal)
+
+    def test_core_calendar_is_cached(self):
+        cal = mcal.get_calendar('NYSE')
+        self.assertIs(cal.core_calendar, cal.core_calendar)
+        self.assertIs(ChinaSSECalendar().core_calendar, mcal.get_calendar('China.SSE').core_calendar)
+
+    def test_clear_calendar_cache(self):
+        cal = mcal.get_calendar('Null')
+        core_cal = cal.core_calendar
+        mcal.clear_calendar_cache()
+        self.assertIsNot(mcal.get_calendar('Null'), cal)
+        self.assertIsNot(mcal.get_calendar('Null').core_calendar, core_cal)
+        self.assertEqual(mcal.get_calendar('Null').core_calendar, core_cal)
+
+    def test_get_calendar_from_threads(self):
+        results = []
+
+        def worker():
+            results.append(mcal.get_calendar('NASDAQ'))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(set(id(cal) for cal in results)), 1)
+
+    def test_import_defers_optional_modules(self):
+        code = ("import sys, market_calendars; "
+                "print(sorted(m for m in ('numpy', 'pytz', 'dateutil', 'pandas') if m in sys.modules))")
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.dirname(mcal.__file__))))
+        output = subprocess.check_output([sys.executable, '-c', code], env=env, universal_newlines=True)
+        self.assertEqual(output.strip(), '[]')
+
+        # scalar queries compile the holiday tables without numpy, which only the batch paths need
+        code = ("import sys; from market_calendars.core import Calendar, Date, Period; "
+                "cal = Calendar('NYSE'); cal.is_biz_day(Date(2018, 1, 2)); cal.advance_date(Date(2018, 1, 2), "
+                "Period('1M')); print('numpy' in sys.modules)")
+        output = subprocess.check_output([sys.executable, '-c', code], env=env, universal_newlines=True)
+        self.assertEqual(output.strip(), 'False')
+
+        self.assertEqual(mcal.get_calendar('NYSE').tz.zone, 'America/New_York')
+
+    def test_register_calendar(self):
+        sse = mcal.get_calendar('China.SSE')
+        nyse = mcal.get_calendar('NYSE')
+        cal = mcal.register_calendar('SSE+NASDAQ', ['China.SSE', 'NASDAQ'], holidays=['2018-03-01'],
+                                     tz='Asia/Shanghai')
+        self.assertIs(mcal.get_calendar('SSE+NASDAQ'), cal)
+        self.assertIn('SSE+NASDAQ', mcal.get_calendar_names())
+        self.assertEqual(cal.name, 'SSE+NASDAQ')
+        self.assertEqual(cal.tz.zone, 'Asia/Shanghai')
+
+        expected = [d for d in sse.biz_days('2018-01-01', '2018-12-31', output_format='string')
+                    if nyse.is_biz_day(d) and d != '2018-03-01']
+        self.assertEqual(cal.biz_days('2018-01-01', '2018-12-31', output_format='string'), expected)
+        self.assertEqual(cal.adjust_date('2018-02-16', output_format='string'), '2018-02-22')
+
+        # registering again replaces the calendar and drops the previous one
+        previous = weakref.ref(type(cal))
+        del cal
+        cal = mcal.register_calendar('SSE+NASDAQ', ['China.SSE', 'NASDAQ'], join='union')
+        self.assertIs(mcal.get_calendar('SSE+NASDAQ'), cal)
+        self.assertTrue(cal.is_biz_day('2018-03-01'))
+        self.assertTrue(cal.is_biz_day('2018-02-16'))
+        gc.collect()
+        self.assertIsNone(previous())
+
+        for name in ['NASDAQ', 'China.SSE', 'MarketCalendar']:
+            with self.assertRaises(ValueError):
+                mcal.register_calendar(name, ['NYSE'])
+        self.assertIsInstance(mcal.get_calendar('NASDAQ'), type(nyse))
+
+        mcal.unregister_calendar('SSE+NASDAQ')
+        self.assertNotIn('SSE+NASDAQ', mcal.get_calendar_names())
+        self.assertNotIn('sse+nasdaq', holiday_centers())
+        with self.assertRaises(RuntimeError):
+            mcal.get_calendar('SSE+NASDAQ')
+        with self.assertRaises(ValueError):
+            mcal.unregister_calendar('SSE+NASDAQ')
+        with self.assertRaises(ValueError):
+            mcal.unregister_calendar('NYSE')
+
+    def test_register_calendar_names_differing_in_case(self):
+        cal = mcal.register_calendar('Mix', ['China.SSE'])
+        for name in ['mix', 'MIX', 'nasdaq']:
+            with self.assertRaisesRegex(ValueError, 'case'):
+                mcal.register_calendar(name, ['NYSE'])
+        self.assertFalse(cal.is_biz_day('2018-02-16'))
+        self.assertNotIn('mix', mcal.get_calendar_names())
+
+        register_holiday_center('Test.Center', ['NYSE'])
+        try:
+            with self.assertRaisesRegex(ValueError, 'holiday center'):
+                mcal.register_calendar('Test.Center', ['China.SSE'])
+            mcal.unregister_calendar('Mix')
+            self.assertIn('test.center', holiday_centers())
+        finally:
+            unregister_holiday_center('Test.Center')
+
+    def test_query_cache(self):
+        cal = mcal.get_calendar('China.SSE')
+        self.assertIsNone(mcal.query_cache_info())
+        self.assertIsInstance(cal.biz_days('2018-02-01', '2018-03-01'), list)
+
+        mcal.enable_query_cache(maxsize=2)
+        try:
+            days = cal.biz_days('2018-02-01', '2018-03-01')
+            self.assertIsInstance(days, tuple)
+            self.assertIs(cal.biz_days('20180201', datetime.datetime(2018, 3, 1)), days)
+            self.assertEqual(list(days), [d.to_datetime() for d in
+                                          cal.core_calendar.biz_dates_list(Date(2018, 2, 1), Date(2018, 3, 1))])
+            self.assertIsNot(cal.biz_days('2018-02-01', '2018-03-01', return_string=True), days)
+            info = mcal.query_cache_info()
+            self.assertEqual((info.hits, info.misses, info.currsize, info.maxsize), (1, 2, 2, 2))
+
+            serials = cal.holidays('2018-02-01', '2018-03-01', output_format='serial')
+            self.assertFalse(serials.flags.writeable)
+            with self.assertRaises(ValueError):
+                serials[0] = 0
+            self.assertEqual(mcal.query_cache_info().evictions, 1)
+
+            # different calendars, tenors and rules are different keys
+            self.assertNotEqual(mcal.get_calendar('NYSE').biz_days('2018-02-01', '2018-03-01'), days)
+            sch = cal.schedule('2018-01-05', '2018-06-01', '1m', return_string=True)
+            self.assertIs(cal.schedule('2018-01-05', '2018-06-01', '1M', return_string=True), sch)
+            self.assertNotEqual(cal.schedule('2018-01-05', '2018-06-01', '1m', return_string=True,
+                                             date_generation_rule=2), sch)
+
+            mcal.enable_query_cache(ttl=0.05)
+            days = cal.biz_days('2018-02-01', '2018-03-01')
+            self.assertIs(cal.biz_days('2018-02-01', '2018-03-01'), days)
+            time.sleep(0.1)
+            self.assertIsNot(cal.biz_days('2018-02-01', '2018-03-01'), days)
+            self.assertEqual(mcal.query_cache_info().expirations, 1)
+
+            with self.assertRaises(ValueError):
+                mcal.enable_query_cache(maxsize=0)
+        finally:
+            mcal.disable_query_cache()
+        self.assertIsNone(mcal.query_cache_info())
+        self.assertIsInstance(cal.biz_days('2018-02-01', '2018-03-01'), list)
+
+    def test_query_cache_from_threads(self):
+        mcal.enable_query_cache(maxsize=16)
+        results = []
+        try:
+            def worker(k):
+                cal = mcal.get_calendar('NYSE' if k % 2 else 'China.SSE')
+                for month in range(1, 13):
+                    results.append((k % 2, month, cal.biz_days('2018-{0:02d}-01'.format(month), '2018-12-31')))
+
+            threads = [threading.Thread(target=worker, args=(k,)) for k in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            info = mcal.query_cache_info()
+            self.assertEqual(info.hits + info.misses, 8 * 12)
+            self.assertLessEqual(info.currsize, 16)
+        finally:
+            mcal.disable_query_cache()
+        for odd, month, days in results:
+            cal = mcal.get_calendar('NYSE' if odd else 'China.SSE')
+            self.assertEqual(list(days), cal.biz_days('2018-{0:02d}-01'.format(month), '2018-12-31'))
@@ -3,8 +3,37 @@ import copy
 import tempfile
 import os
 import pickle
-from market_calendars.core import Date, Calendar, Period
-from market_calendars.core import BizDayConventions, Months, Weekdays
+import shutil
+import struct
+import subprocess
+import sys
+import threading
+import zlib
+import numpy as np
+from market_calendars.core import Date, Calendar, Period, compile_holiday_tables, load_holiday_tables
+from market_calendars.core import register_holiday_center, unregister_holiday_center, holiday_centers
+from market_calendars.core import set_num_threads, get_num_threads
+from market_calendars.core import BizDayConventions, DateGeneration, Months, Weekdays
+
+MAX_SERIAL = 109574
+
+
+C_API_PROBE = """
+from market_calendars.core.calendar cimport Calendar, CalendarImpl, calendar_is_biz_day, calendar_adjust, \\
+    calendar_advance_bdays, calendar_advance, calendar_biz_days_between
+
+def probe(Calendar cal, int serial):
+    cdef CalendarImpl impl = cal._impl
+    cdef int r[6]
+    with nogil:
+        r[0] = calendar_is_biz_day(impl, serial)
+        r[1] = calendar_adjust(impl, serial, 4)
+        r[2] = calendar_advance_bdays(impl, serial, 1)
+        r[3] = calendar_advance_bdays(impl, serial, 0)
+        r[4] = calendar_advance(impl, serial, 400, 1, 0, False)
+        r[5] = calendar_biz_days_between(impl, serial, 43000, True, True)
+    return [r[i] for i in range(6)]
+"""
 
 
 class TestCalendar(unittest.TestCase):
@@ -45,6 +74,492 @@ class TestCalendar(unittest.TestCase):
         biz_dates2 = cal.biz_days_between(Date(2015, 12, 31), Date(2015, 1, 1), False, True)
         self.assertEqual(biz_dates1, biz_dates2)
 
+    def test_biz_days_between_with_index(self):
+        for name in ['China.SSE', 'China.IB', 'NYSE', 'Target']:
+            cal = Calendar(name)
+            from_date = Date(2013, 12, 29)
+            to_date = Date(2018, 2, 20)
+
+            expected = 0
+            d = from_date
+            while d <= to_date:
+                if cal.is_biz_day(d):
+                    expected += 1
+                d += 1
+
+            for include_first in (True, False):
+                for include_last in (True, False):
+                    calculated = expected
+                    if cal.is_biz_day(from_date) and not include_first:
+                        calculated -= 1
+                    if cal.is_biz_day(to_date) and not include_last:
+                        calculated -= 1
+                    self.assertEqual(cal.biz_days_between(from_date, to_date, include_first, include_last), calculated)
+            self.assertEqual(cal.biz_days_between(from_date, from_date), 0)
+
+    def test_biz_day_of_year(self):
+        cal = Calendar('China.SSE')
+        self.assertEqual(cal.biz_day_of_year(Date(2018, 1, 2)), 1)
+        self.assertEqual(cal.biz_day_of_year(Date(2018, 1, 1)), 0)
+        self.assertEqual(cal.biz_day_of_year(cal.end_of_month(Date(2018, 12, 1))),
+                         cal.biz_days_between(Date(2018, 1, 1), Date(2018, 12, 31), True, True))
+
+    def test_nth_biz_day_after(self):
+        cal = Calendar('China.SSE')
+        reference_date = Date(2018, 2, 14)
+        self.assertEqual(cal.nth_biz_day_after(reference_date, 1), Date(2018, 2, 22))
+        self.assertEqual(cal.nth_biz_day_after(reference_date, -1), Date(2018, 2, 13))
+        self.assertEqual(cal.nth_biz_day_after(reference_date, 0), reference_date)
+        for n in (-250, -17, -3, 5, 23, 250):
+            self.assertEqual(cal.nth_biz_day_after(reference_date, n),
+                             cal.advance_date(reference_date, Period(length=n, units=0)))
+
+        with self.assertRaises(ValueError):
+            _ = cal.nth_biz_day_after(Date(2199, 12, 20), 30)
+
+    def test_advance_date_by_biz_days_near_long_closure(self):
+        cal = Calendar('China.SSE')
+        reference_date = Date(2018, 2, 23)
+
+        d = reference_date
+        for _ in range(250):
+            d -= 1
+            while cal.is_holiday(d):
+                d -= 1
+        self.assertEqual(cal.advance_date(reference_date, Period('-250b')), d)
+        self.assertEqual(cal.advance_date(d, Period('250b')), reference_date)
+        self.assertEqual(cal.advance_date(Date(2018, 2, 14), Period('1b')), Date(2018, 2, 22))
+
+    def test_biz_day_schedule(self):
+        cal = Calendar('NYSE')
+        forward = cal.biz_day_schedule(Date(2018, 1, 1), Date(2018, 2, 1), 3)
+        self.assertEqual(forward, [Date(2018, 1, 2), Date(2018, 1, 5), Date(2018, 1, 10), Date(2018, 1, 16),
+                                   Date(2018, 1, 19), Date(2018, 1, 24), Date(2018, 1, 29), Date(2018, 2, 1)])
+
+        backward = cal.biz_day_schedule(Date(2018, 1, 1), Date(2018, 2, 1), 3,
+                                        date_generation_rule=DateGeneration.Backward)
+        self.assertEqual(backward, [Date(2018, 1, 2), Date(2018, 1, 5), Date(2018, 1, 10), Date(2018, 1, 16),
+                                    Date(2018, 1, 19), Date(2018, 1, 24), Date(2018, 1, 29), Date(2018, 2, 1)])
+
+        self.assertEqual(cal.biz_day_schedule(Date(2018, 1, 6), Date(2018, 1, 7), 1), [])
+        with self.assertRaises(ValueError):
+            _ = cal.biz_day_schedule(Date(2018, 1, 1), Date(2018, 2, 1), 0)
+
+    def test_compiled_holiday_centres(self):
+        sse_cal = Calendar('China.SSE')
+        cffex_cal = Calendar('China.CFFEX')
+        ib_cal = Calendar('China.IB')
+
+        d = Date(2005, 1, 1)
+        while d <= Date(2019, 12, 31):
+            self.assertEqual(sse_cal.is_biz_day(d), cffex_cal.is_biz_day(d))
+            if sse_cal.is_biz_day(d):
+                self.assertTrue(ib_cal.is_biz_day(d))
+            d += 1
+
+        self.assertTrue(sse_cal.is_holiday(Date(2018, 2, 11)))
+        self.assertTrue(ib_cal.is_biz_day(Date(2018, 2, 11)))
+        self.assertTrue(Calendar('Target').is_holiday(Date(2018, 4, 2)))
+
+    def test_range_queries_match_day_by_day(self):
+        for name in ['China.SSE', 'China.IB', 'NYSE', 'Target']:
+            cal = Calendar(name)
+            for from_date, to_date in [(Date(2018, 2, 10), Date(2018, 2, 25)), (Date(2017, 12, 31), Date(2019, 1, 1)),
+                                       (Date(2018, 5, 3), Date(2018, 5, 1)), (Date(1901, 1, 1), Date(1901, 1, 9))]:
+                days = []
+                d = from_date
+                while d <= to_date:
+                    days.append(d)
+                    d += 1
+
+                self.assertEqual(cal.biz_dates_list(from_date, to_date), [d for d in days if cal.is_biz_day(d)])
+                self.assertEqual(cal.holiday_dates_list(from_date, to_date),
+                                 [d for d in days if cal.is_holiday(d)])
+                self.assertEqual(cal.holiday_dates_list(from_date, to_date, False),
+                                 [d for d in days if cal.is_holiday(d) and not cal.is_weekend(d.weekday())])
+
+    def test_batch_functions_match_scalar(self):
+        serials = np.arange(Date(2013, 12, 1).serial_number, Date(2015, 2, 1).serial_number, 3)
+        for name in ['China.SSE', 'China.IB', 'NYSE', 'Target', 'Null']:
+            cal = Calendar(name)
+            dates = [Date(serial_number=int(s)) for s in serials]
+
+            calculated = cal.is_biz_day_batch(serials)
+            self.assertEqual(calculated.tolist(), [cal.is_biz_day(d) for d in dates])
+
+            for convention in range(7):
+                calculated = cal.adjust_date_batch(serials, convention)
+                expected = [cal.adjust_date(d, convention).serial_number for d in dates]
+                self.assertEqual(calculated.tolist(), expected)
+
+            for period in ['-3b', '5b', '0d', '-10d', '2w', '1m', '-7m', '2y']:
+                for end_of_month in (True, False):
+                    calculated = cal.advance_date_batch(serials, period, BizDayConventions.ModifiedFollowing,
+                                                        end_of_month)
+                    expected = [cal.advance_date(d, Period(period), BizDayConventions.ModifiedFollowing,
+                                                 end_of_month).serial_number for d in dates]
+                    self.assertEqual(calculated.tolist(), expected)
+
+    def test_batch_functions_out_of_range(self):
+        cal = Calendar('NYSE')
+        for serials in [[109575], [150000], [2 ** 31 - 10], [0], [-5], [366]]:
+            for period in ['1b', '-3b', '3b', '1d']:
+                with self.assertRaises(ValueError):
+                    cal.advance_date_batch(np.array(serials), period)
+            with self.assertRaises(ValueError):
+                cal.adjust_date_batch(np.array(serials))
+        self.assertEqual(cal.advance_date_batch(np.array([367, 109574]), '0b').tolist(), [368, 109574])
+        with self.assertRaises(ValueError):
+            cal.advance_date_batch(np.array([109574]), '1b')
+
+    def test_c_api_out_of_range(self):
+        # the nogil C API is only reachable from Cython, so the test builds a small extension against calendar.pxd
+        try:
+            import pyximport
+        except ImportError:
+            self.skipTest("Cython is not installed")
+        package_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        directory = tempfile.mkdtemp()
+        with open(os.path.join(directory, 'calendar_c_api_probe.pyx'), 'w') as f:
+            f.write(C_API_PROBE)
+        importers = pyximport.install(build_dir=directory, language_level=2,
+                                      setup_args={'include_dirs': [package_root, np.get_include()]})
+        sys.path.insert(0, directory)
+        try:
+            import calendar_c_api_probe
+        except ImportError as e:
+            self.skipTest("cannot build the C API probe: {0}".format(e))
+        finally:
+            sys.path.remove(directory)
+            pyximport.uninstall(*importers)
+            shutil.rmtree(directory, ignore_errors=True)
+
+        cal = Calendar('NYSE')
+        for serial in [-5, 0, 366, 109575, 150000, 2 ** 31 - 10]:
+            self.assertEqual(calendar_c_api_probe.probe(cal, serial), [0] * 6)
+        d = Date(2018, 1, 2)
+        self.assertEqual(calendar_c_api_probe.probe(cal, d.serial_number),
+                         [1, d.serial_number, cal.nth_biz_day_after(d, 1).serial_number, d.serial_number,
+                          cal.advance_date(d, Period('400d')).serial_number,
+                          cal.biz_days_between(d, Date(serial_number=43000), True, True)])
+
+    def test_batch_functions_on_threads(self):
+        cal = Calendar('China.SSE')
+        serials = np.random.RandomState(42).randint(Date(1950, 1, 1).serial_number, Date(2150, 1, 1).serial_number,
+                                                    size=300001).astype(np.intc)
+        expected = (cal.is_biz_day_batch(serials),
+                    cal.adjust_date_batch(serials, BizDayConventions.ModifiedFollowing),
+                    cal.advance_date_batch(serials, '3m', BizDayConventions.Following, True),
+                    cal.advance_date_batch(serials, '-5b'))
+
+        threads = get_num_threads()
+        try:
+            for n in [2, 3, 8]:
+                set_num_threads(n)
+                self.assertEqual(get_num_threads(), n)
+                np.testing.assert_array_equal(cal.is_biz_day_batch(serials), expected[0])
+                np.testing.assert_array_equal(cal.adjust_date_batch(serials, BizDayConventions.ModifiedFollowing),
+                                              expected[1])
+                np.testing.assert_array_equal(cal.advance_date_batch(serials, '3m', BizDayConventions.Following,
+                                                                     True), expected[2])
+                np.testing.assert_array_equal(cal.advance_date_batch(serials, '-5b'), expected[3])
+
+            serials[123456] = Date(2199, 12, 31).serial_number
+            with self.assertRaises(ValueError):
+                _ = cal.advance_date_batch(serials, '1m')
+            with self.assertRaises(ValueError):
+                set_num_threads(0)
+            for n in [2.9, 2.0, '2', None]:
+                with self.assertRaises(TypeError):
+                    set_num_threads(n)
+            self.assertEqual(get_num_threads(), 8)
+            set_num_threads(np.int64(2))
+            self.assertEqual(get_num_threads(), 2)
+        finally:
+            set_num_threads(threads)
+
+    def test_set_num_threads_during_batches(self):
+        cal = Calendar('China.SSE')
+        serials = np.arange(Date(1950, 1, 1).serial_number, Date(2150, 1, 1).serial_number, dtype=np.intc)
+        expected = cal.adjust_date_batch(serials)
+        errors = []
+
+        def run():
+            try:
+                for _ in range(20):
+                    np.testing.assert_array_equal(cal.adjust_date_batch(serials), expected)
+            except Exception as e:
+                errors.append(e)
+
+        threads = get_num_threads()
+        try:
+            set_num_threads(2)
+            workers = [threading.Thread(target=run) for _ in range(4)]
+            for t in workers:
+                t.start()
+            n = 0
+            while any(t.is_alive() for t in workers):
+                set_num_threads(2 + n % 3)
+                n += 1
+            for t in workers:
+                t.join()
+        finally:
+            set_num_threads(threads)
+        self.assertEqual(errors, [])
+
+    def test_num_threads_from_environment(self):
+        code = ("import warnings; warnings.simplefilter('always'); import market_calendars; "
+                "from market_calendars.core import get_num_threads; print(get_num_threads())")
+        path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        for value, expected in [('3', '3'), (' 2 ', '2'), ('', '1'), ('four', '1'), ('0', '1')]:
+            env = dict(os.environ, PYTHONPATH=path, MARKET_CALENDARS_NUM_THREADS=value)
+            process = subprocess.Popen([sys.executable, '-c', code], env=env, stdout=subprocess.PIPE,
+                                       stderr=subprocess.PIPE, universal_newlines=True)
+            output, errors = process.communicate()
+            self.assertEqual(process.returncode, 0, errors)
+            self.assertEqual(output.strip(), expected)
+            self.assertEqual('MARKET_CALENDARS_NUM_THREADS' in errors, expected == '1' and value != '')
+
+    def test_batch_functions_with_datetime64(self):
+        cal = Calendar('China.SSE')
+        dates = np.array([['2017-04-27', '2017-10-01'], ['2018-02-14', '2018-02-15']], dtype='datetime64[D]')
+
+        calculated = cal.adjust_date_batch(dates, BizDayConventions.Following)
+        self.assertEqual(calculated.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(calculated.shape, (2, 2))
+        self.assertEqual(calculated[0, 1], np.datetime64('2017-10-09'))
+        self.assertEqual(cal.is_biz_day_batch(dates).tolist(), [[True, False], [True, False]])
+        self.assertEqual(cal.advance_date_batch(dates, '1b')[1, 0], np.datetime64('2018-02-22'))
+
+        with self.assertRaises(ValueError):
+            _ = cal.adjust_date_batch(dates, -1)
+        with self.assertRaises(ValueError):
+            _ = cal.advance_date_batch(dates, '300y')
+        with self.assertRaises(TypeError):
+            _ = cal.is_biz_day_batch(np.array([1.5]))
+        # NaT and integers wider than int32 are rejected, not wrapped into valid serials
+        for dates in [np.array(['NaT'], dtype='datetime64[D]'), np.array(['2018-01-02', 'NaT'], dtype='datetime64[s]'),
+                      np.array([2 ** 32 + 43145], dtype=np.int64), np.array([2 ** 63 + 43145], dtype=np.uint64),
+                      np.array([43145, 366])]:
+            for func in [cal.is_biz_day_batch, cal.adjust_date_batch, lambda d: cal.advance_date_batch(d, '1d')]:
+                with self.assertRaises(ValueError):
+                    func(dates)
+
+    def test_serial_ranges(self):
+        from_date = Date(2014, 1, 31)
+        to_date = Date(2014, 2, 28)
+        for name in ['China.SSE', 'China.IB', 'NYSE']:
+            cal = Calendar(name)
+            self.assertEqual(cal.holiday_serials(from_date, to_date, True).tolist(),
+                             [d.serial_number for d in cal.holiday_dates_list(from_date, to_date, True)])
+            self.assertEqual(cal.holiday_serials(from_date, to_date, False).tolist(),
+                             [d.serial_number for d in cal.holiday_dates_list(from_date, to_date, False)])
+            self.assertEqual(cal.biz_serials(from_date, to_date).tolist(),
+                             [d.serial_number for d in cal.biz_dates_list(from_date, to_date)])
+            self.assertEqual(cal.biz_serials(to_date, from_date).tolist(), [])
+
+    def test_adjust_date_matches_day_by_day_walk(self):
+        def walk(cal, d, step):
+            while not cal.is_biz_day(d):
+                d += step
+            return d
+
+        for name in ['China.SSE', 'China.IB', 'NYSE', 'Target']:
+            cal = Calendar(name)
+            d = Date(2017, 12, 1)
+            while d <= Date(2019, 3, 1):
+                following = walk(cal, d, 1)
+                preceding = walk(cal, d, -1)
+                modified_following = preceding if following.month() != d.month() else following
+                half_month = preceding if d.day_of_month() <= 15 < following.day_of_month() else modified_following
+                expected = {BizDayConventions.Unadjusted: d,
+                            BizDayConventions.Following: following,
+                            BizDayConventions.Preceding: preceding,
+                            BizDayConventions.ModifiedFollowing: modified_following,
+                            BizDayConventions.HalfMonthModifiedFollowing: half_month,
+                            BizDayConventions.ModifiedPreceding:
+                                following if preceding.month() != d.month() else preceding,
+                            BizDayConventions.Nearest:
+                                following if following - d <= d - preceding else preceding}
+                for convention, adjusted in expected.items():
+                    self.assertEqual(cal.adjust_date(d, convention), adjusted, (name, d, convention))
+
+                month_end = walk(cal, Date.end_of_month(d), -1)
+                self.assertEqual(cal.end_of_month(d), month_end)
+                self.assertEqual(cal.is_end_of_month(d), d >= month_end)
+                d += 1
+
+    def test_iterators(self):
+        cal = Calendar('China.SSE')
+        from_date = Date(2013, 12, 20)
+        to_date = Date(2016, 1, 10)
+        biz = cal.biz_serials(from_date, to_date).tolist()
+        holidays = cal.holiday_serials(from_date, to_date).tolist()
+        exchange_holidays = cal.holiday_serials(from_date, to_date, False).tolist()
+
+        self.assertEqual(list(cal.iter_biz_days(from_date, to_date)), cal.biz_dates_list(from_date, to_date))
+        self.assertEqual(list(cal.iter_holidays(from_date, to_date, False, True)),
+                         cal.holiday_dates_list(from_date, to_date, False)[::-1])
+        for chunk_size in [1, 7, 250, 5000]:
+            for backward in [False, True]:
+                for iterated, expected in [(cal.iter_biz_days(from_date, to_date, backward, chunk_size), biz),
+                                           (cal.iter_holidays(from_date, to_date, True, backward, chunk_size),
+                                            holidays),
+                                           (cal.iter_holidays(from_date, to_date, False, backward, chunk_size),
+                                            exchange_holidays)]:
+                    chunks = list(iterated)
+                    self.assertTrue(all(len(c) == chunk_size for c in chunks[:-1]))
+                    self.assertTrue(0 < len(chunks[-1]) <= chunk_size)
+                    self.assertEqual(np.concatenate(chunks).tolist(), expected[::-1] if backward else expected)
+
+        # stops early and walks the whole supported range without building it
+        days = cal.iter_biz_days(Date(1901, 1, 1), Date(2199, 12, 31), backward=True)
+        self.assertEqual(next(days), cal.adjust_date(Date(2199, 12, 31), BizDayConventions.Preceding))
+        self.assertEqual(next(days), cal.advance_date(Date(2199, 12, 31), Period('-1b')))
+        self.assertEqual(sum(len(c) for c in cal.iter_biz_days(Date(1901, 1, 1), Date(2199, 12, 31),
+                                                               chunk_size=100000)),
+                         cal.biz_days_between(Date(1901, 1, 1), Date(2199, 12, 31), True, True))
+        self.assertEqual(list(cal.iter_biz_days(to_date, from_date)), [])
+
+        with self.assertRaises(ValueError):
+            cal.iter_biz_days(from_date, to_date, chunk_size=0)
+        for chunk_size in [2.9, '3']:
+            with self.assertRaises(TypeError):
+                cal.iter_biz_days(from_date, to_date, chunk_size=chunk_size)
+        self.assertEqual(next(cal.iter_biz_days(from_date, to_date, chunk_size=np.int64(3))).shape, (3,))
+
+    def test_holiday_table_file(self):
+        from_date = Date(2000, 1, 1)
+        to_date = Date(2030, 12, 31)
+        expected = {name: (Calendar(name).holiday_serials(from_date, to_date).tolist(),
+                           Calendar(name).biz_days_between(from_date, to_date))
+                    for name in ['China.SSE', 'China.IB', 'NYSE', 'Target']}
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'holidays.bin')
+        try:
+            self.assertEqual(compile_holiday_tables(path, ['China.SSE', 'Null', 'NullCalendar', 'China.IB', 'NYSE']),
+                             ['china.sse', 'null', 'china.ib', 'nyse'])
+            self.assertEqual(load_holiday_tables(path), ['china.sse', 'null', 'china.ib', 'nyse'])
+
+            for name, (holidays, count) in expected.items():
+                cal = Calendar(name)
+                self.assertEqual(cal.holiday_serials(from_date, to_date).tolist(), holidays)
+                self.assertEqual(cal.biz_days_between(from_date, to_date), count)
+                self.assertEqual(cal.adjust_date(Date(2018, 2, 16)), Calendar(name).adjust_date(Date(2018, 2, 16)))
+
+            # damaged copies; the loaded tables map the original file, which must stay intact
+            with open(path, 'rb') as f:
+                data = bytearray(f.read())
+            header = struct.Struct('<8sIiiII')
+            entry = struct.Struct('<32s' + 'QQ' * 7 + 'I')
+
+            def write_copy(data, update_checksum):
+                if update_checksum:
+                    fields = list(header.unpack_from(data, 0))
+                    fields[-1] = zlib.crc32(bytes(data[header.size:])) & 0xffffffff
+                    header.pack_into(data, 0, *fields)
+                with open(damaged, 'wb') as f:
+                    f.write(data)
+
+            damaged = os.path.join(directory, 'damaged.bin')
+            flipped = bytearray(data)
+            flipped[-1] ^= 0xff
+            write_copy(flipped, False)
+            with self.assertRaisesRegex(ValueError, 'checksum'):
+                load_holiday_tables(damaged)
+
+            # crafted files with a valid checksum: a short table, a table past the end of the file and a
+            # next business day table pointing outside the serial range
+            for table, field, value in [(1, 'count', 1000), (4, 'offset', len(data)), (0, 'count', 10)]:
+                crafted = bytearray(data)
+                fields = list(entry.unpack_from(crafted, header.size))
+                fields[1 + 2 * table + (field == 'count')] = value
+                entry.pack_into(crafted, header.size, *fields)
+                write_copy(crafted, True)
+                with self.assertRaisesRegex(ValueError, 'corrupted'):
+                    load_holiday_tables(damaged)
+            crafted = bytearray(data)
+            fields = entry.unpack_from(crafted, header.size)
+            struct.pack_into('<i', crafted, fields[9] + 4 * 40000, MAX_SERIAL + 1)
+            write_copy(crafted, True)
+            with self.assertRaisesRegex(ValueError, 'outside'):
+                load_holiday_tables(damaged)
+            self.assertEqual(Calendar('China.SSE').holiday_serials(from_date, to_date).tolist(),
+                             expected['China.SSE'][0])
+
+            # a registered centre is only loaded for the definition its tables were compiled from
+            custom = os.path.join(directory, 'custom.bin')
+            register_holiday_center('Test.File', ['China.SSE', 'NYSE'], holidays=['2018-03-01'])
+            try:
+                compile_holiday_tables(custom, ['Test.File', 'NYSE'])
+                self.assertEqual(load_holiday_tables(custom), ['test.file', 'nyse'])
+                register_holiday_center('Test.File', ['NYSE'])
+                self.assertEqual(load_holiday_tables(custom), ['nyse'])
+                self.assertTrue(Calendar('Test.File').is_biz_day(Date(2018, 3, 1)))
+                self.assertTrue(Calendar('Test.File').is_biz_day(Date(2018, 2, 16)))
+            finally:
+                unregister_holiday_center('Test.File')
+
+            with self.assertRaises(ValueError):
+                compile_holiday_tables(path, ['China.SSF'])
+            register_holiday_center('a' * 33, ['China.SSE'])
+            try:
+                with self.assertRaisesRegex(ValueError, 'longer'):
+                    compile_holiday_tables(damaged, ['a' * 33])
+            finally:
+                unregister_holiday_center('a' * 33)
+        finally:
+            # the loaded tables stay mapped after the files are unlinked
+            for name in os.listdir(directory):
+                os.unlink(os.path.join(directory, name))
+            os.rmdir(directory)
+
+    def test_registered_holiday_centers(self):
+        sse = Calendar('China.SSE')
+        nyse = Calendar('NYSE')
+        register_holiday_center('Test.Both', ['China.SSE', 'NYSE'])
+        register_holiday_center('Test.Either', ['China.SSE', 'NYSE'], join='union')
+        register_holiday_center('Test.Custom', 'Test.Both', holidays=[Date(2018, 3, 1)], biz_days=['2018-02-24'])
+        try:
+            self.assertTrue({'test.both', 'test.either', 'test.custom'} <= set(holiday_centers()))
+            both = Calendar('Test.Both')
+            either = Calendar('test.either')
+            custom = Calendar('TEST.CUSTOM')
+            d = Date(2017, 12, 1)
+            while d <= Date(2018, 12, 31):
+                self.assertEqual(both.is_biz_day(d), sse.is_biz_day(d) and nyse.is_biz_day(d))
+                self.assertEqual(either.is_biz_day(d), sse.is_biz_day(d) or nyse.is_biz_day(d))
+                if d != Date(2018, 3, 1) and d != Date(2018, 2, 24):
+                    self.assertEqual(custom.is_biz_day(d), both.is_biz_day(d))
+                d += 1
+            self.assertFalse(custom.is_biz_day(Date(2018, 3, 1)))
+            self.assertTrue(custom.is_biz_day(Date(2018, 2, 24)))
+
+            self.assertTrue(both.is_weekend(Weekdays.Saturday))
+            self.assertFalse(both.is_weekend(Weekdays.Monday))
+            self.assertEqual(both.advance_date(Date(2018, 2, 14), Period('1b')), Date(2018, 2, 22))
+            self.assertEqual(both.biz_days_between(Date(2018, 1, 1), Date(2019, 1, 1)),
+                             sum(1 for d in sse.biz_dates_list(Date(2018, 1, 1), Date(2018, 12, 31))
+                                 if nyse.is_biz_day(d)))
+
+            # a redefinition applies to calendars created afterwards, not to centres built on the old one
+            register_holiday_center('Test.Both', 'Null')
+            self.assertTrue(Calendar('Test.Both').is_biz_day(Date(2018, 2, 16)))
+            self.assertFalse(Calendar('Test.Custom').is_biz_day(Date(2018, 2, 16)))
+
+            with self.assertRaises(ValueError):
+                register_holiday_center('NYSE', 'Null')
+            with self.assertRaises(ValueError):
+                register_holiday_center('Test.Wrong', ['China.SSF'])
+            with self.assertRaises(ValueError):
+                register_holiday_center('Test.Wrong', ['China.SSE'], join='all')
+        finally:
+            for name in ['Test.Both', 'Test.Either', 'Test.Custom']:
+                unregister_holiday_center(name)
+        with self.assertRaises(ValueError):
+            _ = Calendar('Test.Both')
+
     def test_null_calendar(self):
         cal = Calendar("Null")
 
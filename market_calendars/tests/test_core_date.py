@@ -4,9 +4,15 @@ import tempfile
 import pickle
 import os
 import datetime as dt
+import numpy as np
+import pandas as pd
 from market_calendars.core import (Date,
                                   Period,
-                                  Weekdays)
+                                  Calendar,
+                                  Weekdays,
+                                  check_date,
+                                  set_date_interning,
+                                  is_date_interning)
 
 
 class TestDate(unittest.TestCase):
@@ -161,6 +167,12 @@ class TestDate(unittest.TestCase):
         test_date = Date(1901, 1, 1)
         with self.assertRaises(ValueError):
             _ = test_date - '1w'
+        with self.assertRaises(ValueError):
+            _ = test_date - 1
+        with self.assertRaises(ValueError):
+            _ = Date(serial_number=test_date.serial_number - 1)
+        with self.assertRaises(ValueError):
+            _ = Date.max_date() + 1
 
     def test_consistency(self):
         min_date = Date.min_date().serial_number + 1
@@ -292,12 +304,61 @@ class TestDate(unittest.TestCase):
                               " input date:    {0:s}\n"
                               " parsed:        {1}".format(input_date, d))
 
+    def test_check_date(self):
+        expected = Date(2018, 2, 14)
+        inputs = ['2018-02-14', '20180214', '2018-02-14T09:30:00', '2018-02-14 09:30:00', '2018/2/14', 'Feb 14 2018',
+                  dt.date(2018, 2, 14), dt.datetime(2018, 2, 14, 9, 30), np.datetime64('2018-02-14'),
+                  np.datetime64('2018-02-14T09:30'), pd.Timestamp('2018-02-14 09:30')]
+        for input_date in inputs:
+            self.assertEqual(check_date(input_date), expected, "check_date failed for {0!r}".format(input_date))
+        self.assertIs(check_date(expected), expected)
+
+        for input_date in [np.str_('2018-02-14'), np.str_('20180214'), np.str_('Feb 14 2018')]:
+            self.assertEqual(check_date(input_date), expected, "check_date failed for {0!r}".format(input_date))
+        self.assertEqual(check_date(np.str_('2018-02-14'), strict=True), expected)
+
+        for input_date in ['2018-02-30', '2018-13-01', '1899-12-31', '22000101', '2018-02-14Tgarbage',
+                           dt.date(1850, 1, 1), np.datetime64('2200-01-01')]:
+            with self.assertRaises(ValueError):
+                _ = check_date(input_date)
+        for input_date in ['NaT', np.str_('NaT'), np.datetime64('NaT'), np.datetime64('NaT', 'ns'), pd.NaT]:
+            with self.assertRaisesRegex(ValueError, 'NaT'):
+                _ = check_date(input_date)
+
+    def test_check_date_strict(self):
+        self.assertEqual(check_date('2018-02-14', strict=True), Date(2018, 2, 14))
+        self.assertEqual(check_date('20180214', strict=True), Date(2018, 2, 14))
+        for input_date in ['2018/2/14', '2018-2-14', '02/14/2018', '2018-02-14Tgarbage', '2018-02-14 09:30:00',
+                           '2018-02-14-']:
+            with self.assertRaises(ValueError):
+                _ = check_date(input_date, strict=True)
+
     def test_date_deep_copy(self):
         benchmark_date = Date(2016, 1, 2)
         copied_date = copy.deepcopy(benchmark_date)
 
         self.assertEqual(benchmark_date, copied_date)
 
+    def test_date_interning(self):
+        cal = Calendar('China.SSE')
+        self.assertFalse(is_date_interning())
+        self.assertIsNot(Date(2018, 2, 14) + 1, Date(2018, 2, 14) + 1)
+
+        set_date_interning(True)
+        try:
+            self.assertTrue(is_date_interning())
+            self.assertIs(Date(2018, 2, 14) + 1, Date(2018, 2, 16) - 1)
+            self.assertIs(Date.from_excel_serial_number(43145), Date(2018, 2, 13) + '1d')
+            biz_dates = cal.biz_dates_list(Date(2018, 2, 1), Date(2018, 2, 28))
+            self.assertTrue(all(d is e for d, e in zip(biz_dates, cal.biz_dates_list(Date(2018, 2, 1),
+                                                                                      Date(2018, 2, 28)))))
+            self.assertEqual(biz_dates[0], Date(2018, 2, 1))
+        finally:
+            set_date_interning(False)
+
+        self.assertFalse(is_date_interning())
+        self.assertIsNot(Date(2018, 2, 14) + 1, Date(2018, 2, 14) + 1)
+
     def test_date_pickle(self):
         benchmark_date = Date(2016, 1, 2)
 
@@ -310,3 +371,11 @@ class TestDate(unittest.TestCase):
             self.assertEqual(benchmark_date, pickled_date)
 
         os.unlink(f.name)
+
+    def test_date_pickle_round_trip(self):
+        dates = [Date(1901, 1, 1), Date(2016, 2, 29), Date(2199, 12, 31)]
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            pickled_dates = pickle.loads(pickle.dumps(dates, protocol))
+            self.assertEqual(pickled_dates, dates)
+            self.assertEqual([(d.year(), d.month(), d.day_of_month(), d.weekday()) for d in pickled_dates],
+                             [(d.year(), d.month(), d.day_of_month(), d.weekday()) for d in dates])
@@ -0,0 +1,135 @@
+import unittest
+import pickle
+import numpy as np
+import market_calendars as mcal
+from market_calendars.core import (Date,
+                                   DateArray,
+                                   Period,
+                                   Calendar,
+                                   Schedule)
+
+
+class TestDateArray(unittest.TestCase):
+    def setUp(self):
+        self.dates = DateArray(np.array(['2018-01-31', '2018-02-28', '2020-02-29', '2199-12-31'],
+                                        dtype='datetime64[D]'))
+
+    def test_construction(self):
+        expected = [Date(2018, 1, 31), Date(2018, 2, 28), Date(2020, 2, 29), Date(2199, 12, 31)]
+        self.assertEqual(self.dates.tolist(), expected)
+        self.assertEqual(list(self.dates), expected)
+        self.assertEqual(DateArray(expected).tolist(), expected)
+        self.assertEqual(DateArray(['2018-01-31', '20180228']).tolist(), expected[:2])
+        self.assertEqual(DateArray([d.serial_number for d in expected]).tolist(), expected)
+        self.assertEqual(DateArray(self.dates).tolist(), expected)
+        self.assertEqual(len(DateArray()), 0)
+
+        with self.assertRaises(ValueError):
+            _ = DateArray([1])
+        with self.assertRaises(ValueError):
+            _ = DateArray(['1900-12-31'])
+
+    def test_buffer_protocol(self):
+        serials = np.asarray(self.dates)
+        self.assertEqual(serials.dtype, np.dtype(np.intc))
+        self.assertEqual(serials.tolist(), [d.serial_number for d in self.dates])
+        self.assertFalse(serials.flags.writeable)
+        self.assertTrue(np.shares_memory(serials, np.asarray(self.dates)))
+        self.assertEqual(np.asarray(DateArray()).shape, (0,))
+
+        view = memoryview(self.dates)
+        self.assertEqual((view.format, view.shape, view.readonly), ('i', (4,), True))
+
+    def test_indexing(self):
+        self.assertEqual(self.dates[0], Date(2018, 1, 31))
+        self.assertEqual(self.dates[-1], Date(2199, 12, 31))
+        self.assertIsInstance(self.dates[1:3], DateArray)
+        self.assertEqual(self.dates[1:3].tolist(), [Date(2018, 2, 28), Date(2020, 2, 29)])
+        self.assertEqual(self.dates[::2].tolist(), [Date(2018, 1, 31), Date(2020, 2, 29)])
+        self.assertEqual(self.dates[self.dates > Date(2020, 1, 1)].tolist(), [Date(2020, 2, 29), Date(2199, 12, 31)])
+
+    def test_comparison(self):
+        self.assertEqual((self.dates == Date(2018, 2, 28)).tolist(), [False, True, False, False])
+        self.assertEqual((self.dates < '2020-01-01').tolist(), [True, True, False, False])
+        self.assertEqual((self.dates >= self.dates[::-1]).tolist(), [False, False, True, True])
+        self.assertEqual((self.dates != self.dates).tolist(), [False] * 4)
+
+    def test_arithmetic(self):
+        shifted = self.dates[:3] + '1m'
+        self.assertIsInstance(shifted, DateArray)
+        self.assertEqual(shifted.tolist(), [Date(2018, 2, 28), Date(2018, 3, 28), Date(2020, 3, 29)])
+        for period in ['1d', '-2w', '1m', '-7m', '1y', '-1y']:
+            expected = [d + Period(period) for d in self.dates[:3]]
+            self.assertEqual((self.dates[:3] + Period(period)).tolist(), expected)
+            self.assertEqual((self.dates[:3] - period).tolist(), [d - Period(period) for d in self.dates[:3]])
+        self.assertEqual((self.dates[:3] + 1).tolist(), [d + 1 for d in self.dates[:3]])
+        for n in [np.int64(3), np.int32(-3), np.intc(1)]:
+            shifted = self.dates[:3] + n
+            self.assertIsInstance(shifted, DateArray)
+            self.assertEqual(shifted.tolist(), [d + int(n) for d in self.dates[:3]])
+            shifted = self.dates[:3] - n
+            self.assertIsInstance(shifted, DateArray)
+            self.assertEqual(shifted.tolist(), [d - int(n) for d in self.dates[:3]])
+        self.assertEqual((self.dates - self.dates[0]).tolist(), [d - self.dates[0] for d in self.dates])
+        self.assertEqual((self.dates - self.dates).tolist(), [0] * 4)
+
+        with self.assertRaises(ValueError):
+            _ = self.dates + '1d'
+        for bad in [lambda: self.dates + self.dates, lambda: self.dates + 1.5, lambda: self.dates - [1],
+                    lambda: Date(2018, 1, 1) - self.dates, lambda: 1 - self.dates]:
+            with self.assertRaisesRegex(TypeError, 'unsupported operand'):
+                bad()
+
+    def test_columns(self):
+        self.assertEqual(self.dates.year().tolist(), [2018, 2018, 2020, 2199])
+        self.assertEqual(self.dates.month().tolist(), [1, 2, 2, 12])
+        self.assertEqual(self.dates.day_of_month().tolist(), [31, 28, 29, 31])
+        self.assertEqual(self.dates.weekday().tolist(), [d.weekday() for d in self.dates])
+
+    def test_datetime64_round_trip(self):
+        values = self.dates.to_datetime64()
+        self.assertEqual(values.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(DateArray(values).tolist(), self.dates.tolist())
+        self.assertEqual(str(values[2]), '2020-02-29')
+
+    def test_pickle(self):
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(self.dates, protocol)).tolist(), self.dates.tolist())
+        self.assertEqual(len(pickle.loads(pickle.dumps(DateArray()))), 0)
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "out-of-band buffers need pickle protocol 5")
+    def test_pickle_out_of_band(self):
+        dates = DateArray(np.arange(Date(2000, 1, 1).serial_number, Date(2100, 1, 1).serial_number))
+        buffers = []
+        data = pickle.dumps(dates, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertLess(len(data), 200)
+
+        loaded = pickle.loads(data, buffers=buffers)
+        self.assertTrue(np.shares_memory(np.asarray(loaded), np.asarray(dates)))
+        self.assertEqual(loaded[0], Date(2000, 1, 1))
+        self.assertEqual(loaded[-1], Date(2099, 12, 31))
+
+        with self.assertRaises(ValueError):
+            pickle.loads(data, buffers=[np.zeros(3, dtype=np.int32)])
+
+        # the caller's buffer is not frozen
+        writable = np.array(np.asarray(dates), dtype='<i4')
+        loaded = pickle.loads(data, buffers=[writable])
+        self.assertTrue(writable.flags.writeable)
+        self.assertEqual(loaded[0], Date(2000, 1, 1))
+
+    def test_returned_by_calendar_and_schedule(self):
+        cal = Calendar('China.SSE')
+        from_date = Date(2018, 2, 1)
+        to_date = Date(2018, 3, 1)
+        self.assertEqual(cal.biz_dates_array(from_date, to_date).tolist(), cal.biz_dates_list(from_date, to_date))
+        self.assertEqual(cal.holiday_dates_array(from_date, to_date, False).tolist(),
+                         cal.holiday_dates_list(from_date, to_date, False))
+
+        sch = Schedule(Date(2018, 1, 31), Date(2019, 1, 31), Period('3m'), cal)
+        self.assertEqual(sch.dates_array().tolist(), sch._dates)
+
+        dates = mcal.get_calendar('China.SSE').biz_days('2018-02-01', '2018-03-01', output_format='date_array')
+        self.assertIsInstance(dates, DateArray)
+        self.assertEqual(dates.tolist(), cal.biz_dates_list(from_date, to_date))
@@ -0,0 +1,126 @@
+import unittest
+import pickle
+import numpy as np
+from market_calendars.core import (Date,
+                                   DateArray,
+                                   Period,
+                                   Calendar,
+                                   Schedule,
+                                   DayCounter,
+                                   DayCounters)
+
+
+class TestDayCounter(unittest.TestCase):
+    def test_construction(self):
+        self.assertEqual(DayCounter('Act/360'), DayCounter(DayCounters.Actual360))
+        self.assertEqual(DayCounter('actual/365f').name, 'Actual/365 (Fixed)')
+        self.assertEqual(repr(DayCounter('30E/360 ISDA')), "DayCounter('30E/360 (ISDA)')")
+        self.assertEqual(DayCounter('Business/252', Calendar('China.SSE')),
+                         DayCounter(DayCounters.Business252, Calendar('china.sse')))
+        self.assertNotEqual(DayCounter('Business/252', Calendar('China.SSE')),
+                            DayCounter('Business/252', Calendar('NYSE')))
+        self.assertNotEqual(DayCounter('30/360'), DayCounter('30E/360'))
+        # the calendar of a convention that ignores it does not matter
+        self.assertEqual(DayCounter('Actual/360', Calendar('China.SSE')), DayCounter('Actual/360', Calendar('NYSE')))
+        self.assertEqual(DayCounter('Actual/360', Calendar('NYSE')), DayCounter('Actual/360'))
+        self.assertEqual(DayCounter(u'Act/360'), DayCounter(np.str_('Act/360')))
+
+        with self.assertRaises(ValueError):
+            DayCounter('Act/364')
+        with self.assertRaises(ValueError):
+            DayCounter(7)
+        with self.assertRaises(ValueError):
+            DayCounter('Business/252')
+
+    def test_actual(self):
+        d1 = Date(2018, 1, 1)
+        d2 = Date(2018, 7, 1)
+        self.assertEqual(DayCounter('Actual/360').day_count(d1, d2), 181)
+        self.assertAlmostEqual(DayCounter('Actual/360').year_fraction(d1, d2), 181 / 360.0)
+        self.assertAlmostEqual(DayCounter('Actual/365 (Fixed)').year_fraction(d1, d2), 181 / 365.0)
+        self.assertAlmostEqual(DayCounter('Actual/365 (Fixed)').year_fraction(d2, d1), -181 / 365.0)
+
+        act_act = DayCounter('Actual/Actual (ISDA)')
+        self.assertAlmostEqual(act_act.year_fraction(Date(2003, 11, 1), Date(2004, 5, 1)), 0.497724380567, 12)
+        self.assertAlmostEqual(act_act.year_fraction(Date(2004, 5, 1), Date(2003, 11, 1)), -0.497724380567, 12)
+        self.assertAlmostEqual(act_act.year_fraction(Date(1999, 7, 1), Date(2003, 7, 1)), 4.0, 2)
+        self.assertAlmostEqual(act_act.year_fraction(Date(2000, 1, 1), Date(2001, 1, 1)), 1.0)
+        self.assertAlmostEqual(act_act.year_fraction(Date(2199, 6, 1), Date(2199, 12, 31)), 213 / 365.0)
+
+    def test_thirty_360(self):
+        # start, end, 30/360 (US), 30E/360 and 30E/360 (ISDA) day counts
+        cases = [(Date(2007, 1, 15), Date(2007, 2, 15), 30, 30, 30),
+                 (Date(2007, 1, 31), Date(2007, 2, 28), 28, 28, 30),
+                 (Date(2007, 2, 28), Date(2008, 2, 29), 361, 361, 360),
+                 (Date(2007, 3, 31), Date(2007, 4, 30), 30, 30, 30),
+                 (Date(2007, 3, 30), Date(2007, 3, 31), 0, 0, 0),
+                 (Date(2007, 3, 15), Date(2007, 3, 31), 16, 15, 15),
+                 (Date(2008, 2, 29), Date(2008, 8, 31), 182, 181, 180)]
+        counters = [DayCounter('30/360'), DayCounter('30E/360'), DayCounter('30E/360 (ISDA)')]
+        for d1, d2, us, european, isda in cases:
+            for dc, expected in zip(counters, [us, european, isda]):
+                self.assertEqual(dc.day_count(d1, d2), expected, "{0} from {1} to {2}".format(dc.name, d1, d2))
+                self.assertAlmostEqual(dc.year_fraction(d1, d2), expected / 360.0)
+
+    def test_business_252(self):
+        cal = Calendar('China.SSE')
+        dc = DayCounter('Business/252', cal)
+        d1 = Date(2018, 2, 1)
+        d2 = Date(2018, 3, 1)
+        count = len(cal.biz_dates_list(d1, d2 - 1))
+        self.assertEqual(dc.day_count(d1, d2), count)
+        self.assertEqual(dc.day_count(d2, d1), -count)
+        self.assertAlmostEqual(dc.year_fraction(d1, d2), count / 252.0)
+        # the Spring Festival closure is not counted
+        self.assertEqual(dc.day_count(Date(2018, 2, 15), Date(2018, 2, 22)), 0)
+
+    def test_batch(self):
+        cal = Calendar('NYSE')
+        start = np.arange(Date(2000, 1, 1).serial_number, Date(2030, 1, 1).serial_number, 7)
+        end = start + np.arange(start.shape[0]) % 800
+        for convention in range(len(DayCounters)):
+            dc = DayCounter(convention, cal)
+            counts = dc.day_count_batch(start, end)
+            fractions = dc.year_fraction_batch(start, end)
+            self.assertEqual(counts.dtype, np.dtype(np.intc))
+            self.assertEqual(fractions.dtype, np.dtype(np.float64))
+            for i in range(0, start.shape[0], 97):
+                d1 = Date.from_excel_serial_number(int(start[i]))
+                d2 = Date.from_excel_serial_number(int(end[i]))
+                self.assertEqual(counts[i], dc.day_count(d1, d2))
+                self.assertEqual(fractions[i], dc.year_fraction(d1, d2))
+
+        dc = DayCounter('Actual/365 (Fixed)')
+        ends = np.array([['2018-07-01', '2019-01-01'], ['2020-01-01', '2021-01-01']], dtype='datetime64[D]')
+        np.testing.assert_allclose(dc.year_fraction_batch(np.datetime64('2018-01-01'), ends),
+                                   [[181 / 365.0, 1.0], [730 / 365.0, 1096 / 365.0]])
+        self.assertEqual(dc.day_count_batch(DateArray(['2018-01-01', '2018-02-01']),
+                                            [Date(2018, 1, 2), Date(2018, 3, 1)]).tolist(), [1, 28])
+        self.assertEqual(dc.day_count_batch([], []).shape, (0,))
+
+        with self.assertRaises(ValueError):
+            dc.day_count_batch(np.array([0]), np.array([Date(2018, 1, 1).serial_number]))
+        with self.assertRaises(ValueError):
+            dc.day_count_batch(np.array(['NaT'], 'M8[D]'), np.array(['2020-01-01'], 'M8[D]'))
+        with self.assertRaises(ValueError):
+            dc.day_count_batch(np.array([2 ** 32 + 43831]), np.array([43832]))
+        with self.assertRaises(ValueError):
+            dc.accrual_fractions(np.array(['2020-01-01', 'NaT'], 'M8[D]'))
+        with self.assertRaises(ValueError):
+            dc.day_count_batch(np.arange(3), np.arange(2))
+
+    def test_accrual_fractions(self):
+        cal = Calendar('China.SSE')
+        sch = Schedule(Date(2018, 1, 31), Date(2020, 1, 31), Period('6m'), cal)
+        for dc in [DayCounter('Actual/Actual (ISDA)'), DayCounter('30/360'), DayCounter('Business/252', cal)]:
+            expected = [dc.year_fraction(sch[i], sch[i + 1]) for i in range(sch.size() - 1)]
+            self.assertEqual(dc.accrual_fractions(sch).tolist(), expected)
+            self.assertEqual(dc.accrual_fractions(sch.dates_array()).tolist(), expected)
+        self.assertEqual(DayCounter('30/360').accrual_fractions([Date(2018, 1, 31)]).shape, (0,))
+
+    def test_pickle(self):
+        for dc in [DayCounter('30E/360'), DayCounter('Business/252', Calendar('NYSE'))]:
+            loaded = pickle.loads(pickle.dumps(dc))
+            self.assertEqual(loaded, dc)
+            self.assertEqual(loaded.day_count(Date(2018, 1, 1), Date(2019, 1, 1)),
+                             dc.day_count(Date(2018, 1, 1), Date(2019, 1, 1)))
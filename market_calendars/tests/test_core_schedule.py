@@ -3,12 +3,17 @@ import copy
 import pickle
 import tempfile
 import os
+import numpy as np
 from market_calendars.core import (Date,
                                    Period,
                                    Calendar,
                                    Schedule,
+                                   schedule_batch,
                                    TimeUnits,
-                                   BizDayConventions)
+                                   BizDayConventions,
+                                   DateGeneration,
+                                   register_holiday_center,
+                                   unregister_holiday_center)
 
 
 class TestSchedule(unittest.TestCase):
@@ -67,6 +72,67 @@ class TestSchedule(unittest.TestCase):
                     Date(2012, 1, 24)]
         self.check_dates(s, expected)
 
+    def test_zero_tenor_schedule(self):
+        s = Schedule(Date(2018, 2, 10), Date(2018, 3, 10), Period('0d'), Calendar('China.SSE'))
+        self.check_dates(s, [Date(2018, 2, 12), Date(2018, 3, 12)])
+        self.assertTrue(s.is_regular(1))
+
+    def test_schedule_batch(self):
+        cal = Calendar('China.SSE')
+        effective = np.array(['2012-01-01', '2013-03-31', '2015-06-30', '2017-12-29'], dtype='datetime64[D]')
+        termination = np.array(['2012-01-08', '2014-07-01', '2025-06-30', '2018-12-31'], dtype='datetime64[D]')
+        tenors = ['1d', '1m', '6m', '3m']
+
+        for rule in (DateGeneration.Forward, DateGeneration.Backward):
+            for end_of_month in (True, False):
+                expected = [Schedule(Date.from_datetime(e.item()), Date.from_datetime(t.item()), Period(tenor), cal,
+                                     BizDayConventions.ModifiedFollowing, BizDayConventions.Following, rule,
+                                     end_of_month)
+                            for e, t, tenor in zip(effective, termination, tenors)]
+
+                serials, offsets = schedule_batch(effective, termination, tenors, cal,
+                                                  BizDayConventions.ModifiedFollowing, BizDayConventions.Following,
+                                                  rule, end_of_month)
+                self.assertEqual(serials.dtype, np.dtype('datetime64[D]'))
+                self.assertEqual(len(offsets), len(effective) + 1)
+                for i, sch in enumerate(expected):
+                    calculated = serials[offsets[i]:offsets[i + 1]].astype(object).tolist()
+                    self.assertEqual(calculated, [d.to_datetime().date() for d in sch._dates])
+
+                schedules = schedule_batch(effective, termination, tenors, cal, BizDayConventions.ModifiedFollowing,
+                                           BizDayConventions.Following, rule, end_of_month, as_schedules=True)
+                for calculated, sch in zip(schedules, expected):
+                    self.assertEqual(calculated._dates, sch._dates)
+                    self.assertEqual(calculated._is_regular, sch._is_regular)
+                    self.assertEqual(calculated.tenor(), sch.tenor())
+                    self.assertEqual(calculated.end_of_month(), sch.end_of_month())
+
+        serials, offsets = schedule_batch(effective.view(np.int64) + 25569, termination.view(np.int64) + 25569,
+                                          Period('1y'), cal)
+        self.assertEqual(serials.dtype, np.dtype(np.intc))
+        self.assertEqual(serials[offsets[2]:offsets[3]].tolist()[:2],
+                         [Date(2015, 6, 30).serial_number, Date(2016, 6, 30).serial_number])
+
+        with self.assertRaises(ValueError):
+            _ = schedule_batch(effective, termination[:2], '1m', cal)
+        with self.assertRaises(ValueError):
+            _ = schedule_batch(termination, effective, '1m', cal)
+
+    def test_end_of_month_out_of_range(self):
+        # without a business day in January 1901 its business month end falls before the supported range
+        register_holiday_center('Test.Jan1901', ['Null'], holidays=[Date(1901, 1, d) for d in range(1, 32)])
+        try:
+            cal = Calendar('Test.Jan1901')
+            with self.assertRaisesRegex(ValueError, 'schedule date is out of bound'):
+                _ = Schedule(Date(1901, 1, 31), Date(1901, 6, 30), Period('1m'), cal, BizDayConventions.Following,
+                             BizDayConventions.Following, DateGeneration.Forward, True)
+            with self.assertRaisesRegex(ValueError, 'schedule date is out of bound'):
+                _ = schedule_batch([Date(1901, 1, 31).serial_number], [Date(1901, 6, 30).serial_number], '1m', cal,
+                                   BizDayConventions.Following, BizDayConventions.Following, DateGeneration.Forward,
+                                   True)
+        finally:
+            unregister_holiday_center('Test.Jan1901')
+
     def test_schedule_deep_copy(self):
         start_date = Date(2013, 3, 31)
         end_date = Date(2013, 7, 1)
@@ -93,3 +159,32 @@ class TestSchedule(unittest.TestCase):
             self.assertEqual(sch, pickled_sch)
 
         os.unlink(f.name)
+
+    def test_schedule_pickle_keeps_generated_dates(self):
+        cal = Calendar('China.SSE')
+        schedules = [Schedule(Date(2013, 3, 31), Date(2015, 7, 1), Period('3m'), cal, BizDayConventions.Preceding,
+                              BizDayConventions.Following, DateGeneration.Backward, True, None, Date(2015, 5, 15)),
+                     Schedule(Date(2013, 3, 31), Date(2015, 7, 1), Period('0d'), cal),
+                     Schedule(Date(2013, 3, 31), Date(2013, 7, 1), Period('1w'), cal, first_date=Date(2013, 4, 3)),
+                     Schedule(None, Date(2015, 7, 1), Period('3m'), cal, date_generation_rule=DateGeneration.Backward,
+                              evaluation_date=Date(2014, 1, 10))]
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            for sch in schedules:
+                pickled_sch = pickle.loads(pickle.dumps(sch, protocol))
+                self.assertEqual(pickled_sch, sch)
+                self.assertEqual(list(pickled_sch), list(sch))
+                self.assertEqual(pickled_sch._is_regular, sch._is_regular)
+                self.assertEqual(pickled_sch.tenor(), sch.tenor())
+                self.assertIs(pickled_sch.calendar().is_biz_day(Date(2018, 2, 16)), False)
+        self.assertIsNone(pickle.loads(pickle.dumps(schedules[3]))._effective_date)
+
+        if pickle.HIGHEST_PROTOCOL >= 5:
+            buffers = []
+            data = pickle.dumps(schedules[0], 5, buffer_callback=buffers.append)
+            self.assertEqual(len(buffers), 1)
+            self.assertEqual(list(pickle.loads(data, buffers=buffers)), list(schedules[0]))
+
+        # the pickle holds the generated dates, so unpickling does not depend on generation
+        sch = schedules[0]
+        sch._dates = sch._dates[:2]
+        self.assertEqual(list(pickle.loads(pickle.dumps(sch))), sch._dates)
@@ -102,11 +102,14 @@ ext_modules = ['market_calendars/core/enums/time_units.pyx',
                'market_calendars/core/enums/months.pyx',
                'market_calendars/core/enums/bizday_conventions.pyx',
                'market_calendars/core/enums/date_generation.pyx',
+               'market_calendars/core/enums/day_counters.pyx',
                'market_calendars/core/assert_utils.pyx',
                'market_calendars/core/period.pyx',
                'market_calendars/core/date.pyx',
+               'market_calendars/core/date_array.pyx',
                'market_calendars/core/calendar.pyx',
                'market_calendars/core/schedule.pyx',
+               'market_calendars/core/day_counter.pyx',
                ]
 
 
@@ -146,6 +149,8 @@ setup(
     url=URL,
     packages=find_packages(),
     include_package_data=False,
+    # declarations of the C API, for extensions that cimport market_calendars.core
+    package_data={'market_calendars.core': ['*.pxd'], 'market_calendars.core.enums': ['*.pxd']},
     install_requires=io.open(requirements, encoding='utf8').read(),
     classifiers=[],
     cmdclass={"test": test,